@@ -0,0 +1,61 @@
+"""Compare ``validate_batch`` with a per-item ``parse_webhook`` loop.
+
+Every batch mixes all event types and has 1% of invalid payloads.
+Run from the repository root::
+
+    python -m benchmarks.bench_batch
+"""
+
+import itertools
+import json
+import timeit
+from typing import Any, List, Sequence
+
+from pydantic import ValidationError
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.batch import validate_batch
+from huntflow_webhook_models.webhook import parse_webhook
+
+BATCH_SIZES = (1, 100, 10_000)
+INVALID_EVERY = 100
+
+
+def make_batch(size: int) -> List[bytes]:
+    factories = itertools.cycle(PAYLOAD_FACTORIES.values())
+    batch = []
+    for index in range(size):
+        payload = next(factories)()
+        if index % INVALID_EVERY == INVALID_EVERY - 1:
+            payload["meta"]["account"]["id"] = "invalid"
+        batch.append(json.dumps(payload).encode())
+    return batch
+
+
+def per_item_loop(payloads: Sequence[bytes]) -> List[Any]:
+    results: List[Any] = []
+    for raw in payloads:
+        try:
+            results.append(parse_webhook(raw))
+        except ValidationError as exc:
+            results.append(exc)
+    return results
+
+
+def events_per_second(func: Any, batch: List[bytes]) -> float:
+    number = max(1, 2_000 // len(batch))
+    seconds = min(timeit.repeat(lambda: func(batch), number=number, repeat=5))
+    return number * len(batch) / seconds
+
+
+def main() -> None:
+    print(f"{'batch size':>10}{'per-item loop, ev/s':>22}{'validate_batch, ev/s':>23}{'gain':>8}")
+    for size in BATCH_SIZES:
+        batch = make_batch(size)
+        loop = events_per_second(per_item_loop, batch)
+        batched = events_per_second(validate_batch, batch)
+        print(f"{size:>10}{loop:>22,.0f}{batched:>23,.0f}{batched / loop:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
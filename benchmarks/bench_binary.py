@@ -0,0 +1,67 @@
+"""Measure size and load time of binary webhook archives against NDJSON and gzip-NDJSON.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_binary [--events 5000] [--seed 1]
+"""
+
+import argparse
+import gzip
+import io
+import time
+from typing import Callable, Dict, List
+
+from huntflow_webhook_models.binary import BinaryArchiveWriter, iter_binary_archive
+from huntflow_webhook_models.generator import PayloadGenerator
+from huntflow_webhook_models.ndjson import iter_webhooks
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+
+def requests(events: int, seed: int) -> List[HookRequest]:
+    generator = PayloadGenerator(seed=seed)
+    return [parse_webhook(raw) for raw in generator.iter_json(events)]
+
+
+def archives(parsed: List[HookRequest]) -> Dict[str, bytes]:
+    ndjson = b"".join(request.model_dump_json(by_alias=True).encode() + b"\n" for request in parsed)
+    binary = io.BytesIO()
+    BinaryArchiveWriter(binary).write_all(parsed)
+    return {
+        "ndjson": ndjson,
+        "ndjson.gz": gzip.compress(ndjson),
+        "binary": binary.getvalue(),
+        "binary.gz": gzip.compress(binary.getvalue()),
+    }
+
+
+def load(name: str) -> Callable[[bytes], int]:
+    def read(data: bytes) -> int:
+        if name.startswith("binary"):
+            fileobj = io.BytesIO(gzip.decompress(data) if name.endswith(".gz") else data)
+            return sum(1 for _ in iter_binary_archive(fileobj))
+        return sum(1 for _ in iter_webhooks(io.BytesIO(data)))
+
+    return read
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    parsed = requests(args.events, args.seed)
+    print(f"{args.events} generated events of all types\n")
+    print(f"{'archive':<12}{'size, B':>14}{'ratio':>8}{'load, ev/s':>14}")
+    data = archives(parsed)
+    for name, archive in data.items():
+        read = load(name)
+        started = time.perf_counter()
+        assert read(archive) == args.events
+        rate = args.events / (time.perf_counter() - started)
+        ratio = len(data["ndjson"]) / len(archive)
+        print(f"{name:<12}{len(archive):>14,}{ratio:>7.1f}x{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare columnar export of applicant events with iterating over parsed models.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_columns
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.columns import ColumnarBuilder
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import parse_webhook
+
+COLUMNS = {
+    WebhookEventType.APPLICANT: [
+        "event.applicant.id",
+        "event.applicant_log.type",
+        "event.applicant_log.status.id",
+        "event.applicant_log.created",
+        "meta.account.id",
+    ],
+}
+
+
+def make_bodies(count: int) -> List[bytes]:
+    bodies = []
+    for index in range(count):
+        payload = applicant_hook()
+        payload["event"]["applicant"]["id"] = index
+        bodies.append(json.dumps(payload).encode())
+    return bodies
+
+
+def models_to_lists(bodies: List[bytes]) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {path: [] for path in COLUMNS[WebhookEventType.APPLICANT]}
+    for body in bodies:
+        request: Any = parse_webhook(body)
+        event = request.event
+        columns["event.applicant.id"].append(event.applicant.id)
+        columns["event.applicant_log.type"].append(event.applicant_log.type)
+        columns["event.applicant_log.status.id"].append(event.applicant_log.status.id)
+        columns["event.applicant_log.created"].append(event.applicant_log.created)
+        columns["meta.account.id"].append(request.meta.account.id)
+    return columns
+
+
+def models_to_columns(bodies: List[bytes]) -> ColumnarBuilder:
+    return ColumnarBuilder(COLUMNS).extend(parse_webhook(body) for body in bodies)
+
+
+def json_to_columns(bodies: List[bytes]) -> ColumnarBuilder:
+    return ColumnarBuilder(COLUMNS).extend_json(bodies)
+
+
+def measure(build: Callable[[List[bytes]], Any], bodies: List[bytes]) -> None:
+    started = time.perf_counter()
+    build(bodies)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    result = build(bodies)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(
+        f"{build.__name__:<20}{len(bodies) / elapsed:>12,.0f}{size / len(bodies):>14.1f}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+    bodies = make_bodies(args.events)
+    print(f"{'':<20}{'events/s':>12}{'bytes/event':>14}")
+    for build in (models_to_lists, models_to_columns, json_to_columns):
+        measure(build, bodies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure compression of single webhook bodies with trained dictionaries against zlib.
+
+Dictionaries are trained on the first ``--train`` generated bodies, the rest are
+compressed one by one. Run from the repository root::
+
+    python -m benchmarks.bench_compression [--events 4000] [--train 1500] [--level 6]
+"""
+
+import argparse
+import time
+import zlib
+from typing import Callable, Dict, List
+
+from huntflow_webhook_models.compression import PayloadCompressor
+from huntflow_webhook_models.generator import PayloadGenerator
+
+
+def throughput(func: Callable[[bytes], bytes], items: List[bytes], raw_size: int) -> float:
+    started = time.perf_counter()
+    for item in items:
+        func(item)
+    return raw_size / (time.perf_counter() - started) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=4000)
+    parser.add_argument("--train", type=int, default=1500)
+    parser.add_argument("--level", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    bodies = list(PayloadGenerator(seed=args.seed).iter_json(args.events))
+    train = args.train
+    samples, bodies = bodies[:train], bodies[train:]
+    compressor = PayloadCompressor(level=args.level)
+    started = time.perf_counter()
+    compressor.train(samples)
+    print(f"trained on {len(samples)} bodies in {time.perf_counter() - started:,.1f} s")
+    raw_size = sum(map(len, bodies))
+    print(f"{len(bodies)} bodies of {raw_size / len(bodies):,.0f} B on average\n")
+
+    def zlib_compress(raw: bytes) -> bytes:
+        return zlib.compress(raw, args.level)
+
+    methods: Dict[str, List[Callable[[bytes], bytes]]] = {
+        "zlib": [zlib_compress, zlib.decompress],
+        "zlib + dictionary": [compressor.compress, compressor.decompress],
+    }
+    print(f"{'method':<20}{'ratio':>8}{'compress, MB/s':>16}{'decompress, MB/s':>18}")
+    for name, (compress, decompress) in methods.items():
+        compressed = [compress(raw) for raw in bodies]
+        assert [decompress(data) for data in compressed] == bodies
+        ratio = sum(map(len, compressed)) / raw_size
+        compress_speed = throughput(compress, bodies, raw_size)
+        decompress_speed = throughput(decompress, compressed, raw_size)
+        print(f"{name:<20}{ratio:>8.3f}{compress_speed:>16,.1f}{decompress_speed:>18,.1f}")
+
+    print(f"\n{'event type':<24}{'zlib':>8}{'dictionary':>12}")
+    by_event_type: Dict[str, List[bytes]] = {}
+    for raw in bodies:
+        by_event_type.setdefault(compressor.event_type(raw), []).append(raw)
+    for event_type, raws in sorted(by_event_type.items()):
+        size = sum(map(len, raws))
+        plain = sum(len(zlib_compress(raw)) for raw in raws) / size
+        trained = sum(len(compressor.compress(raw, event_type)) for raw in raws) / size
+        print(f"{event_type:<24}{plain:>8.3f}{trained:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measure the cost of dropping redelivered webhooks before body validation.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_dedup
+"""
+
+import json
+import time
+import timeit
+from functools import partial
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.dedup import BloomFilter, EventDeduplicator
+from huntflow_webhook_models.lazy import parse_webhook_lazy
+from huntflow_webhook_models.webhook import parse_webhook
+
+NUMBER = 2000
+
+
+def main() -> None:
+    deduplicator = EventDeduplicator(maxsize=1000, bloom=BloomFilter(100_000))
+
+    def check_lazy(raw: bytes) -> bool:
+        return deduplicator.is_duplicate_meta(parse_webhook_lazy(raw).meta)
+
+    def check_full(raw: bytes) -> bool:
+        return deduplicator.is_duplicate_meta(parse_webhook(raw).meta)
+
+    print(f"{'event type':<24}{'full, us':>12}{'lazy, us':>12}{'raw, us':>12}")
+    for event_type, factory in PAYLOAD_FACTORIES.items():
+        raw = json.dumps(factory()).encode()
+        timings = [
+            min(timeit.repeat(partial(check, raw), number=NUMBER, repeat=5)) / NUMBER * 1e6
+            for check in (check_full, check_lazy, deduplicator.is_duplicate_raw)
+        ]
+        print(f"{event_type.value:<24}" + "".join(f"{timing:>12.1f}" for timing in timings))
+
+    event_ids = [str(event_id) for event_id in range(100_000)]
+    started = time.perf_counter()
+    for event_id in event_ids:
+        deduplicator.is_duplicate(1, event_id)
+    elapsed = time.perf_counter() - started
+    print(f"\nis_duplicate: {len(event_ids) / elapsed:,.0f} keys/s, {deduplicator.stats}")
+
+
+if __name__ == "__main__":
+    main()
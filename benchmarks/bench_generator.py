@@ -0,0 +1,47 @@
+"""Measure generated payloads per minute, written as NDJSON to a temporary file.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_generator --payloads 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from huntflow_webhook_models.generator import PayloadGenerator, PayloadSizes
+
+SIZES = {
+    "default": PayloadSizes(),
+    "large": PayloadSizes(
+        social=5,
+        attendees=50,
+        fill_quotas=10,
+        full_path_depth=5,
+        values_width=100,
+        parent_depth=5,
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payloads", type=int, default=50_000)
+    args = parser.parse_args()
+    print(f"{'sizes':<10}{'payloads/min':>16}{'MB/min':>10}")
+    for name, sizes in SIZES.items():
+        generator = PayloadGenerator(seed=1, sizes=sizes)
+        with tempfile.TemporaryFile() as fileobj:
+            started = time.perf_counter()
+            generator.write_ndjson(fileobj, args.payloads)
+            elapsed = time.perf_counter() - started
+            size = fileobj.seek(0, os.SEEK_END)
+        print(
+            f"{name:<10}{args.payloads / elapsed * 60:>16,.0f}"
+            f"{size / elapsed * 60 / 1e6:>10,.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure cold package import time and first-parse latency per event type.
+
+Every measurement runs in a fresh interpreter, with eager and deferred model building.
+Run from the repository root::
+
+    python -m benchmarks.bench_import [--repeat 5] [--max-import-ms 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.loader import HOOK_REQUEST_IMPORT_PATHS
+
+SCRIPT = """
+import sys, time
+raw = sys.stdin.buffer.read()
+started = time.perf_counter()
+import huntflow_webhook_models
+imported = time.perf_counter()
+if {name!r}:
+    getattr(huntflow_webhook_models, {name!r}).model_validate_json(raw)
+parsed = time.perf_counter()
+print(imported - started, parsed - imported)
+"""
+
+
+def measure(
+    event_type: Optional[WebhookEventType],
+    defer_build: bool,
+    repeat: int,
+) -> Tuple[float, float]:
+    name = HOOK_REQUEST_IMPORT_PATHS[event_type][1] if event_type else ""
+    raw = json.dumps(PAYLOAD_FACTORIES[event_type]()).encode() if event_type else b""
+    env = dict(os.environ, HUNTFLOW_WEBHOOK_MODELS_DEFER_BUILD="1" if defer_build else "")
+    import_times: List[float] = []
+    parse_times: List[float] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(name=name)],
+            input=raw,
+            env=env,
+            check=True,
+            capture_output=True,
+        ).stdout
+        import_time, parse_time = map(float, output.split())
+        import_times.append(import_time * 1000)
+        parse_times.append(parse_time * 1000)
+    return statistics.median(import_times), statistics.median(parse_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=None,
+        help="Exit with an error if cold package import is slower",
+    )
+    args = parser.parse_args()
+
+    import_ms, _ = measure(None, defer_build=False, repeat=args.repeat)
+    print(f"cold `import huntflow_webhook_models`: {import_ms:.1f} ms\n")
+
+    print(f"{'event type':<24}{'import + first parse, ms':>26}{'deferred build, ms':>20}")
+    for event_type in WebhookEventType:
+        eager = sum(measure(event_type, defer_build=False, repeat=args.repeat))
+        deferred = sum(measure(event_type, defer_build=True, repeat=args.repeat))
+        print(f"{event_type.value:<24}{eager:>26.1f}{deferred:>20.1f}")
+
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        sys.exit(f"Import time {import_ms:.1f} ms exceeds {args.max_import_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measure event index lookups against linear scans of the same events.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_index [--events 50000] [--queries 200]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from huntflow_webhook_models._paths import get_attribute
+from huntflow_webhook_models.generator import PayloadGenerator
+from huntflow_webhook_models.index import (
+    APPLICANT_ID_PATHS,
+    CREATED_PATHS,
+    EventIndex,
+)
+from huntflow_webhook_models.webhook import HookRequest, validate_webhook
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+APPLICANTS = 5_000
+VACANCIES = 200
+ACCOUNTS = 20
+
+
+def events(count: int) -> List[HookRequest]:
+    generator = PayloadGenerator(seed=1)
+    rng = random.Random(1)
+    requests = []
+    for index, payload in enumerate(generator.iter_payloads(count)):
+        payload["meta"]["account"]["id"] = rng.randrange(ACCOUNTS)
+        event = payload["event"]
+        if "applicant" in event and event["applicant"]:
+            event["applicant"]["id"] = rng.randrange(APPLICANTS)
+        for key in ("vacancy_log", "applicant_log", "applicant_offer"):
+            if key in event:
+                event[key]["created"] = (START + timedelta(minutes=index)).isoformat()
+        if event.get("applicant_log", {}).get("vacancy"):
+            event["applicant_log"]["vacancy"]["id"] = rng.randrange(VACANCIES)
+        requests.append(validate_webhook(payload))
+    return requests
+
+
+def scan(requests: List[HookRequest], applicant_id: int, since: datetime, until: datetime) -> int:
+    """Linear scan for the events of an applicant in a time range."""
+    found = 0
+    for request in requests:
+        paths = APPLICANT_ID_PATHS.get(request.meta.event_type, ())
+        if all(get_attribute(request, path) != applicant_id for path in paths):
+            continue
+        path = CREATED_PATHS.get(request.meta.event_type)
+        created = path and get_attribute(request, path)
+        if created and since <= created < until:
+            found += 1
+    return found
+
+
+def timed(call: Callable[[], Any], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    requests = events(args.events)
+    started = time.perf_counter()
+    index = EventIndex().extend(requests)
+    build_time = time.perf_counter() - started
+    print(f"indexed {len(index):,} events at {len(index) / build_time:,.0f} ev/s\n")
+
+    rng = random.Random(2)
+    since = START + timedelta(minutes=args.events // 2)
+    until = since + timedelta(days=7)
+    applicant_id = rng.randrange(APPLICANTS)
+    found = len(index.positions(applicant_id=applicant_id, since=since, until=until))
+    assert found == scan(requests, applicant_id, since, until)
+
+    queries: Dict[str, Callable[[], Any]] = {
+        "applicant + week": lambda: index.positions(
+            applicant_id=rng.randrange(APPLICANTS),
+            since=since,
+            until=until,
+        ),
+        "applicant + vacancy": lambda: index.positions(
+            applicant_id=rng.randrange(APPLICANTS),
+            vacancy_id=rng.randrange(VACANCIES),
+        ),
+        "account + log type": lambda: index.positions(
+            account_id=rng.randrange(ACCOUNTS),
+            log_type="STATUS",
+        ),
+        "one hour": lambda: index.positions(since=since, until=since + timedelta(hours=1)),
+        "linear scan": lambda: scan(requests, rng.randrange(APPLICANTS), since, until),
+    }
+    print(f"{'query':<22}{'us/query':>12}")
+    for name, query in queries.items():
+        repeat = 3 if name == "linear scan" else args.queries
+        print(f"{name:<22}{timed(query, repeat):>12,.1f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.index")
+        positions_index = EventIndex()
+        for position, request in enumerate(requests):
+            positions_index.add(request, ref=position)
+        started = time.perf_counter()
+        positions_index.save(path)
+        save_time = time.perf_counter() - started
+        started = time.perf_counter()
+        EventIndex.load(path)
+        load_time = time.perf_counter() - started
+        print(
+            f"\npersisted with positions as references: {os.path.getsize(path):,} B, "
+            f"save {save_time * 1000:.0f} ms, load {load_time * 1000:.0f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
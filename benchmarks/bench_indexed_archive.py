@@ -0,0 +1,114 @@
+"""Measure lookups in an indexed archive against scanning a binary archive.
+
+Looks events up by ``meta.event_id``, by position and by a narrow ``created`` time
+range. Run from the repository root::
+
+    python -m benchmarks.bench_indexed_archive [--events 20000] [--lookups 200] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+
+from huntflow_webhook_models.binary import iter_binary_archive
+from huntflow_webhook_models.generator import PayloadGenerator
+from huntflow_webhook_models.indexed_archive import (
+    IndexedArchiveReader,
+    IndexedArchiveWriter,
+    _created,
+)
+from huntflow_webhook_models.timestamps import from_epoch_microseconds
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+
+def scan_event(path: str, event_id: str) -> Optional[HookRequest]:
+    found = None
+    for request in iter_binary_archive(path):
+        if request.meta.event_id == event_id:
+            found = request
+    return found
+
+
+def scan_time(path: str, low: int, high: int) -> List[HookRequest]:
+    found = []
+    for request in iter_binary_archive(path):
+        created = _created(request)
+        if created is not None and low <= created < high:
+            found.append(request)
+    return found
+
+
+def scan_position(path: str, position: int) -> HookRequest:
+    for index, request in enumerate(iter_binary_archive(path)):
+        if index == position:
+            return request
+    raise IndexError(position)
+
+
+def timed(calls: List[Callable[[], Any]]) -> float:
+    started = time.perf_counter()
+    for call in calls:
+        call()
+    return (time.perf_counter() - started) / len(calls) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    generator = PayloadGenerator(seed=args.seed)
+    # Archives are appended in the arrival order, which follows the created times
+    parsed = sorted(
+        (parse_webhook(raw) for raw in generator.iter_json(args.events)),
+        key=lambda request: _created(request) or 0,
+    )
+    path = os.path.join(tempfile.mkdtemp(), "webhooks.bin")
+    with IndexedArchiveWriter(path) as writer:
+        for request in parsed:
+            writer.write(request)
+    print(f"{args.events} generated events, archive of {os.path.getsize(path):,} B\n")
+
+    rng = random.Random(args.seed)
+    positions = [rng.randrange(args.events) for _ in range(args.lookups)]
+    event_ids = [parsed[position].meta.event_id for position in positions]
+    times = sorted(created for created in map(_created, parsed) if created is not None)
+    start = rng.randrange(len(times) - 100)
+    since = from_epoch_microseconds(times[start])
+    until = from_epoch_microseconds(times[start + 100])
+
+    started = time.perf_counter()
+    reader = IndexedArchiveReader(path)
+    print(f"open reader: {(time.perf_counter() - started) * 1e3:,.1f} ms")
+    print(f"{'lookup':<22}{'indexed, us':>14}{'scan, us':>14}")
+    scan_calls = max(args.lookups // 50, 1)
+    rows: List[Tuple[str, List[Callable[[], Any]], List[Callable[[], Any]]]] = [
+        (
+            "by event_id",
+            [partial(reader.get, event_id) for event_id in event_ids],
+            [partial(scan_event, path, event_id) for event_id in event_ids],
+        ),
+        (
+            "by position",
+            [partial(reader.__getitem__, position) for position in positions],
+            [partial(scan_position, path, position) for position in positions],
+        ),
+        (
+            "100 events by time",
+            [lambda: list(reader.find_time(since, until))],
+            [lambda: scan_time(path, times[start], times[start + 100])],
+        ),
+    ]
+    for name, indexed, scanned in rows:
+        print(f"{name:<22}{timed(indexed):>14,.1f}{timed(scanned[:scan_calls]):>14,.1f}")
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
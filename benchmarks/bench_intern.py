@@ -0,0 +1,75 @@
+"""Measure resident memory of parsed ``ApplicantHookRequest`` models with and without interning.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_intern
+"""
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+from typing import List, Optional
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.intern import Interner
+from huntflow_webhook_models.webhook import parse_webhook
+
+
+def make_bodies(count: int) -> List[bytes]:
+    bodies = []
+    for index in range(count):
+        payload = applicant_hook()
+        payload["event"]["applicant"]["id"] = index
+        payload["meta"]["event_id"] = str(index)
+        bodies.append(json.dumps(payload).encode())
+    return bodies
+
+
+def parse_all(bodies: List[bytes], interner: Optional[Interner]) -> List[ApplicantHookRequest]:
+    requests = []
+    for body in bodies:
+        request = parse_webhook(body)
+        assert isinstance(request, ApplicantHookRequest)
+        requests.append(request if interner is None else interner.intern(request))
+    return requests
+
+
+def measure(bodies: List[bytes], interner: Optional[Interner]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    requests = parse_all(bodies, interner)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del requests
+    return size / len(bodies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=10_000)
+    args = parser.parse_args()
+    bodies = make_bodies(args.events)
+    parse_all(bodies[:10], Interner())  # build validators and frozen classes
+
+    plain = measure(bodies, None)
+    interned = measure(bodies, Interner())
+    print(f"bytes per ApplicantHookRequest: {plain:,.0f} plain, {interned:,.0f} interned")
+
+    number = 1000
+    parse = min(timeit.repeat(lambda: parse_all(bodies[:number], None), number=1, repeat=5))
+    interner = Interner()
+    parse_intern = min(
+        timeit.repeat(lambda: parse_all(bodies[:number], interner), number=1, repeat=5),
+    )
+    print(
+        f"us per event: {parse / number * 1e6:.1f} plain, "
+        f"{parse_intern / number * 1e6:.1f} interned",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure ``dump_json_fast()`` of every JSON backend against ``model_dump_json()``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_json [--number 200]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, PAYLOAD_SIZES
+from huntflow_webhook_models.json_backend import BACKENDS, get_json_backend, set_json_backend
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS
+
+
+def best_time_us(call: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    default_backend = get_json_backend()
+    backends = []
+    for name, backend_cls in BACKENDS.items():
+        try:
+            backends.append(backend_cls())
+        except ImportError:
+            print(f"{name} backend isn't installed")
+    header = "".join(f"{backend.name + ', us':>14}" for backend in backends)
+    print(f"{'event type':<24}{'size':<14}{'model_dump_json, us':>21}{header}")
+    for event_type, factory in PAYLOAD_FACTORIES.items():
+        for size in ("typical", "pathological"):
+            data = PAYLOAD_SIZES[size](factory())
+            model = HOOK_REQUEST_MODELS[event_type].model_validate(data)
+            times: Dict[str, float] = {}
+            for backend in backends:
+                set_json_backend(backend)
+                assert json.loads(model.dump_json_fast()) == json.loads(
+                    model.model_dump_json(by_alias=True),
+                )
+                times[backend.name] = best_time_us(model.dump_json_fast, args.number)
+            baseline = best_time_us(model.model_dump_json, args.number)
+            columns = "".join(f"{times[backend.name]:>14,.1f}" for backend in backends)
+            print(f"{event_type.value:<24}{size:<14}{baseline:>21,.1f}{columns}")
+    set_json_backend(default_backend)
+
+
+if __name__ == "__main__":
+    main()
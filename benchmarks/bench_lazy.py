@@ -0,0 +1,32 @@
+"""Compare meta-only lazy parsing with full validation of webhook bodies.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_lazy
+"""
+
+import json
+import timeit
+from functools import partial
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.lazy import parse_webhook_lazy
+from huntflow_webhook_models.webhook import parse_webhook
+
+NUMBER = 2000
+
+
+def main() -> None:
+    print(f"{'event type':<24}{'full, us':>12}{'meta only, us':>16}{'speedup':>10}")
+    for event_type, factory in PAYLOAD_FACTORIES.items():
+        raw = json.dumps(factory()).encode()
+        full = min(timeit.repeat(partial(parse_webhook, raw), number=NUMBER, repeat=5))
+        lazy = min(timeit.repeat(partial(parse_webhook_lazy, raw), number=NUMBER, repeat=5))
+        print(
+            f"{event_type.value:<24}{full / NUMBER * 1e6:>12.1f}{lazy / NUMBER * 1e6:>16.1f}"
+            f"{full / lazy:>9.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure the lenient enum mode against strict parsing, with and without schema drift.
+
+A stream where some events carry enum values unknown to the library is parsed
+by both modes, events rejected by the strict mode would be redelivered by
+Huntflow. Run from the repository root::
+
+    python -m benchmarks.bench_lenient [--events 2000] [--drift 0.1]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, List
+
+from pydantic import ValidationError
+
+from benchmarks.payloads import applicant_hook, vacancy_hook
+from huntflow_webhook_models.lenient import parse_webhook_lenient, unknown_enum_values
+from huntflow_webhook_models.webhook import parse_webhook
+
+
+def bodies(events: int, drift: float) -> List[bytes]:
+    result = []
+    drifted = int(events * drift)
+    for index in range(events):
+        if index % 2:
+            payload = vacancy_hook()
+            if index < drifted:
+                payload["event"]["vacancy_log"]["state"] = "ARCHIVED"
+        else:
+            payload = applicant_hook()
+            if index < drifted:
+                payload["event"]["applicant_log"]["type"] = "VIDEO-INTERVIEW"
+        result.append(json.dumps(payload).encode())
+    return result
+
+
+def measure(parse: Callable[[bytes], Any], raw_bodies: List[bytes]) -> List[float]:
+    parse(raw_bodies[-1])
+    rejected = 0
+    started = time.perf_counter()
+    for raw in raw_bodies:
+        try:
+            parse(raw)
+        except ValidationError:
+            rejected += 1
+    elapsed = time.perf_counter() - started
+    return [elapsed / len(raw_bodies) * 1e6, rejected]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--drift", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'stream':<16}{'parser':<10}{'us/event':>10}{'rejected':>10}")
+    for drift in (0.0, args.drift):
+        raw_bodies = bodies(args.events, drift)
+        stream = f"{drift:.0%} drifted"
+        for name, parse in (("strict", parse_webhook), ("lenient", parse_webhook_lenient)):
+            parse_time, rejected = measure(parse, raw_bodies)
+            print(f"{stream:<16}{name:<10}{parse_time:>10,.1f}{rejected:>10,.0f}")
+    print(f"\nunknown enum values: {unknown_enum_values()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure parallel archive replay throughput at 1, 2, 4 and 8 worker processes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parallel [--events 50000]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.ndjson import iter_webhooks
+from huntflow_webhook_models.parallel import iter_webhooks_parallel, meta_summary
+
+WORKERS = (1, 2, 4, 8)
+CHUNK_SIZE = 1024 * 1024
+
+
+def write_archive(path: str, events: int) -> None:
+    factories = itertools.cycle(PAYLOAD_FACTORIES.values())
+    with open(path, "wb") as fileobj:
+        for _ in range(events):
+            fileobj.write(json.dumps(next(factories)()).encode() + b"\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "webhooks.ndjson")
+        write_archive(path, args.events)
+
+        started = time.perf_counter()
+        count = sum(1 for _ in iter_webhooks(path))
+        print(f"single process iter_webhooks: {count / (time.perf_counter() - started):,.0f} ev/s")
+        print(f"CPU count: {os.cpu_count()}\n")
+
+        print(f"{'workers':>8}{'models, ev/s':>16}{'summaries, ev/s':>19}")
+        for workers in WORKERS:
+            rates = []
+            for summarize in (None, meta_summary):
+                started = time.perf_counter()
+                count = sum(
+                    1
+                    for _ in iter_webhooks_parallel(
+                        path,
+                        workers=workers,
+                        summarize=summarize,
+                        chunk_size=CHUNK_SIZE,
+                    )
+                )
+                rates.append(count / (time.perf_counter() - started))
+            print(f"{workers:>8}{rates[0]:>16,.0f}{rates[1]:>19,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure parsing of vacancy webhooks sharing a deep parent chain with large bodies.
+
+Compares ``parse_webhook()`` with ``ParentChainParser`` options by parse time and
+memory retained by the parsed events. Run from the repository root::
+
+    python -m benchmarks.bench_parents [--events 200] [--depth 10]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+from benchmarks.payloads import Payload, vacancy, vacancy_hook
+from huntflow_webhook_models.parents import ParentChainParser
+from huntflow_webhook_models.webhook import parse_webhook
+
+BODY = "<p>" + "Responsibilities. " * 1000 + "</p>"
+
+
+def parent_chain(depth: int) -> Optional[Payload]:
+    parent = None
+    for level in range(depth):
+        parent = {**vacancy(vacancy_id=1000 + level), "body": BODY, "parent": parent}
+    return parent
+
+
+def bodies(events: int, depth: int) -> List[bytes]:
+    parent = parent_chain(depth)
+    result = []
+    for index in range(events):
+        payload = vacancy_hook()
+        payload["event"]["vacancy"].update(id=index, parent=parent)
+        result.append(json.dumps(payload).encode())
+    return result
+
+
+def measure(parse: Callable[[bytes], Any], raw_bodies: List[bytes]) -> List[float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    parsed = [parse(raw) for raw in raw_bodies]
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return [len(raw_bodies) / elapsed, retained / len(raw_bodies)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=10)
+    args = parser.parse_args()
+
+    raw_bodies = bodies(args.events, args.depth)
+    print(f"{args.events} events of {len(raw_bodies[0]):,} B, parent chain depth {args.depth}\n")
+    parsers = {
+        "parse_webhook": parse_webhook,
+        "max_depth=1": ParentChainParser(max_depth=1).parse,
+        "as_reference": ParentChainParser(as_reference=True).parse,
+        "cache_size=100": ParentChainParser(cache_size=100).parse,
+    }
+    print(f"{'parser':<18}{'ev/s':>10}{'retained, B/event':>20}")
+    for name, parse in parsers.items():
+        rate, retained = measure(parse, raw_bodies)
+        print(f"{name:<18}{rate:>10,.0f}{retained:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare single-pass ``parse_webhook`` with the two-step ``json.loads`` dispatch.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parse_webhook
+"""
+
+import json
+import timeit
+from typing import Any, Callable, List
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS, parse_webhook
+
+NUMBER = 2000
+
+
+def two_step_parse(raw: bytes) -> Any:
+    data = json.loads(raw)
+    model = HOOK_REQUEST_MODELS[WebhookEventType(data["meta"]["event_type"])]
+    return model.model_validate(data)
+
+
+def throughput(func: Callable[[bytes], Any], payloads: List[bytes]) -> float:
+    def run() -> None:
+        for raw in payloads:
+            func(raw)
+
+    seconds = min(timeit.repeat(run, number=NUMBER // len(payloads) or 1, repeat=5))
+    return (NUMBER // len(payloads) or 1) * len(payloads) / seconds
+
+
+def main() -> None:
+    print(f"{'event type':<24}{'two-step, ev/s':>18}{'parse_webhook, ev/s':>22}{'gain':>8}")
+    for event_type, factory in PAYLOAD_FACTORIES.items():
+        payloads = [json.dumps(factory()).encode()]
+        baseline = throughput(two_step_parse, payloads)
+        single_pass = throughput(parse_webhook, payloads)
+        print(
+            f"{event_type.value:<24}{baseline:>18,.0f}{single_pass:>22,.0f}"
+            f"{single_pass / baseline:>7.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure validation of projected models against the full hook request models.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_projection [--number 500]
+"""
+
+import argparse
+import json
+import timeit
+from typing import List, Tuple, Type
+
+from pydantic import BaseModel
+
+from benchmarks.payloads import PAYLOAD_SIZES, applicant_hook, vacancy_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.projection import project
+from huntflow_webhook_models.vacancy import VacancyHookRequest
+
+PROJECTIONS: List[Tuple[str, Type[BaseModel], List[str], bytes]] = [
+    (
+        "applicant status",
+        ApplicantHookRequest,
+        ["event.applicant.id", "event.applicant_log.type", "event.applicant_log.status.id"],
+        json.dumps(applicant_hook()).encode(),
+    ),
+    (
+        "applicant status, large",
+        ApplicantHookRequest,
+        ["event.applicant.id", "event.applicant_log.type", "event.applicant_log.status.id"],
+        json.dumps(PAYLOAD_SIZES["pathological"](applicant_hook())).encode(),
+    ),
+    (
+        "applicant + meta",
+        ApplicantHookRequest,
+        ["meta", "event.applicant", "event.applicant_log.type"],
+        json.dumps(applicant_hook()).encode(),
+    ),
+    (
+        "vacancy state",
+        VacancyHookRequest,
+        ["meta.event_id", "event.vacancy.id", "event.vacancy.state", "event.vacancy_log.state"],
+        json.dumps(vacancy_hook()).encode(),
+    ),
+]
+
+
+def best_time_us(model: Type[BaseModel], raw: bytes, number: int) -> float:
+    return min(timeit.repeat(lambda: model.model_validate_json(raw), number=number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'projection':<26}{'bytes':>9}{'full, us':>12}{'projected, us':>15}{'speedup':>9}")
+    for name, model, fields, raw in PROJECTIONS:
+        projected = project(model, fields)
+        full_time = best_time_us(model, raw, args.number)
+        projected_time = best_time_us(projected, raw, args.number)
+        print(
+            f"{name:<26}{len(raw):>9,}{full_time:>12,.1f}{projected_time:>15,.1f}"
+            f"{full_time / projected_time:>8.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare memory per cached entity and attribute access of models and slotted records.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_records
+"""
+
+import gc
+import timeit
+import tracemalloc
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Type
+
+from pydantic import BaseModel
+
+from benchmarks.payloads import applicant_hook, vacancy_hook
+from huntflow_webhook_models.common_models.applicant import Applicant, ApplicantLog
+from huntflow_webhook_models.common_models.vacancy import Vacancy, VacancyLog
+from huntflow_webhook_models.records import Record, to_record
+
+COUNT = 10_000
+
+ENTITIES = (
+    (Applicant, applicant_hook()["event"]["applicant"]),
+    (ApplicantLog, applicant_hook()["event"]["applicant_log"]),
+    (Vacancy, vacancy_hook()["event"]["vacancy"]),
+    (VacancyLog, vacancy_hook()["event"]["vacancy_log"]),
+)
+
+
+def build_model(model: Type[BaseModel], data: Dict[str, Any], index: int) -> BaseModel:
+    return model.model_validate({**data, "id": index})
+
+
+def build_record(model: Type[BaseModel], data: Dict[str, Any], index: int) -> Record:
+    # Only the values of the discarded model are kept by the record
+    return to_record(build_model(model, data, index))
+
+
+def bytes_per_item(build: Callable[[int], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    items: List[Any] = [build(index) for index in range(COUNT)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / COUNT
+
+
+def access_ns(item: Any) -> float:
+    number = 1_000_000
+    get_id = partial(attrgetter("id"), item)
+    return min(timeit.repeat(get_id, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    print(
+        f"{'entity':<14}{'model, B':>10}{'record, B':>11}{'ratio':>7}"
+        f"{'getattr model, ns':>19}{'getattr record, ns':>20}",
+    )
+    for model, data in ENTITIES:
+        model_size = bytes_per_item(partial(build_model, model, data))
+        record_size = bytes_per_item(partial(build_record, model, data))
+        instance = build_model(model, data, 1)
+        print(
+            f"{model.__name__:<14}{model_size:>10,.0f}{record_size:>11,.0f}"
+            f"{model_size / record_size:>6.1f}x"
+            f"{access_ns(instance):>19.1f}{access_ns(to_record(instance)):>20.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
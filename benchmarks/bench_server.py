@@ -0,0 +1,96 @@
+"""Measure acknowledgement latency and event loop stalls of the webhook ASGI app.
+
+Posts large applicant webhooks concurrently through the in-process client and
+compares ``WebhookApp`` with a receiver validating bodies inline on the event loop.
+Run from the repository root::
+
+    python -m benchmarks.bench_server [--requests 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.payloads import applicant_hook, pathological
+from huntflow_webhook_models.server import Receive, Scope, Send, WebhookApp, call_asgi
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+App = Callable[[Scope, Receive, Send], Any]
+
+
+async def inline_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Naive receiver validating the body before answering."""
+    message = await receive()
+    parse_webhook(message["body"])
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def watch_loop(lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late a 1 ms sleep wakes up, which is how long the loop was blocked."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started - 0.001)
+
+
+async def post(app: App, body: bytes, latencies: List[float]) -> None:
+    started = time.perf_counter()
+    await call_asgi(app, body=body)
+    latencies.append(time.perf_counter() - started)
+
+
+async def run(app: App, body: bytes, requests: int, concurrency: int) -> Tuple[float, ...]:
+    latencies: List[float] = []
+    lags: List[float] = []
+    stop = asyncio.Event()
+    watcher = asyncio.ensure_future(watch_loop(lags, stop))
+    started = time.perf_counter()
+    for offset in range(0, requests, concurrency):
+        batch = min(concurrency, requests - offset)
+        await asyncio.gather(*(post(app, body, latencies) for _ in range(batch)))
+    if isinstance(app, WebhookApp):
+        await app.stop()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await watcher
+    latencies.sort()
+    return (
+        requests / elapsed,
+        latencies[len(latencies) // 2] * 1000,
+        latencies[int((len(latencies) - 1) * 0.99)] * 1000,
+        max(lags) * 1000,
+    )
+
+
+async def handle(request: HookRequest) -> None:
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    body = json.dumps(pathological(applicant_hook())).encode()
+    webhook_app = WebhookApp(queue_size=args.requests)
+    webhook_app.on()(handle)
+    print(f"payload: {len(body):,} B\n")
+    print(
+        f"{'receiver':<12}{'ev/s':>10}{'ack p50, ms':>14}{'ack p99, ms':>14}{'max stall, ms':>16}",
+    )
+    for name, app in (("inline", inline_app), ("WebhookApp", webhook_app)):
+        rate, p50, p99, stall = asyncio.run(run(app, body, args.requests, args.concurrency))
+        print(f"{name:<12}{rate:>10,.0f}{p50:>14.2f}{p99:>14.2f}{stall:>16.2f}")
+    stats = webhook_app.stats
+    print(
+        f"\nWebhookApp end-to-end latency: p50 {stats.latency_p50_ms:.2f} ms, "
+        f"p99 {stats.latency_p99_ms:.2f} ms, handled {stats.handled}",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure incremental state materialization against recomputing it from the history.
+
+Applicant and vacancy events are generated for a fixed number of entities, with
+ADD and EDIT actions. The history is applied in batches, once incrementally and
+once recomputed from all the events seen so far after every batch. Run from the
+repository root::
+
+    python -m benchmarks.bench_state [--events 50000] [--entities 5000] [--batches 10]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.generator import PayloadGenerator
+from huntflow_webhook_models.state import StateMaterializer
+from huntflow_webhook_models.webhook import HookRequest, validate_webhook
+
+ENTITIES = {"APPLICANT": ("applicant", "applicant_log"), "VACANCY": ("vacancy", "vacancy_log")}
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def history(events: int, entities: int) -> List[HookRequest]:
+    generator = PayloadGenerator([WebhookEventType.APPLICANT, WebhookEventType.VACANCY], seed=1)
+    rng = random.Random(1)
+    requests = []
+    for index, payload in enumerate(generator.iter_payloads(events)):
+        entity_key, log_key = ENTITIES[payload["meta"]["event_type"]]
+        payload["event"][entity_key]["id"] = rng.randrange(entities)
+        payload["event"][log_key]["created"] = (START + timedelta(seconds=index)).isoformat()
+        if rng.random() < 0.8:
+            payload["meta"]["webhook_action"] = "EDIT"
+            payload["changes"] = {"position": "old position"}
+        else:
+            payload["meta"]["webhook_action"] = "ADD"
+            payload["changes"] = None
+        if entity_key == "vacancy":
+            payload["event"]["vacancy_log"]["state"] = rng.choice(["OPEN", "CLOSED", "EDIT"])
+        requests.append(validate_webhook(payload))
+    return requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--entities", type=int, default=5_000)
+    parser.add_argument("--batches", type=int, default=10)
+    args = parser.parse_args()
+
+    requests = history(args.events, args.entities)
+    batch_size = len(requests) // args.batches
+    materializer = StateMaterializer()
+    incremental = recomputed = 0.0
+    print(f"{'events':>8}{'incremental, ev/s':>20}{'recompute, ms':>16}{'incremental, ms':>18}")
+    for start in range(0, len(requests) - batch_size + 1, batch_size):
+        end = start + batch_size
+        started = time.perf_counter()
+        materializer.apply_all(requests[start:end])
+        batch_time = time.perf_counter() - started
+        incremental += batch_time
+
+        started = time.perf_counter()
+        StateMaterializer().apply_all(requests[:end])
+        recompute_time = time.perf_counter() - started
+        recomputed += recompute_time
+        print(
+            f"{end:>8}{batch_size / batch_time:>20,.0f}"
+            f"{recompute_time * 1000:>16.1f}{batch_time * 1000:>18.1f}",
+        )
+    print(
+        f"\ntotal: incremental {incremental:.2f} s, recompute after every batch "
+        f"{recomputed:.2f} s, {len(materializer.applicants)} applicants, "
+        f"{len(materializer.vacancies)} vacancies",
+    )
+
+
+if __name__ == "__main__":
+    main()
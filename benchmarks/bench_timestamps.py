@@ -0,0 +1,68 @@
+"""Measure the fast timestamp modes against the default timezone-aware datetimes.
+
+Compares parse time, memory retained by the parsed events and sorting the events
+by their log ``created`` time. Run from the repository root::
+
+    python -m benchmarks.bench_timestamps [--events 1000]
+"""
+
+import argparse
+import json
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from benchmarks.payloads import PAYLOAD_SIZES, applicant_hook
+from huntflow_webhook_models.timestamps import TimestampMode, parse_webhook_timestamps
+from huntflow_webhook_models.webhook import parse_webhook
+
+
+def bodies(events: int, size: str) -> List[bytes]:
+    result = []
+    for index in range(events):
+        payload = PAYLOAD_SIZES[size](applicant_hook())
+        payload["event"]["applicant_log"]["created"] = f"2024-01-{index % 28 + 1:02}T10:00:00+03:00"
+        result.append(json.dumps(payload).encode())
+    return result
+
+
+def parser(mode: TimestampMode) -> Callable[[bytes], Any]:
+    if mode is TimestampMode.DATETIME:
+        return parse_webhook
+    return lambda raw: parse_webhook_timestamps(raw, mode)
+
+
+def measure(parse: Callable[[bytes], Any], raw_bodies: List[bytes]) -> List[float]:
+    parse(raw_bodies[0])
+    started = time.perf_counter()
+    parsed = [parse(raw) for raw in raw_bodies]
+    elapsed = time.perf_counter() - started
+    del parsed
+    tracemalloc.start()
+    parsed = [parse(raw) for raw in raw_bodies]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    sort_time = timeit.timeit(
+        lambda: sorted(parsed, key=lambda request: request.event.applicant_log.created),
+        number=10,
+    )
+    return [elapsed / len(raw_bodies) * 1e6, retained / len(raw_bodies), sort_time * 100]
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument("--events", type=int, default=1000)
+    args = argument_parser.parse_args()
+
+    for size in ("small", "typical"):
+        raw_bodies = bodies(args.events, size)
+        print(f"\n{args.events} {size} applicant events of {len(raw_bodies[0]):,} B")
+        print(f"{'mode':<10}{'parse, us':>11}{'retained, B/event':>20}{'sort, ms':>10}")
+        for mode in TimestampMode:
+            parse_time, retained, sort_time = measure(parser(mode), raw_bodies)
+            print(f"{mode.value:<10}{parse_time:>11,.1f}{retained:>20,.0f}{sort_time:>10,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Compare ``construct_trusted`` with validation of pre-validated raw webhook payloads.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_trusted
+"""
+
+import json
+import timeit
+from functools import partial
+from typing import Any, Callable
+
+from benchmarks.payloads import PAYLOAD_FACTORIES
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS
+
+NUMBER = 500
+REPEAT = 20
+
+
+def best_us(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(
+        f"{'event type':<24}{'model_validate_json':>21}{'construct_trusted':>19}  (us per event)",
+    )
+    for event_type, factory in PAYLOAD_FACTORIES.items():
+        model = HOOK_REQUEST_MODELS[event_type]
+        raw = json.dumps(factory()).encode()
+        print(
+            f"{event_type.value:<24}"
+            f"{best_us(partial(model.model_validate_json, raw)):>21.1f}"
+            f"{best_us(partial(model.construct_trusted, raw)):>19.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
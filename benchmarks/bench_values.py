@@ -0,0 +1,103 @@
+"""Measure typed ``values`` coercion with compiled validators of a schema registry.
+
+Compares ``ValuesSchemaRegistry.parse()`` with ``parse_webhook()`` alone and with a
+hand-written coercion of the values, and shows the one-time schema compile cost.
+Run from the repository root::
+
+    python -m benchmarks.bench_values [--number 2000] [--fields 30]
+"""
+
+import argparse
+import json
+import timeit
+from datetime import date
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.values import Schema, ValuesSchemaRegistry, compile_values_schema
+from huntflow_webhook_models.webhook import parse_webhook
+
+CHOICES = ["none", "1-3 years", "3-6 years", "6+ years"]
+
+
+def schema_and_values(fields: int) -> Tuple[Schema, Dict[str, Any]]:
+    schema: Dict[str, Dict[str, Any]] = {}
+    values: Dict[str, Any] = {}
+    for index in range(fields):
+        kind = index % 4
+        if kind == 0:
+            schema[f"select_{index}"] = {"type": "select", "values": CHOICES}
+            values[f"select_{index}"] = CHOICES[index % len(CHOICES)]
+        elif kind == 1:
+            schema[f"income_{index}"] = {"type": "income"}
+            values[f"income_{index}"] = str(index * 1000)
+        elif kind == 2:
+            schema[f"date_{index}"] = {"type": "date"}
+            values[f"date_{index}"] = "2024-01-02"
+        else:
+            schema[f"text_{index}"] = {"type": "string"}
+            values[f"text_{index}"] = f"text {index}"
+    return schema, values
+
+
+def manual_coercion(schema: Schema) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def coerce(values: Dict[str, Any]) -> Dict[str, Any]:
+        result = dict(values)
+        for key, description in schema.items():
+            value = values.get(key)
+            if value is None:
+                continue
+            field_type = description["type"]
+            if field_type == "select" and value not in description["values"]:
+                raise ValueError(f"{key}: {value!r} is not a choice")
+            if field_type == "income":
+                result[key] = int(value)
+            elif field_type == "date":
+                result[key] = date.fromisoformat(value)
+            else:
+                result[key] = str(value)
+        return result
+
+    return coerce
+
+
+def best_time_us(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--fields", type=int, default=30)
+    args = parser.parse_args()
+
+    schema, values = schema_and_values(args.fields)
+    payload = applicant_hook()
+    payload["event"]["applicant"]["values"] = values
+    raw = json.dumps(payload).encode()
+    account_id = payload["meta"]["account"]["id"]
+
+    registry = ValuesSchemaRegistry()
+    registry.register(account_id, "applicant", schema)
+    coerce = manual_coercion(schema)
+
+    def parse_and_coerce() -> Any:
+        request: Any = parse_webhook(raw)
+        request.event.applicant.values = coerce(request.event.applicant.values)
+        return request
+
+    runs: List[Tuple[str, Callable[[], Any]]] = [
+        ("parse_webhook", lambda: parse_webhook(raw)),
+        ("parse_webhook + manual", parse_and_coerce),
+        ("registry.parse", lambda: registry.parse(raw)),
+    ]
+    print(f"applicant webhook of {len(raw):,} B with {args.fields} typed values\n")
+    print(f"{'parser':<26}{'us/event':>10}")
+    for name, func in runs:
+        print(f"{name:<26}{best_time_us(func, args.number):>10,.1f}")
+    compile_time = best_time_us(lambda: compile_values_schema(schema), 20)
+    print(f"\nschema compile, once per account: {compile_time:,.0f} us")
+
+
+if __name__ == "__main__":
+    main()
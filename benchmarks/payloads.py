@@ -0,0 +1,395 @@
+"""Representative webhook payloads used by the benchmark scripts."""
+
+from typing import Any, Callable, Dict
+
+from huntflow_webhook_models.consts import WebhookEventType
+
+Payload = Dict[str, Any]
+
+
+def meta(event_type: WebhookEventType, webhook_action: str = "ADD") -> Payload:
+    return {
+        "account": {"id": 1, "name": "Huntflow", "nick": "HF"},
+        "author": {"id": 1, "email": "test@example.com", "name": "John", "meta": None},
+        "event_type": event_type.value,
+        "version": "2.0",
+        "retry": 0,
+        "event_id": "1",
+        "domain": "huntflow.ai",
+        "webhook_action": webhook_action,
+    }
+
+
+def vacancy(vacancy_id: int = 1) -> Payload:
+    return {
+        "id": vacancy_id,
+        "account_division": {
+            "id": 1,
+            "name": "IT Department",
+            "full_path": [{"id": 1, "name": "IT Department", "parent": None}],
+        },
+        "account_region": {"id": 1, "name": "Turkey"},
+        "applicants_to_hire": 1,
+        "body": "<p>Be happy</p>",
+        "company": "Huntflow",
+        "conditions": "<p>Big salary</p>",
+        "created": "2023-01-01",
+        "deadline": None,
+        "fill_quotas": [
+            {
+                "id": 1,
+                "applicants_to_hire": 1,
+                "closed": None,
+                "created": "2023-01-01T10:00:00+03:00",
+                "deadline": "2023-02-01",
+                "vacancy_request": None,
+            },
+        ],
+        "frame_id": 1,
+        "hidden": False,
+        "money": "100000",
+        "multiple": False,
+        "parent": None,
+        "position": "Python developer",
+        "priority": 1,
+        "requirements": "<p>Work responsibly</p>",
+        "state": "OPEN",
+        "values": {"experience": "without"},
+    }
+
+
+def applicant() -> Payload:
+    return {
+        "id": 1,
+        "email": "email@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "middle_name": None,
+        "position": "Developer",
+        "birthday": "1990-01-01",
+        "company": "Huntflow",
+        "money": "10$",
+        "phone": "+99999999",
+        "skype": None,
+        "photo": None,
+        "has_photo": False,
+        "social": [
+            {
+                "id": 1,
+                "social_type": "TELEGRAM",
+                "value": "test_tg",
+                "verified": True,
+                "verification_date": "2023-01-01T10:00:00+03:00",
+            },
+        ],
+        "questionary": None,
+        "pd_agreement": {"state": "accepted", "decision_date": "2023-01-01T10:00:00+03:00"},
+        "values": {"favorite_language": "python"},
+        "externals": [],
+    }
+
+
+def calendar_event() -> Payload:
+    return {
+        "id": 1,
+        "name": "Interview",
+        "description": "Interview with John Doe",
+        "status": "confirmed",
+        "event_type": "interview",
+        "interview_type": {"id": 1, "name": "Phone Interview"},
+        "start": "2023-01-02T10:00:00+03:00",
+        "end": "2023-01-02T11:00:00+03:00",
+        "timezone": "Europe/Moscow",
+        "attendees": [
+            {
+                "contact_id": None,
+                "displayName": "John",
+                "email": "test@email.com",
+                "member": 1,
+                "name": "John",
+                "order": 0,
+                "resource": False,
+                "responseStatus": "accepted",
+            },
+        ],
+        "created": "2023-01-01T10:00:00+03:00",
+        "creator": {"displayName": "John", "email": "test@email.com", "self": True},
+        "reminders": [{"method": "popup", "minutes": 15, "multiplier": None, "value": None}],
+        "all_day": False,
+        "foreign": None,
+        "recurrence": None,
+        "etag": None,
+        "location": None,
+        "transparency": "busy",
+        "conference": None,
+        "state": "SENT",
+    }
+
+
+def applicant_hook() -> Payload:
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.APPLICANT),
+        "event": {
+            "applicant": applicant(),
+            "applicant_log": {
+                "id": 1,
+                "type": "STATUS",
+                "status": {"id": 1, "name": "Interview"},
+                "employment_date": None,
+                "removed": None,
+                "comment": "comment",
+                "created": "2023-01-01T10:00:00+03:00",
+                "source": None,
+                "files": [],
+                "calendar_event": calendar_event(),
+                "vacancy": vacancy(),
+            },
+            "applicant_tags": [{"id": 1, "name": "COOL", "color": "000000"}],
+        },
+    }
+
+
+def vacancy_hook() -> Payload:
+    return {
+        "changes": {"state": "OPEN"},
+        "meta": meta(WebhookEventType.VACANCY),
+        "event": {
+            "vacancy": vacancy(),
+            "vacancy_log": {
+                "id": 1,
+                "state": "OPEN",
+                "created": "2023-01-01T10:00:00+03:00",
+                "close_reason": None,
+                "hold_reason": None,
+                "comment": None,
+            },
+            "user": {"id": 1, "name": "user@example.com"},
+        },
+    }
+
+
+def vacancy_request_model() -> Payload:
+    return {
+        "id": 1,
+        "account_vacancy_request": 1,
+        "created": "2023-01-01T10:00:00+03:00",
+        "position": "Developer",
+        "values": {"company": "test_company"},
+        "states": [
+            {
+                "id": 1,
+                "status": "approved",
+                "email": "test@example.com",
+                "reason": None,
+                "order": 1,
+                "changed": "2023-01-01T10:00:00+03:00",
+            },
+        ],
+        "status": "approved",
+        "files": [],
+    }
+
+
+def vacancy_request_hook() -> Payload:
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.VACANCY_REQUEST),
+        "event": {
+            "vacancy_request": vacancy_request_model(),
+            "vacancy_request_log": {
+                "id": 1,
+                "action": "CREATE",
+                "created": "2023-01-01T10:00:00+03:00",
+                "reason": None,
+            },
+        },
+    }
+
+
+def response_hook() -> Payload:
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.RESPONSE),
+        "event": {
+            "applicant_external_response": {
+                "id": 1,
+                "created": "2023-01-01T10:00:00+03:00",
+                "foreign": "external-9-23",
+                "data": {"title": "QA"},
+                "resume": {"position": "QA"},
+                "response_data": {"state": "response", "has_updates": True},
+                "state": "TAKEN",
+                "updated": "2023-01-01T10:00:00+03:00",
+            },
+            "vacancy_external": {
+                "id": 1,
+                "account_vacancy_external": {
+                    "id": 1,
+                    "account_source": {
+                        "id": 1,
+                        "foreign": None,
+                        "name": "Headhunter",
+                        "type": "user",
+                    },
+                    "auth_type": "NATIVE",
+                    "name": "HeadHunter",
+                },
+                "created": "2023-01-01T10:00:00+03:00",
+                "data": "Developer",
+                "foreign": "12345",
+                "state": "PUBLISHED",
+                "vacancy": vacancy(),
+            },
+        },
+    }
+
+
+def offer_hook() -> Payload:
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.OFFER),
+        "event": {
+            "vacancy": vacancy(),
+            "applicant": applicant(),
+            "applicant_offer": {
+                "id": 1,
+                "account_applicant_offer_log": {"id": 1, "type": "ADD"},
+                "applicant_offer_id": 1,
+                "created": "2023-01-01T10:00:00+03:00",
+                "values": {"position_name": "manager"},
+            },
+        },
+    }
+
+
+def recruitment_evaluation_hook() -> Payload:
+    respondent = {
+        "id": 1,
+        "account_id": 1,
+        "custom_id": None,
+        "name": "John Doe",
+        "email": "test@email.com",
+    }
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.RECRUITMENT_EVALUATION),
+        "event": {
+            "recruitment_evaluation": {
+                "id": 1,
+                "account_survey": {
+                    "id": 1,
+                    "name": "Recruitment evaluation",
+                    "schema": {
+                        "type": "object",
+                        "required": ["stars", "comment"],
+                        "properties": {"stars": {"type": "integer"}},
+                        "additionalProperties": False,
+                    },
+                },
+                "survey_answer_requests": [
+                    {
+                        "id": 1,
+                        "respondent": respondent,
+                        "created": "2023-01-01T10:00:00+03:00",
+                        "state": "SENT",
+                    },
+                ],
+                "survey_answer": {
+                    "id": 1,
+                    "respondent": respondent,
+                    "created": "2023-01-01T10:00:00+03:00",
+                    "updated": "2023-01-01T10:00:00+03:00",
+                    "data": {"comment": "Great job"},
+                },
+                "stars": 10,
+                "applicant": applicant(),
+                "vacancy": vacancy(),
+                "applicant_log_id": 1,
+            },
+        },
+    }
+
+
+def survey_questionary_hook() -> Payload:
+    return {
+        "changes": None,
+        "meta": meta(WebhookEventType.SURVEY_QUESTIONARY),
+        "event": {
+            "applicant": applicant(),
+            "vacancy": vacancy(),
+            "applicant_log_id": 1,
+            "survey_questionary": {
+                "id": 1,
+                "survey": {
+                    "id": 1,
+                    "name": "test",
+                    "survey_schema": {"type": "object", "properties": {}},
+                    "survey_ui_schema": {"ui:order": []},
+                    "created": "2023-01-01T10:00:00+03:00",
+                    "updated": None,
+                    "title": "Test",
+                    "active": True,
+                    "type": "type_q",
+                },
+                "created": "2023-01-01T10:00:00+03:00",
+                "respondent": {"applicant_id": 1, "name": "John"},
+                "created_by": {"account_id": 1, "name": "John"},
+                "answer": {
+                    "id": 1,
+                    "created": "2023-01-01T10:00:00+03:00",
+                    "data": {"q1": "Applicant's smart answer"},
+                },
+                "link": "https://survey-questionary/link",
+            },
+        },
+    }
+
+
+PAYLOAD_FACTORIES: Dict[WebhookEventType, Callable[[], Payload]] = {
+    WebhookEventType.APPLICANT: applicant_hook,
+    WebhookEventType.VACANCY: vacancy_hook,
+    WebhookEventType.VACANCY_REQUEST: vacancy_request_hook,
+    WebhookEventType.RESPONSE: response_hook,
+    WebhookEventType.OFFER: offer_hook,
+    WebhookEventType.RECRUITMENT_EVALUATION: recruitment_evaluation_hook,
+    WebhookEventType.SURVEY_QUESTIONARY: survey_questionary_hook,
+}
+
+
+def small(payload: Payload) -> Payload:
+    """The payload with all lists and ``values`` dicts emptied."""
+    return _transform(payload, list_size=0, values_width=0, parent_depth=0)
+
+
+def pathological(payload: Payload) -> Payload:
+    """The payload with long lists, deep ``Vacancy.parent`` chains and wide ``values``."""
+    return _transform(payload, list_size=300, values_width=1000, parent_depth=30)
+
+
+PAYLOAD_SIZES: Dict[str, Callable[[Payload], Payload]] = {
+    "small": small,
+    "typical": lambda payload: payload,
+    "pathological": pathological,
+}
+
+
+def _transform(value: Any, list_size: int, values_width: int, parent_depth: int) -> Any:
+    if isinstance(value, list):
+        items = [_transform(item, list_size, values_width, parent_depth) for item in value]
+        return (items * list_size)[:list_size] if items else items
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, item in value.items():
+        if key == "values" and isinstance(item, dict):
+            item = {f"field_{index}": f"value {index}" for index in range(values_width)}
+        elif key == "parent" and "frame_id" in value and parent_depth:
+            # Vacancy: replace the parent with a chain of typical vacancies
+            item = None
+            for depth in range(parent_depth):
+                item = {**vacancy(vacancy_id=1000 + depth), "parent": item}
+        # The parent chain is already built, other nested vacancies get their own chains
+        depth = 0 if key == "parent" else parent_depth
+        result[key] = _transform(item, list_size, values_width, depth)
+    return result
@@ -0,0 +1,193 @@
+"""Benchmark suite of every hook request model, payload size and parse path.
+
+Measures ``model_validate_json``, ``model_validate``, ``model_dump_json`` and
+``model_dump`` of all ``*HookRequest`` models on small, typical and pathological
+payloads and reports throughput, p50/p99 latency and peak memory. Results are
+written as JSON and can be compared with the results of another version::
+
+    python -m benchmarks.suite --output bench-results.json
+    python -m benchmarks.suite --compare bench-results.json
+
+Run from the repository root, or with ``make bench``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, PAYLOAD_SIZES
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS
+
+OPERATIONS: Dict[str, Callable[[BaseModel, bytes, Dict[str, Any]], Callable[[], Any]]] = {
+    "validate_json": lambda model, raw, data: lambda: type(model).model_validate_json(raw),
+    "validate": lambda model, raw, data: lambda: type(model).model_validate(data),
+    "dump_json": lambda model, raw, data: model.model_dump_json,
+    "dump": lambda model, raw, data: model.model_dump,
+}
+
+MIN_SAMPLES = 20
+
+
+def percentile(sorted_samples: List[int], fraction: float) -> float:
+    index = min(len(sorted_samples) - 1, round(fraction * (len(sorted_samples) - 1)))
+    return sorted_samples[index] / 1000
+
+
+def peak_memory(call: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def measure(call: Callable[[], Any], min_time: float) -> Dict[str, Any]:
+    call()  # warm up
+    samples: List[int] = []
+    perf_counter_ns = time.perf_counter_ns
+    deadline = perf_counter_ns() + int(min_time * 1e9)
+    while len(samples) < MIN_SAMPLES or perf_counter_ns() < deadline:
+        started = perf_counter_ns()
+        call()
+        samples.append(perf_counter_ns() - started)
+    samples.sort()
+    return {
+        "iterations": len(samples),
+        "ops_per_sec": round(len(samples) / (sum(samples) / 1e9), 1),
+        "p50_us": round(percentile(samples, 0.5), 2),
+        "p99_us": round(percentile(samples, 0.99), 2),
+        "peak_memory_bytes": peak_memory(call),
+    }
+
+
+def cases(
+    event_types: List[WebhookEventType],
+    sizes: List[str],
+    operations: List[str],
+) -> Iterator[Tuple[Dict[str, Any], Callable[[], Any]]]:
+    for event_type in event_types:
+        model_cls = HOOK_REQUEST_MODELS[event_type]
+        for size in sizes:
+            data = PAYLOAD_SIZES[size](PAYLOAD_FACTORIES[event_type]())
+            raw = json.dumps(data).encode()
+            model = model_cls.model_validate_json(raw)
+            for operation in operations:
+                case = {
+                    "event_type": event_type.value,
+                    "size": size,
+                    "operation": operation,
+                    "payload_bytes": len(raw),
+                }
+                yield case, OPERATIONS[operation](model, raw, data)
+
+
+def metadata() -> Dict[str, Any]:
+    try:
+        package_version = version("huntflow-webhook-models")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return {
+        "package_version": package_version,
+        "pydantic_version": pydantic.VERSION,
+        "pydantic_core_version": pydantic_core.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def case_key(result: Dict[str, Any]) -> Tuple[str, str, str]:
+    return result["event_type"], result["size"], result["operation"]
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> int:
+    """Print throughput changes against the baseline, return the number of regressions."""
+    with open(baseline_path) as baseline_file:
+        baseline = {case_key(result): result for result in json.load(baseline_file)["results"]}
+    regressions = 0
+    print(f"\n{'event type':<24}{'size':<14}{'operation':<15}{'baseline/s':>12}{'change':>9}")
+    for result in results:
+        old = baseline.get(case_key(result))
+        if old is None:
+            continue
+        change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+        mark = ""
+        if change < -max_regression:
+            regressions += 1
+            mark = "  REGRESSION"
+        print(
+            f"{result['event_type']:<24}{result['size']:<14}{result['operation']:<15}"
+            f"{old['ops_per_sec']:>12,.0f}{change:>+9.1%}{mark}",
+        )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--event-type",
+        action="append",
+        type=WebhookEventType,
+        help="event types to run, all by default",
+    )
+    parser.add_argument("--size", action="append", choices=list(PAYLOAD_SIZES))
+    parser.add_argument("--operation", action="append", choices=list(OPERATIONS))
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="seconds to run each case for",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare throughput with the results JSON file")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="throughput drop to fail the comparison at, 0.1 is 10%%",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = []
+    print(
+        f"{'event type':<24}{'size':<14}{'operation':<15}{'bytes':>8}{'ops/s':>11}"
+        f"{'p50, us':>10}{'p99, us':>10}{'peak mem, B':>13}",
+    )
+    for case, call in cases(
+        args.event_type or list(HOOK_REQUEST_MODELS),
+        args.size or list(PAYLOAD_SIZES),
+        args.operation or list(OPERATIONS),
+    ):
+        result = {**case, **measure(call, args.min_time)}
+        results.append(result)
+        print(
+            f"{result['event_type']:<24}{result['size']:<14}{result['operation']:<15}"
+            f"{result['payload_bytes']:>8}{result['ops_per_sec']:>11,.0f}"
+            f"{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}"
+            f"{result['peak_memory_bytes']:>13,}",
+        )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"metadata": metadata(), "results": results}, output_file, indent=2)
+    if args.compare and compare(results, args.compare, args.max_regression):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,39 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from . import consts
-from .applicant import ApplicantHookRequest
-from .offer import OfferHookRequest
-from .recruitment_evaluation import RecruitmentEvaluationHookRequest
-from .response import ResponseHookRequest
-from .survey_questionary import SurveyQuestionaryHookRequest
-from .vacancy import VacancyHookRequest
-from .vacancy_request import VacancyRequestHookRequest
+
+if TYPE_CHECKING:
+    from .applicant import ApplicantHookRequest
+    from .batch import BatchItemError, validate_batch
+    from .binary import BinaryArchiveWriter, iter_binary_archive
+    from .columns import ColumnarBuilder
+    from .compression import PayloadCompressor, train_dictionary
+    from .dedup import BloomFilter, EventDeduplicator
+    from .generator import PayloadGenerator, PayloadSizes
+    from .index import EventIndex
+    from .indexed_archive import IndexedArchiveReader, IndexedArchiveWriter
+    from .intern import Interner
+    from .json_backend import JSONBackend, set_json_backend
+    from .lazy import LazyHookRequest, parse_webhook_lazy
+    from .lenient import parse_webhook_lenient, unknown_enum_values
+    from .loader import warmup
+    from .ndjson import iter_webhooks
+    from .offer import OfferHookRequest
+    from .parallel import iter_webhooks_parallel, meta_summary
+    from .parents import ParentChainParser
+    from .projection import project
+    from .records import construct_record, parse_record, record_type, to_record
+    from .recruitment_evaluation import RecruitmentEvaluationHookRequest
+    from .response import ResponseHookRequest
+    from .server import WebhookApp
+    from .state import StateMaterializer
+    from .survey_questionary import SurveyQuestionaryHookRequest
+    from .timestamps import TimestampMode, parse_webhook_timestamps
+    from .vacancy import VacancyHookRequest
+    from .vacancy_request import VacancyRequestHookRequest
+    from .values import ValuesSchemaRegistry
+    from .webhook import HookRequest, parse_webhook, validate_webhook
 
 __all__ = [
     "consts",
@@ -16,4 +44,107 @@ __all__ = [
     "RecruitmentEvaluationHookRequest",
     "ResponseHookRequest",
     "SurveyQuestionaryHookRequest",
+    "HookRequest",
+    "parse_webhook",
+    "validate_webhook",
+    "LazyHookRequest",
+    "parse_webhook_lazy",
+    "warmup",
+    "BatchItemError",
+    "validate_batch",
+    "iter_webhooks",
+    "iter_webhooks_parallel",
+    "meta_summary",
+    "EventDeduplicator",
+    "BloomFilter",
+    "Interner",
+    "record_type",
+    "to_record",
+    "parse_record",
+    "construct_record",
+    "ColumnarBuilder",
+    "PayloadGenerator",
+    "PayloadSizes",
+    "WebhookApp",
+    "StateMaterializer",
+    "EventIndex",
+    "JSONBackend",
+    "set_json_backend",
+    "project",
+    "ParentChainParser",
+    "ValuesSchemaRegistry",
+    "TimestampMode",
+    "parse_webhook_timestamps",
+    "parse_webhook_lenient",
+    "unknown_enum_values",
+    "BinaryArchiveWriter",
+    "iter_binary_archive",
+    "IndexedArchiveWriter",
+    "IndexedArchiveReader",
+    "PayloadCompressor",
+    "train_dictionary",
 ]
+
+# Attributes are imported from their modules on first access, so that only the models
+# actually used by the application are imported and built.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "ApplicantHookRequest": ".applicant",
+    "VacancyHookRequest": ".vacancy",
+    "VacancyRequestHookRequest": ".vacancy_request",
+    "OfferHookRequest": ".offer",
+    "RecruitmentEvaluationHookRequest": ".recruitment_evaluation",
+    "ResponseHookRequest": ".response",
+    "SurveyQuestionaryHookRequest": ".survey_questionary",
+    "HookRequest": ".webhook",
+    "parse_webhook": ".webhook",
+    "validate_webhook": ".webhook",
+    "LazyHookRequest": ".lazy",
+    "parse_webhook_lazy": ".lazy",
+    "warmup": ".loader",
+    "BatchItemError": ".batch",
+    "validate_batch": ".batch",
+    "iter_webhooks": ".ndjson",
+    "iter_webhooks_parallel": ".parallel",
+    "meta_summary": ".parallel",
+    "EventDeduplicator": ".dedup",
+    "BloomFilter": ".dedup",
+    "Interner": ".intern",
+    "record_type": ".records",
+    "to_record": ".records",
+    "parse_record": ".records",
+    "construct_record": ".records",
+    "ColumnarBuilder": ".columns",
+    "PayloadGenerator": ".generator",
+    "PayloadSizes": ".generator",
+    "WebhookApp": ".server",
+    "StateMaterializer": ".state",
+    "EventIndex": ".index",
+    "JSONBackend": ".json_backend",
+    "set_json_backend": ".json_backend",
+    "project": ".projection",
+    "ParentChainParser": ".parents",
+    "ValuesSchemaRegistry": ".values",
+    "TimestampMode": ".timestamps",
+    "parse_webhook_timestamps": ".timestamps",
+    "parse_webhook_lenient": ".lenient",
+    "unknown_enum_values": ".lenient",
+    "BinaryArchiveWriter": ".binary",
+    "iter_binary_archive": ".binary",
+    "IndexedArchiveWriter": ".indexed_archive",
+    "IndexedArchiveReader": ".indexed_archive",
+    "PayloadCompressor": ".compression",
+    "train_dictionary": ".compression",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,214 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, get_args, get_origin, get_type_hints
+
+_datetime_adapter: TypeAdapter[datetime] = TypeAdapter(datetime)
+_date_adapter: TypeAdapter[date] = TypeAdapter(date)
+
+
+def to_datetime(value: Any) -> Any:
+    """Datetime of an ISO 8601 string from trusted data, other values are returned as they are."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _datetime_adapter.validate_python(value)
+
+
+def to_date(value: Any) -> Any:
+    """Date of an ISO 8601 string from trusted data, other values are returned as they are."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return _date_adapter.validate_python(value)
+
+
+class EnumMembers(Dict[Any, Enum]):
+    """Enum members by value, unknown values are passed to the enum to raise an error."""
+
+    def __init__(self, enum_cls: Type[Enum]) -> None:
+        super().__init__(enum_cls._value2member_map_)
+        self.enum_cls = enum_cls
+
+    def __missing__(self, value: Any) -> Enum:
+        return self.enum_cls(value)
+
+
+class ConstructorCompiler:
+    """Generates plain Python constructor functions for models and nested models.
+
+    Every constructor copies data into the instance ``__dict__`` converting only
+    the values which JSON can't represent: nested models, enums, dates and datetimes.
+    """
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            "_new": object.__new__,
+            # Slot descriptors of BaseModel, cheaper than object.__setattr__ calls
+            "_set_dict": BaseModel.__dict__["__dict__"].__set__,
+            "_set_fields_set": BaseModel.__dict__["__pydantic_fields_set__"].__set__,
+            "_set_extra": BaseModel.__dict__["__pydantic_extra__"].__set__,
+            "_set_private": BaseModel.__dict__["__pydantic_private__"].__set__,
+            "_to_date": to_date,
+            "_to_datetime": to_datetime,
+        }
+        self.constructors: Dict[Type[BaseModel], str] = {}
+
+    def constructor(self, model: Type[BaseModel]) -> Callable[[Dict[str, Any]], Any]:
+        return self._function(self._compile, model)
+
+    def _caches(self) -> List[Dict[Type[BaseModel], str]]:
+        """Function names by model, registered before compiling for recursive models."""
+        return [self.constructors]
+
+    def _function(
+        self,
+        compile_model: Callable[[Type[BaseModel]], str],
+        model: Type[BaseModel],
+    ) -> Any:
+        """Compiled function of the model.
+
+        Names registered while compiling the model and its nested models are dropped
+        if it fails, so they don't refer to functions which were never defined.
+        """
+        saved = [dict(cache) for cache in self._caches()]
+        try:
+            return self.namespace[compile_model(model)]
+        except BaseException:
+            for cache, entries in zip(self._caches(), saved):
+                cache.clear()
+                cache.update(entries)
+            raise
+
+    def _function_name(self, prefix: str, model: Type[BaseModel]) -> str:
+        # The namespace only grows, so names of dropped functions aren't reused
+        return f"{prefix}_{model.__name__}_{len(self.namespace)}"
+
+    def _constant(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def _compile(self, model: Type[BaseModel]) -> str:
+        if model in self.constructors:
+            return self.constructors[model]
+        func_name = self._function_name("_construct", model)
+        self.constructors[model] = func_name
+        hints = get_type_hints(model, include_extras=True)
+        values = []
+        for index, (name, field) in enumerate(model.model_fields.items()):
+            value = self._field_value(name, field)
+            value_name = f"_v{index}"
+            converted = self._convert(value_name, hints[name])
+            if converted.count(value_name) == 1:
+                value = converted.replace(value_name, value)
+            else:
+                value = converted.replace(value_name, f"({value_name} := {value})", 1)
+            values.append((name, value))
+        lines = [f"def {func_name}(data):", "    get = data.get"]
+        lines += self._build(model, values)
+        exec("\n".join(lines), self.namespace)  # noqa: S102
+        return func_name
+
+    def _build(self, model: Type[BaseModel], values: List[Tuple[str, str]]) -> List[str]:
+        """Function body lines building an instance from the field value expressions."""
+        lines = ["    values = {", *(f"        {name!r}: {value}," for name, value in values)]
+        lines.append("    }")
+        keys = self._constant(
+            frozenset(field.alias or name for name, field in model.model_fields.items()),
+        )
+        aliases = {
+            field.alias: name
+            for name, field in model.model_fields.items()
+            if field.alias and field.alias != name
+        }
+        if aliases:
+            aliases_name = self._constant(aliases)
+            fields = f"{aliases_name}.get(key, key) for key in data.keys() & {keys}"
+            lines.append(f"    fields_set = {{{fields}}}")
+        else:
+            lines.append(f"    fields_set = data.keys() & {keys}")
+        lines += [
+            f"    instance = _new({self._constant(model)})",
+            "    _set_dict(instance, values)",
+            "    _set_fields_set(instance, fields_set)",
+            "    _set_extra(instance, None)",
+            f"    _set_private(instance, {self._private(model)})",
+            "    return instance",
+        ]
+        return lines
+
+    def _private(self, model: Type[BaseModel]) -> str:
+        """Python expression of the private attributes of a new instance."""
+        private_attributes = model.__private_attributes__
+        if not private_attributes:
+            return "None"
+
+        def private_defaults() -> Dict[str, Any]:
+            return {name: attr.get_default() for name, attr in private_attributes.items()}
+
+        return f"{self._constant(private_defaults)}()"
+
+    def _field_value(self, name: str, field: FieldInfo) -> str:
+        """Python expression getting the field value from ``data``."""
+        key = field.alias or name
+        if field.is_required():
+            return f"data[{key!r}]"
+        return self._get(key, field.get_default(call_default_factory=True))
+
+    def _get(self, key: str, default: Any) -> str:
+        """Python expression getting the optional ``key`` value from ``data``."""
+        if default is None:
+            return f"get({key!r})"
+        if isinstance(default, (list, dict)):
+            return f"(data[{key!r}] if {key!r} in data else {type(default).__name__}())"
+        return f"get({key!r}, {self._constant(default)})"
+
+    def _convert(self, expr: str, annotation: Any) -> str:
+        """Python expression converting ``expr`` value to the annotated type."""
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            return self._convert_annotated(expr, annotation)
+        if origin is Union:
+            not_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(not_none_args) != 1:
+                return expr
+            converted = self._convert(expr, not_none_args[0])
+            return expr if converted == expr else f"None if {expr} is None else {converted}"
+        if origin in (list, List):
+            args = get_args(annotation)
+            item = f"_i{len(self.namespace)}"
+            converted = self._convert(item, args[0]) if args else item
+            return self._list(expr, item, converted)
+        if isinstance(annotation, type):
+            return self._convert_type(expr, annotation)
+        return expr
+
+    def _convert_annotated(self, expr: str, annotation: Any) -> str:
+        """Python expression validating ``expr`` with the validators of the annotated type.
+
+        Fields of derived models, e.g. lenient enums and timestamps, have them.
+        """
+        return f"{self._constant(TypeAdapter(annotation).validate_python)}({expr})"
+
+    def _list(self, expr: str, item: str, converted: str) -> str:
+        """Python expression building the list field value from ``expr`` items."""
+        return expr if converted == item else f"[{converted} for {item} in {expr}]"
+
+    def _convert_type(self, expr: str, type_: type) -> str:
+        if issubclass(type_, BaseModel):
+            return f"{self._compile(type_)}({expr})"
+        if issubclass(type_, Enum):
+            return f"{self._constant(EnumMembers(type_))}[{expr}]"
+        if issubclass(type_, datetime):
+            return f"_to_datetime({expr})"
+        if issubclass(type_, date):
+            return f"_to_date({expr})"
+        return expr
@@ -0,0 +1,137 @@
+import sys
+from copy import copy
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, create_model
+from typing_extensions import get_args, get_origin
+
+# Returns the replacement of an annotation, or the annotation itself to keep it
+Replace = Callable[[Any], Any]
+# Arguments of replaced_model() building a derived model
+DerivedKey = Tuple[Type[BaseModel], Replace, str, str, Optional[type]]
+# Cached function building a derived model and its arguments, to build it again
+Derivation = Tuple[Callable[..., Type[BaseModel]], Tuple[Any, ...]]
+
+# Derived models which are being built, to resolve recursive fields
+_building: Dict[DerivedKey, str] = {}
+
+
+def is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+class DerivedModel:
+    """Base class of derived models, pickled by the function and arguments deriving them.
+
+    Derived models are built on first use, so a process unpickling an instance may
+    not have built its model yet.
+    """
+
+    __derivation__: Derivation
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _restore, (self.__derivation__, self.__getstate__())
+
+
+def _restore(derivation: Derivation, state: Dict[str, Any]) -> BaseModel:
+    derive, args = derivation
+    model = derive(*args)
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+def _replace_annotation(annotation: Any, key: DerivedKey) -> Any:
+    """Annotation with the types inside of it replaced, models with them derived."""
+    _, replace, suffix, module, mixin = key
+    replaced = replace(annotation)
+    if replaced is not annotation:
+        return replaced
+    if is_model(annotation):
+        name = _building.get((annotation, replace, suffix, module, mixin))
+        return name or _derived_model(annotation, replace, suffix, module, mixin)
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    replaced_args = tuple(_replace_annotation(arg, key) for arg in args)
+    if replaced_args == args:
+        return annotation
+    origin = get_origin(annotation)
+    if origin is Union:
+        return Union[replaced_args]
+    if origin in (list, List):
+        return List[replaced_args[0]]  # type: ignore[valid-type]
+    return annotation
+
+
+def free_name(module: str, name: str) -> str:
+    """The name, numbered if the module has it already, e.g. models of the same name."""
+    namespace = vars(sys.modules[module])
+    number = 1
+    free = name
+    while free in namespace or free in _building.values():
+        number += 1
+        free = f"{name}{number}"
+    return free
+
+
+def bind_model(model: Type[BaseModel], module: str, derivation: Derivation) -> None:
+    """Bind a derived model in the namespace of ``module`` by its name.
+
+    The name should be taken from :func:`free_name`. Bound models resolve as
+    forward references and their instances are pickled with the derivation.
+    """
+    model.__qualname__ = model.__name__
+    model.__derivation__ = derivation  # type: ignore[attr-defined]
+    setattr(sys.modules[module], model.__name__, model)
+
+
+def replaced_model(
+    model: Type[BaseModel],
+    replace: Replace,
+    suffix: str,
+    module: str,
+    mixin: Optional[type] = None,
+) -> Type[BaseModel]:
+    """Subclass of the model with the types of its fields and nested models replaced.
+
+    Derived models get the ``mixin`` base class too. They are bound in the namespace
+    of ``module`` by their name, numbered if it's taken, so their forward references
+    resolve, and their instances are pickled with the arguments to derive the model
+    again. Models without replaced types are returned as they are.
+    """
+    return _derived_model(model, replace, suffix, module, mixin)
+
+
+@lru_cache(maxsize=None)
+def _derived_model(
+    model: Type[BaseModel],
+    replace: Replace,
+    suffix: str,
+    module: str,
+    mixin: Optional[type],
+) -> Type[BaseModel]:
+    key: DerivedKey = (model, replace, suffix, module, mixin)
+    name = _building[key] = free_name(module, f"{model.__name__}{suffix}")
+    try:
+        fields: Dict[str, Any] = {}
+        for field_name, field in model.model_fields.items():
+            annotation = _replace_annotation(field.annotation, key)
+            if annotation is not field.annotation:
+                # Metadata of the annotation is merged into the list in place
+                field = copy(field)
+                field.annotation = annotation
+                field.metadata = list(field.metadata)
+                fields[field_name] = (annotation, field)
+    finally:
+        del _building[key]
+    if not fields:
+        return model
+    bases: Tuple[Any, ...] = (
+        (model, DerivedModel) if mixin is None else (model, mixin, DerivedModel)
+    )
+    derived: Type[BaseModel] = create_model(name, __base__=bases, __module__=module, **fields)
+    bind_model(derived, module, (_derived_model, key))
+    derived.model_rebuild(_types_namespace={name: derived})
+    return derived
@@ -0,0 +1,78 @@
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, Tuple, Type, Union
+
+from pydantic import BaseModel
+from typing_extensions import get_args, get_origin
+
+# Field names or JSON keys from a model to nested values, "*" stands for list items
+Path = Tuple[str, ...]
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, bool]:
+    """Model type of a field annotation and whether it is a list of the models."""
+    if get_origin(annotation) is Union:
+        not_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(not_none_args) == 1:
+            annotation = not_none_args[0]
+    if get_origin(annotation) in (list, List) and get_args(annotation):
+        return get_args(annotation)[0], True
+    return annotation, False
+
+
+def _find_models(
+    model: Type[BaseModel],
+    targets: Tuple[Type[BaseModel], ...],
+    names: Path,
+    keys: Path,
+    ancestors: Tuple[Type[BaseModel], ...] = (),
+) -> Iterator[Tuple[Type[BaseModel], Path, Path]]:
+    """Target models nested in the model with their field name and JSON key paths.
+
+    Recursive fields, such as ``Vacancy.parent``, aren't followed.
+    """
+    ancestors = (*ancestors, model)
+    for name, field in model.model_fields.items():
+        annotation, is_list = _unwrap(field.annotation)
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+            continue
+        if annotation in ancestors:
+            continue
+        items = ("*",) if is_list else ()
+        field_names = (*names, name, *items)
+        field_keys = (*keys, field.alias or name, *items)
+        if annotation in targets:
+            yield annotation, field_names, field_keys
+        yield from _find_models(annotation, targets, field_names, field_keys, ancestors)
+
+
+@lru_cache(maxsize=None)
+def model_paths(
+    model: Type[BaseModel],
+    targets: Tuple[Type[BaseModel], ...],
+) -> List[Tuple[Type[BaseModel], Path, Path]]:
+    """Target models nested in the model with their field name and JSON key paths, cached."""
+    return list(_find_models(model, targets, (), ()))
+
+
+def iter_path(value: Any, path: Path, get: Callable[[Any, str], Any]) -> Iterator[Any]:
+    """Not empty values at the path, ``get`` takes an item of a dict or a model."""
+    if value is None:
+        return
+    if not path:
+        yield value
+        return
+    name, rest = path[0], path[1:]
+    if name == "*":
+        for item in value:
+            yield from iter_path(item, rest, get)
+    else:
+        yield from iter_path(get(value, name), rest, get)
+
+
+def get_attribute(instance: Any, names: Tuple[str, ...]) -> Any:
+    """Value at the attribute path, ``None`` if any object on the way is ``None``."""
+    for name in names:
+        if instance is None:
+            return None
+        instance = getattr(instance, name)
+    return instance
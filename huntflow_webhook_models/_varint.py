@@ -0,0 +1,43 @@
+from typing import Tuple, Union
+
+
+def write_uint(out: bytearray, value: int) -> None:
+    """Append an unsigned integer as a LEB128 varint, 7 bits per byte."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_int(out: bytearray, value: int) -> None:
+    # Zigzag encoding keeps small negative numbers short
+    write_uint(out, value << 1 if value >= 0 else (~value << 1) | 1)
+
+
+def write_bytes(out: bytearray, value: bytes) -> None:
+    write_uint(out, len(value))
+    out += value
+
+
+def write_str(out: bytearray, value: str) -> None:
+    write_bytes(out, value.encode())
+
+
+def read_uint(buf: Union[bytes, bytearray], pos: int) -> Tuple[int, int]:
+    """Varint at the position and the position after it.
+
+    :raises IndexError: if the buffer ends inside the varint
+    """
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def read_int(buf: Union[bytes, bytearray], pos: int) -> Tuple[int, int]:
+    value, pos = read_uint(buf, pos)
+    return (value >> 1) ^ -(value & 1), pos
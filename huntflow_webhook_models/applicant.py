@@ -1,13 +1,14 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
 from huntflow_webhook_models.common_models.applicant import Applicant, ApplicantLog, ApplicantTag
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.consts import ApplicantWebhookActionType
 
 
-class ApplicantEvent(BaseModel):
+class ApplicantEvent(HuntflowBaseModel):
     applicant: Applicant
     applicant_log: ApplicantLog
     applicant_tags: List[ApplicantTag]
@@ -1,24 +1,29 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Type, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.serialization import dump_json_fast
+from huntflow_webhook_models.trusted import construct_trusted
 
+RequestT = TypeVar("RequestT", bound="BaseHuntflowWebhookRequest")
 
-class Account(BaseModel):
+
+class Account(HuntflowBaseModel):
     id: int = Field(..., description="Account ID", examples=[1])
     name: str = Field(..., description="Account name", examples=["Huntflow"])
     nick: str = Field(..., description="Account nick", examples=["HF"])
 
 
-class Author(BaseModel):
+class Author(HuntflowBaseModel):
     id: int = Field(..., description="Account ID", examples=[1])
     email: str = Field(..., description="Account owner email", examples=["test@example.com"])
     name: str = Field(..., description="Account owner name", examples=["John"])
     meta: Optional[Dict] = Field(None, description="Additional data", examples=[{"data": "data"}])
 
 
-class WebhookMetaInfoBase(BaseModel):
+class WebhookMetaInfoBase(HuntflowBaseModel):
     account: Account
     author: Optional[Author] = None
     event_type: WebhookEventType = Field(
@@ -32,6 +37,24 @@ class WebhookMetaInfoBase(BaseModel):
     domain: str = Field(..., description="Domain", examples=["huntflow.ai"])
 
 
-class BaseHuntflowWebhookRequest(BaseModel):
+class BaseHuntflowWebhookRequest(HuntflowBaseModel):
     changes: Optional[Dict] = Field(None, description="Data changes", examples=[{"id": 2}])
     meta: WebhookMetaInfoBase
+
+    @classmethod
+    def construct_trusted(
+        cls: Type[RequestT],
+        raw: Union[str, bytes],
+    ) -> RequestT:
+        """Build the request from already validated raw JSON skipping validation.
+
+        See :func:`huntflow_webhook_models.trusted.construct_trusted`.
+        """
+        return construct_trusted(cls, raw)
+
+    def dump_json_fast(self) -> bytes:
+        """Serialize to JSON bytes with the configured JSON backend.
+
+        See :func:`huntflow_webhook_models.serialization.dump_json_fast`.
+        """
+        return dump_json_fast(self)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Sequence, Union
+
+from pydantic import (
+    ConfigDict,
+    Json,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
+from pydantic_core import ErrorDetails
+from typing_extensions import Annotated
+
+from huntflow_webhook_models.webhook import HookRequest, WebhookRequest
+
+
+@dataclass(frozen=True)
+class BatchItemError:
+    """Validation errors of a single batch item."""
+
+    index: int
+    errors: List[ErrorDetails]
+
+
+BatchResult = List[Union[HookRequest, BatchItemError]]
+
+
+class _ItemErrors(List[ErrorDetails]):
+    """Errors of an item captured during batch validation, before its index is known."""
+
+
+def _capture_errors(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except ValidationError as exc:
+        return _ItemErrors(exc.errors(include_url=False))
+
+
+@lru_cache(maxsize=None)
+def get_batch_adapter() -> TypeAdapter[List[Union[HookRequest, _ItemErrors]]]:
+    """Type adapter of a list of raw webhook bodies, built on first use."""
+    return TypeAdapter(
+        List[Annotated[Json[WebhookRequest], WrapValidator(_capture_errors)]],
+        config=ConfigDict(title="WebhookRequestBatch"),
+    )
+
+
+def validate_batch(payloads: Sequence[Union[str, bytes]]) -> BatchResult:
+    """Validate raw webhook bodies into hook request models with a single core call.
+
+    Invalid items don't abort the batch: the result has a ``BatchItemError``
+    at their positions.
+    """
+    results: List[Any] = get_batch_adapter().validate_python(payloads)
+    for index, result in enumerate(results):
+        if type(result) is _ItemErrors:
+            results[index] = BatchItemError(index, list(result))
+    return results
@@ -0,0 +1,506 @@
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
+from struct import Struct
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
+from typing_extensions import Annotated, get_args, get_origin, get_type_hints
+
+from huntflow_webhook_models._codegen import ConstructorCompiler
+from huntflow_webhook_models._varint import read_uint, write_bytes, write_int, write_str, write_uint
+from huntflow_webhook_models.json_backend import json_dumps, json_loads
+from huntflow_webhook_models.timestamps import EPOCH, EpochMicroseconds, UTCDateTime
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS, HookRequest
+
+Source = Union[str, "os.PathLike[str]", IO[bytes]]
+Encode = Callable[[bytearray, Any], None]
+Decode = Callable[[bytes, int], Tuple[Any, int]]
+
+MAGIC = b"HFWB"
+FORMAT_VERSION = 1
+
+_MICROSECOND = timedelta(microseconds=1)
+_MINUTE = timedelta(minutes=1)
+_DATETIME = Struct("<qh")
+_pack_datetime = _DATETIME.pack
+_unpack_datetime = _DATETIME.unpack_from
+_NAIVE = -0x8000
+# Float seconds keep microseconds exactly up to about 140 years from the epoch
+_EXACT_TIMESTAMP = 2**52
+_fromtimestamp = datetime.fromtimestamp
+_EVENT_TYPES = list(HOOK_REQUEST_MODELS)
+_EVENT_TYPE_ORDINALS = {event_type: ordinal for ordinal, event_type in enumerate(_EVENT_TYPES)}
+
+
+def _write_json(out: bytearray, value: Any) -> None:
+    write_bytes(out, json_dumps(value))
+
+
+def _write_datetime(out: bytearray, value: datetime) -> None:
+    """UTC epoch microseconds and the UTC offset in minutes, ``_NAIVE`` for naive values."""
+    offset = value.utcoffset()
+    if offset is None:
+        out += _pack_datetime((value - EPOCH) // _MICROSECOND, _NAIVE)
+    else:
+        utc = value.replace(tzinfo=None) - offset
+        out += _pack_datetime((utc - EPOCH) // _MICROSECOND, offset // _MINUTE)
+
+
+def _write_epoch(out: bytearray, value: int) -> None:
+    """Epoch microseconds of the "epoch" timestamp mode, written as a UTC datetime."""
+    out += _pack_datetime(value, 0)
+
+
+def _write_utc_datetime(out: bytearray, value: datetime) -> None:
+    """Naive UTC datetime of the "utc" timestamp mode, written as a UTC datetime."""
+    out += _pack_datetime((value - EPOCH) // _MICROSECOND, 0)
+
+
+@lru_cache(maxsize=None)
+def _timezone(minutes: int) -> timezone:
+    return timezone(timedelta(minutes=minutes))
+
+
+def _read_datetime(buf: bytes, pos: int) -> Tuple[datetime, int]:
+    microseconds, minutes = _unpack_datetime(buf, pos)
+    pos += _DATETIME.size
+    if minutes == _NAIVE:
+        return EPOCH + microseconds * _MICROSECOND, pos
+    tzinfo = _timezone(minutes)
+    if -_EXACT_TIMESTAMP < microseconds < _EXACT_TIMESTAMP:
+        # Several times faster than datetime arithmetic
+        return _fromtimestamp(microseconds / 1e6, tzinfo), pos
+    wall_time = EPOCH + microseconds * _MICROSECOND + minutes * _MINUTE
+    return wall_time.replace(tzinfo=tzinfo), pos
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Type of an ``Optional`` annotation, ``None`` for other annotations."""
+    if get_origin(annotation) is not Union:
+        return None
+    not_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    return not_none_args[0] if len(not_none_args) == 1 else None
+
+
+def _list_item(annotation: Any) -> Any:
+    """Item type of a ``List[...]`` annotation, ``None`` for other annotations."""
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        return args[0] if args else None
+    return None
+
+
+def _kind(annotation: Any) -> str:
+    """Binary layout kind of a type which isn't ``Optional`` or a list."""
+    if annotation in (bool, int, str):
+        return annotation.__name__
+    if not isinstance(annotation, type):
+        return "json"
+    # datetime is a subclass of date
+    for base, kind in (
+        (BaseModel, "model"),
+        (Enum, "enum"),
+        (datetime, "datetime"),
+        (date, "date"),
+    ):
+        if issubclass(annotation, base):
+            return kind
+    return "json"
+
+
+# Statements writing values of the kinds to ``out``
+_WRITERS = {
+    "bool": "out.append(1 if {} else 0)",
+    "int": "_write_int(out, {})",
+    "str": "_write_str(out, {})",
+    "datetime": "_write_datetime(out, {})",
+    "date": "_write_uint(out, {}.toordinal())",
+    "json": "_write_json(out, {})",
+}
+# Conversions of the values of the kinds read as a varint or as length-prefixed bytes
+_UINT_CONVERSIONS = {"int": "({0} >> 1) ^ -({0} & 1)", "date": "_date_fromordinal({0})"}
+_SIZED_CONVERSIONS = {"str": "str({}, 'utf-8')", "json": "_json_loads({})"}
+
+
+class _BinaryCompiler(ConstructorCompiler):
+    """Generates positional binary encoders and decoders of models and nested models.
+
+    Fields are written in the model definition order without keys: integers as
+    zigzag varints, strings and untyped values as JSON prefixed with the varint
+    length, enums as member ordinals, dates as day ordinals, datetimes as epoch
+    microseconds with the UTC offset minutes, optional values after a presence byte and
+    lists after their varint length. Decoders build models without validation.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.namespace.update(
+            _write_uint=write_uint,
+            _write_int=write_int,
+            _write_str=write_str,
+            _write_json=_write_json,
+            _write_datetime=_write_datetime,
+            _write_epoch=_write_epoch,
+            _write_utc_datetime=_write_utc_datetime,
+            _read_uint=read_uint,
+            _read_datetime=_read_datetime,
+            _json_loads=json_loads,
+            _date_fromordinal=date.fromordinal,
+        )
+        self.encoders: Dict[Type[BaseModel], str] = {}
+        self._variables = 0
+
+    def encoder(self, model: Type[BaseModel]) -> Encode:
+        return self._function(self._compile_encoder, model)
+
+    def decoder(self, model: Type[BaseModel]) -> Decode:
+        return self._function(self._compile, model)
+
+    def _caches(self) -> List[Dict[Type[BaseModel], str]]:
+        return [self.constructors, self.encoders]
+
+    def _variable(self, prefix: str) -> str:
+        self._variables += 1
+        return f"{prefix}{self._variables}"
+
+    def _compile_encoder(self, model: Type[BaseModel]) -> str:
+        if model in self.encoders:
+            return self.encoders[model]
+        func_name = self._function_name("_encode", model)
+        self.encoders[model] = func_name
+        hints = get_type_hints(model, include_extras=True)
+        lines = [f"def {func_name}(out, instance):", "    data = instance.__dict__"]
+        for name in model.model_fields:
+            lines += self._write(f"data[{name!r}]", hints[name], "    ")
+        exec("\n".join(lines), self.namespace)  # noqa: S102
+        return func_name
+
+    def _write(self, expr: str, annotation: Any, indent: str) -> List[str]:
+        """Statements writing the ``expr`` value to ``out``."""
+        optional = _unwrap_optional(annotation)
+        if optional is not None:
+            value = self._variable("_o")
+            return [
+                f"{indent}{value} = {expr}",
+                f"{indent}if {value} is None:",
+                f"{indent}    out.append(0)",
+                f"{indent}else:",
+                f"{indent}    out.append(1)",
+                *self._write(value, optional, indent + "    "),
+            ]
+        item_type = _list_item(annotation)
+        if item_type is not None:
+            items, item = self._variable("_l"), self._variable("_i")
+            return [
+                f"{indent}{items} = {expr}",
+                f"{indent}_write_uint(out, len({items}))",
+                f"{indent}for {item} in {items}:",
+                *self._write(item, item_type, indent + "    "),
+            ]
+        return [f"{indent}{self._write_value(expr, annotation)}"]
+
+    def _write_value(self, expr: str, annotation: Any) -> str:
+        if get_origin(annotation) is Annotated:
+            return self._write_annotated(expr, annotation)
+        kind = _kind(annotation)
+        if kind == "model":
+            return f"{self._compile_encoder(annotation)}(out, {expr})"
+        if kind == "enum":
+            ordinals = self._constant({member: index for index, member in enumerate(annotation)})
+            return f"_write_uint(out, {ordinals}[{expr}])"
+        return _WRITERS[kind].format(expr)
+
+    def _write_annotated(self, expr: str, annotation: Any) -> str:
+        """Fields of derived models are written in the layout of the models they replace."""
+        if annotation == EpochMicroseconds:
+            return f"_write_epoch(out, {expr})"
+        if annotation == UTCDateTime:
+            return f"_write_utc_datetime(out, {expr})"
+        return self._write_value(expr, get_args(annotation)[0])
+
+    def _compile(self, model: Type[BaseModel]) -> str:
+        if model in self.constructors:
+            return self.constructors[model]
+        func_name = self._function_name("_decode", model)
+        self.constructors[model] = func_name
+        hints = get_type_hints(model)
+        lines = [f"def {func_name}(buf, pos):"]
+        values = []
+        for index, name in enumerate(model.model_fields):
+            lines += self._read(f"_f{index}", hints[name], "    ")
+            values.append(f"{name!r}: _f{index}")
+        fields_set = self._constant(frozenset(model.model_fields))
+        lines += [
+            f"    instance = _new({self._constant(model)})",
+            f"    _set_dict(instance, {{{', '.join(values)}}})",
+            f"    _set_fields_set(instance, set({fields_set}))",
+            "    _set_extra(instance, None)",
+            f"    _set_private(instance, {self._private(model)})",
+            "    return instance, pos",
+        ]
+        exec("\n".join(lines), self.namespace)  # noqa: S102
+        return func_name
+
+    def _read(self, target: str, annotation: Any, indent: str) -> List[str]:
+        """Statements reading a value into the ``target`` variable and advancing ``pos``."""
+        optional = _unwrap_optional(annotation)
+        if optional is not None:
+            return [
+                f"{indent}pos += 1",
+                f"{indent}if buf[pos - 1]:",
+                *self._read(target, optional, indent + "    "),
+                f"{indent}else:",
+                f"{indent}    {target} = None",
+            ]
+        item_type = _list_item(annotation)
+        if item_type is not None:
+            size, item = self._variable("_n"), self._variable("_i")
+            return [
+                *self._read_uint(size, indent),
+                f"{indent}{target} = []",
+                f"{indent}for _ in range({size}):",
+                *self._read(item, item_type, indent + "    "),
+                f"{indent}    {target}.append({item})",
+            ]
+        return [f"{indent}{line}" for line in self._read_value(target, annotation)]
+
+    def _read_uint(self, target: str, indent: str) -> List[str]:
+        # Most lengths and ordinals take a single byte
+        return [
+            f"{indent}{target} = buf[pos]",
+            f"{indent}if {target} < 0x80:",
+            f"{indent}    pos += 1",
+            f"{indent}else:",
+            f"{indent}    {target}, pos = _read_uint(buf, pos)",
+        ]
+
+    def _read_value(self, target: str, annotation: Any) -> List[str]:
+        kind = _kind(annotation)
+        if kind == "model":
+            return [f"{target}, pos = {self._compile(annotation)}(buf, pos)"]
+        if kind == "enum":
+            members = self._constant(tuple(annotation))
+            return [*self._read_uint(target, ""), f"{target} = {members}[{target}]"]
+        if kind in _SIZED_CONVERSIONS:
+            return self._read_sized(target, _SIZED_CONVERSIONS[kind])
+        if kind in _UINT_CONVERSIONS:
+            conversion = _UINT_CONVERSIONS[kind].format(target)
+            return [*self._read_uint(target, ""), f"{target} = {conversion}"]
+        if kind == "bool":
+            return [f"{target} = buf[pos] == 1", "pos += 1"]
+        return [f"{target}, pos = _read_datetime(buf, pos)"]
+
+    def _read_sized(self, target: str, convert: str) -> List[str]:
+        """Statements reading a length-prefixed value converted from the ``bytes``."""
+        size = self._variable("_n")
+        return [
+            *self._read_uint(size, ""),
+            f"{target} = {convert.format(f'buf[pos:pos + {size}]')}",
+            f"pos += {size}",
+        ]
+
+
+_compiler = _BinaryCompiler()
+
+
+@lru_cache(maxsize=None)
+def _encoder(model: Type[BaseModel]) -> Encode:
+    return _compiler.encoder(model)
+
+
+@lru_cache(maxsize=None)
+def _decoder(model: Type[BaseModel]) -> Decode:
+    return _compiler.decoder(model)
+
+
+def _describe(annotation: Any, described: Set[type]) -> Any:
+    """Hashable description of the binary layout of an annotation."""
+    optional = _unwrap_optional(annotation)
+    if optional is not None:
+        return "optional", _describe(optional, described)
+    item_type = _list_item(annotation)
+    if item_type is not None:
+        return "list", _describe(item_type, described)
+    kind = _kind(annotation)
+    if kind == "model":
+        if annotation in described:
+            return annotation.__name__
+        described.add(annotation)
+        hints = get_type_hints(annotation)
+        fields = tuple(
+            (name, _describe(hints[name], described)) for name in annotation.model_fields
+        )
+        return annotation.__name__, fields
+    if kind == "enum":
+        return annotation.__name__, tuple(member.value for member in annotation)
+    return kind
+
+
+@lru_cache(maxsize=None)
+def schema_hash() -> bytes:
+    """Hash of the binary layout of all hook request models, changes with the models."""
+    layout = [
+        (event_type.value, _describe(model, set()))
+        for event_type, model in HOOK_REQUEST_MODELS.items()
+    ]
+    return blake2b(repr(layout).encode(), digest_size=16).digest()
+
+
+def encode_request(request: HookRequest) -> bytes:
+    """Encode a hook request into a binary record: the event type ordinal and the fields.
+
+    Records have the layout of the usual models, so requests of the models derived
+    from them, e.g. in a timestamp mode, are decoded into the usual models, with the
+    timestamps as UTC datetimes.
+
+    :raises KeyError: if the request has an event type or an enum value unknown to
+        the models
+    :raises TypeError: if the request isn't an instance of the model of its event type
+    """
+    event_type = request.meta.event_type
+    model = HOOK_REQUEST_MODELS[event_type]
+    if not isinstance(request, model):
+        raise TypeError(f"{type(request).__name__} isn't a {model.__name__} or derived from it")
+    out = bytearray()
+    write_uint(out, _EVENT_TYPE_ORDINALS[event_type])
+    _encoder(type(request))(out, request)
+    return bytes(out)
+
+
+def decode_request(record: bytes) -> HookRequest:
+    """Build the hook request of a binary record without validation."""
+    event_type, pos = read_uint(record, 0)
+    request, _ = _decoder(HOOK_REQUEST_MODELS[_EVENT_TYPES[event_type]])(record, pos)
+    return cast(HookRequest, request)
+
+
+@dataclass
+class ArchiveHeader:
+    """Header of a binary archive: the models layout hash and the webhooks ``meta.version``."""
+
+    schema_hash: bytes
+    version: str
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(MAGIC)
+        out.append(FORMAT_VERSION)
+        out += self.schema_hash
+        write_str(out, self.version)
+        return bytes(out)
+
+    @classmethod
+    def read(cls, fileobj: IO[bytes]) -> Optional["ArchiveHeader"]:
+        """Read and check the header of a binary archive, ``None`` for an empty file.
+
+        :raises ValueError: if the file isn't a binary archive of the current models layout
+        """
+        head = fileobj.read(len(MAGIC) + 1)
+        if not head:
+            return None
+        if head != MAGIC + bytes([FORMAT_VERSION]):
+            raise ValueError("Not a binary webhook archive of a supported format version")
+        header = cls(fileobj.read(len(schema_hash())), _read_stream_bytes(fileobj).decode())
+        if header.schema_hash != schema_hash():
+            raise ValueError("The archive was written with another layout of the webhook models")
+        return header
+
+
+def _read_stream_bytes(fileobj: IO[bytes]) -> bytes:
+    """Length-prefixed bytes read from a file."""
+    size = shift = 0
+    while True:
+        byte = fileobj.read(1)
+        if not byte:
+            raise ValueError("Truncated binary webhook archive")
+        size |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            break
+        shift += 7
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary webhook archive")
+    return data
+
+
+def _iter_records(fileobj: IO[bytes], chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+    """Length-prefixed records of a file, which is read by chunks."""
+    buffer = bytearray()
+    pos = 0
+    at_end = False
+    while True:
+        try:
+            size, start = read_uint(buffer, pos)
+            end = start + size
+        except IndexError:
+            end = len(buffer) + 1
+        if end <= len(buffer):
+            yield bytes(buffer[start:end])
+            pos = end
+            continue
+        if at_end:
+            if pos < len(buffer):
+                raise ValueError("Truncated binary webhook archive")
+            return
+        del buffer[:pos]
+        pos = 0
+        chunk = fileobj.read(chunk_size)
+        buffer += chunk
+        at_end = not chunk
+
+
+class BinaryArchiveWriter:
+    """Writes hook requests into a binary archive file, records are length-prefixed.
+
+    The header is written with the first request and carries its ``meta.version``.
+    Records are several times smaller than JSON and are decoded straight into
+    models, so archives can be read back only with the same layout of the models.
+    """
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        self.fileobj = fileobj
+        self.header: Optional[ArchiveHeader] = None
+
+    def write(self, request: HookRequest) -> int:
+        """Append a request, returns the number of written bytes."""
+        out = bytearray()
+        if self.header is None:
+            self.header = ArchiveHeader(schema_hash(), request.meta.version)
+            out += self.header.to_bytes()
+        write_bytes(out, encode_request(request))
+        return self.fileobj.write(out)
+
+    def write_all(self, requests: Iterable[HookRequest]) -> int:
+        return sum(self.write(request) for request in requests)
+
+
+def iter_binary_archive(source: Source) -> Iterator[HookRequest]:
+    """Read a binary archive written by :class:`BinaryArchiveWriter` and yield hook requests.
+
+    :raises ValueError: if the file isn't a binary archive of the current models layout
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fileobj:
+            yield from iter_binary_archive(fileobj)
+        return
+    if ArchiveHeader.read(source) is None:
+        return
+    for record in _iter_records(source):
+        yield decode_request(record)
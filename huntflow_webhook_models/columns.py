@@ -0,0 +1,288 @@
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from importlib import import_module
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+from typing_extensions import get_args, get_origin
+
+from huntflow_webhook_models._codegen import to_date, to_datetime
+from huntflow_webhook_models._paths import get_attribute
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.json_backend import json_loads
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS, HookRequest
+
+# Missing integer and timestamp values, NumPy reads it as NaT in datetime64 arrays
+INT_NULL = -(2**63)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_DATE = date(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _numpy() -> Any:
+    try:
+        return import_module("numpy")
+    except ImportError:
+        raise ImportError("NumPy is required to export columns as NumPy arrays") from None
+
+
+class Column:
+    """Values of one field path of the appended events, ``None`` for missing values."""
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        self.path = path
+        self.values: MutableSequence[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Any) -> None:
+        self.values.append(value)
+
+    def to_numpy(self) -> Any:
+        return _numpy().array(self.values, dtype=object)
+
+
+class IntColumn(Column):
+    """64-bit integers, missing values are stored as ``INT_NULL``."""
+
+    dtype = "int64"
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        self.path = path
+        self.values = array("q")
+
+    def append(self, value: Any) -> None:
+        self.values.append(INT_NULL if value is None else value)
+
+    def to_numpy(self) -> Any:
+        return _numpy().frombuffer(self.values, dtype="int64").view(self.dtype)
+
+
+class TimestampColumn(IntColumn):
+    """Datetimes as UTC epoch microseconds, naive datetimes are treated as UTC.
+
+    Ints are epoch microseconds already, as in requests parsed in the "epoch"
+    timestamp mode.
+    """
+
+    dtype = "datetime64[us]"
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(INT_NULL)
+            return
+        if isinstance(value, int):
+            self.values.append(value)
+            return
+        value = to_datetime(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self.values.append((value - _EPOCH) // _MICROSECOND)
+
+
+class DateColumn(IntColumn):
+    """Dates as days since the epoch."""
+
+    dtype = "datetime64[D]"
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(INT_NULL)
+            return
+        self.values.append((to_date(value) - _EPOCH_DATE).days)
+
+
+class FloatColumn(Column):
+    """Double precision floats, missing values are NaN."""
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        self.path = path
+        self.values = array("d")
+
+    def append(self, value: Any) -> None:
+        self.values.append(float("nan") if value is None else value)
+
+    def to_numpy(self) -> Any:
+        return _numpy().frombuffer(self.values, dtype="float64")
+
+
+class CategoryColumn(Column):
+    """Dictionary encoded enum: codes are indexes in ``categories``, -1 for missing values.
+
+    Values which aren't members of the enum, e.g. from a newer Huntflow version or
+    ``UnknownEnumValue`` of the lenient mode, are added to ``categories`` after the
+    enum members as they are.
+    """
+
+    def __init__(self, path: Tuple[str, ...], enum_cls: Type[Enum]) -> None:
+        self.path = path
+        self.categories: List[Any] = list(enum_cls)
+        # Models have enum members and JSON has values, which hash differently
+        self._codes: Dict[Any, int] = {None: -1}
+        for code, member in enumerate(enum_cls):
+            self._codes[member.value] = self._codes[member] = code
+        self.values = array("h")
+
+    def append(self, value: Any) -> None:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        self.values.append(code)
+
+    def decode(self) -> List[Any]:
+        return [None if code == -1 else self.categories[code] for code in self.values]
+
+    def to_numpy(self) -> Any:
+        return _numpy().frombuffer(self.values, dtype="int16")
+
+
+def _leaf_column(path: Tuple[str, ...], annotation: Any) -> Column:
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return CategoryColumn(path, annotation)
+        if issubclass(annotation, datetime):
+            return TimestampColumn(path)
+        if issubclass(annotation, date):
+            return DateColumn(path)
+        if issubclass(annotation, bool):
+            return Column(path)
+        if issubclass(annotation, int):
+            return IntColumn(path)
+        if issubclass(annotation, float):
+            return FloatColumn(path)
+    return Column(path)
+
+
+def _resolve(model: Type[BaseModel], path: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Column]:
+    """JSON keys of a field path and the column type of its values."""
+    keys = []
+    annotation: Any = model
+    for name in path:
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+            raise ValueError(f"{'.'.join(path)}: {name!r} is not a field of a model")
+        field = annotation.model_fields.get(name)
+        if field is None:
+            raise ValueError(f"{'.'.join(path)}: {annotation.__name__} has no field {name!r}")
+        keys.append(field.alias or name)
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            not_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = not_none_args[0] if len(not_none_args) == 1 else Any
+        if get_origin(annotation) in (list, List):
+            raise ValueError(f"{'.'.join(path)}: list field {name!r} can't be a column")
+    return tuple(keys), _leaf_column(path, annotation)
+
+
+def _get_item(data: Any, keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        if data is None:
+            return None
+        data = data.get(key)
+    return data
+
+
+class ColumnTable:
+    """Columns of the appended events of one event type by field path."""
+
+    def __init__(self, model: Type[BaseModel], paths: Iterable[str]) -> None:
+        self.model = model
+        self.columns: Dict[str, Column] = {}
+        self._json_getters: List[Tuple[Column, Tuple[str, ...]]] = []
+        for dotted_path in paths:
+            path = tuple(dotted_path.split("."))
+            keys, column = _resolve(model, path)
+            self.columns[dotted_path] = column
+            self._json_getters.append((column, keys))
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, path: str) -> Column:
+        return self.columns[path]
+
+    def append_data(self, data: Mapping[str, Any]) -> None:
+        """Append values from a decoded JSON body, it isn't validated."""
+        for column, keys in self._json_getters:
+            column.append(_get_item(data, keys))
+        self.rows += 1
+
+    def append_model(self, request: BaseModel) -> None:
+        for column in self.columns.values():
+            column.append(get_attribute(request, column.path))
+        self.rows += 1
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Columns as NumPy arrays, integer columns and timestamps are not copied."""
+        return {path: column.to_numpy() for path, column in self.columns.items()}
+
+
+class ColumnarBuilder:
+    """Collects selected fields of hook events into typed columns per event type.
+
+    ``columns`` maps event types to dotted field paths, e.g. ``"event.applicant.id"``.
+    Column types follow the model fields: integers and datetimes go to ``array("q")``
+    (datetimes as UTC epoch microseconds), enums to dictionary encoded ``array("h")``
+    codes, other values to lists. Events of other types are skipped.
+    """
+
+    def __init__(
+        self,
+        columns: Union[Mapping[WebhookEventType, Sequence[str]], Mapping[str, Sequence[str]]],
+    ) -> None:
+        self.tables: Dict[WebhookEventType, ColumnTable] = {}
+        for event_type, paths in columns.items():
+            event_type = WebhookEventType(event_type)
+            self.tables[event_type] = ColumnTable(HOOK_REQUEST_MODELS[event_type], paths)
+        # Event type values are looked up straight from the decoded JSON
+        self._tables_by_value = {
+            event_type.value: table for event_type, table in self.tables.items()
+        }
+
+    def __getitem__(self, event_type: Union[WebhookEventType, str]) -> ColumnTable:
+        return self.tables[WebhookEventType(event_type)]
+
+    def append_json(self, raw: Union[str, bytes]) -> None:
+        """Append a raw webhook body, decoding it without building models or validation.
+
+        The body is expected to be valid, e.g. archived after validation.
+        """
+        self.append_data(json_loads(raw))
+
+    def append_data(self, data: Mapping[str, Any]) -> None:
+        table = self._tables_by_value.get(data["meta"]["event_type"])
+        if table is not None:
+            table.append_data(data)
+
+    def append(self, request: HookRequest) -> None:
+        """Append a validated hook request model."""
+        table = self.tables.get(request.meta.event_type)
+        if table is not None:
+            table.append_model(request)
+
+    def extend_json(self, bodies: Iterable[Union[str, bytes]]) -> "ColumnarBuilder":
+        append_json = self.append_json
+        for raw in bodies:
+            append_json(raw)
+        return self
+
+    def extend(self, requests: Iterable[HookRequest]) -> "ColumnarBuilder":
+        append = self.append
+        for request in requests:
+            append(request)
+        return self
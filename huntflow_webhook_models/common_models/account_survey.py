@@ -1,9 +1,11 @@
 from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 
-class SurveySchema(BaseModel):
+
+class SurveySchema(HuntflowBaseModel):
     type: str = Field(
         ...,
         description="Recruitment evaluation survey schema type",
@@ -26,7 +28,7 @@ class SurveySchema(BaseModel):
     )
 
 
-class AccountSurvey(BaseModel):
+class AccountSurvey(HuntflowBaseModel):
     id: int = Field(..., description="Recruitment evaluation survey ID", examples=[1])
     name: str = Field(
         ...,
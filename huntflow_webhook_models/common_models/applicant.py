@@ -1,16 +1,16 @@
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.common_models.calendar_event import ApplicantLogCalendarEvent
-from huntflow_webhook_models.common_models.hf_base import File, VacancyQuotaItem
+from huntflow_webhook_models.common_models.hf_base import File, HuntflowBaseModel, VacancyQuotaItem
 from huntflow_webhook_models.common_models.survey_questionary import SurveyQuestionary
 from huntflow_webhook_models.common_models.vacancy import Vacancy
 from huntflow_webhook_models.consts import AgreementState, ApplicantLogType, SurveyType
 
 
-class ApplicantSocial(BaseModel):
+class ApplicantSocial(HuntflowBaseModel):
     id: int = Field(..., description="Social ID", examples=[1])
     social_type: str = Field(..., description="Social type", examples=["TELEGRAM"])
     value: str = Field(..., description="Social nick/email", examples=["test_tg"])
@@ -22,7 +22,7 @@ class ApplicantSocial(BaseModel):
     )
 
 
-class ApplicantPDAgreement(BaseModel):
+class ApplicantPDAgreement(HuntflowBaseModel):
     state: Optional[AgreementState] = Field(
         None,
         description="Agreement state",
@@ -35,7 +35,7 @@ class ApplicantPDAgreement(BaseModel):
     )
 
 
-class VacancyApplicantStatus(BaseModel):
+class VacancyApplicantStatus(HuntflowBaseModel):
     id: int = Field(..., description="Status ID", examples=[1])
     name: str = Field(..., description="Status name", examples=["hired"])
 
@@ -44,7 +44,7 @@ class ApplicantPhoto(File):
     pass
 
 
-class ApplicantExternalAccountSource(BaseModel):
+class ApplicantExternalAccountSource(HuntflowBaseModel):
     id: int = Field(..., description="Applicant external account source ID", examples=[1])
     name: Optional[str] = Field(
         ...,
@@ -53,7 +53,7 @@ class ApplicantExternalAccountSource(BaseModel):
     )
 
 
-class ApplicantExternalAccount(BaseModel):
+class ApplicantExternalAccount(HuntflowBaseModel):
     id: int = Field(..., description="External ID", examples=[1])
     auth_type: str = Field(..., description="Authentication type", examples=["NATIVE"])
     account_source: Optional[ApplicantExternalAccountSource] = Field(
@@ -67,7 +67,7 @@ class ApplicantExternalAccount(BaseModel):
     )
 
 
-class Applicant(BaseModel):
+class Applicant(HuntflowBaseModel):
     id: int = Field(..., description="Applicant ID", examples=[1])
     email: Optional[str] = Field(
         None,
@@ -123,14 +123,14 @@ class Applicant(BaseModel):
     externals: Optional[List[ApplicantExternalAccount]] = None
 
 
-class Respondent(BaseModel):
+class Respondent(HuntflowBaseModel):
     account_id: int = Field(..., description="Account ID", examples=[1])
     custom_id: Optional[int] = Field(None, description="Custom ID", examples=[1])
     name: Optional[str] = Field(None, description="Respondent name", examples=["John"])
     email: str = Field(..., description="Respondent email", examples=["test@example.com"])
 
 
-class Survey(BaseModel):
+class Survey(HuntflowBaseModel):
     id: int = Field(..., description="Survey ID", examples=[1])
     name: str = Field(..., description="Survey name", examples=["test"])
     title: Optional[str] = Field(None, description="Survey title", examples=["title"])
@@ -148,7 +148,7 @@ class Survey(BaseModel):
     active: bool = Field(..., description="Active flag", examples=[True])
 
 
-class SurveyAnswerOfTypeA(BaseModel):
+class SurveyAnswerOfTypeA(HuntflowBaseModel):
     id: int = Field(..., description="Survey answer ID", examples=[1])
     respondent: Respondent = Field(..., description="Survey respondent data")
     survey: Survey = Field(..., description="Survey data")
@@ -169,12 +169,12 @@ class SurveyAnswerOfTypeA(BaseModel):
     )
 
 
-class RejectionReason(BaseModel):
+class RejectionReason(HuntflowBaseModel):
     id: int = Field(..., description="Rejection reason ID", examples=[1])
     name: str = Field(..., description="Rejection reason name", examples=["Too far"])
 
 
-class ApplicantLog(BaseModel):
+class ApplicantLog(HuntflowBaseModel):
     id: int = Field(..., description="Applicant log ID", examples=[1])
     type: ApplicantLogType = Field(
         ...,
@@ -223,7 +223,7 @@ class ApplicantLog(BaseModel):
     )
 
 
-class ApplicantTag(BaseModel):
+class ApplicantTag(HuntflowBaseModel):
     id: int = Field(..., description="Tag ID", examples=[1])
     name: str = Field(..., description="Tag name", examples=["COOL"])
     color: str = Field(..., description="Tag color", examples=["000000"])
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.consts import ApplicantOfferLogTypes
 
 
-class AccountApplicantOfferLog(BaseModel):
+class AccountApplicantOfferLog(HuntflowBaseModel):
     id: int = Field(..., description="Log ID", examples=[1])
     type: ApplicantOfferLogTypes = Field(
         ...,
@@ -15,7 +16,7 @@ class AccountApplicantOfferLog(BaseModel):
     )
 
 
-class ApplicantOffer(BaseModel):
+class ApplicantOffer(HuntflowBaseModel):
     id: int = Field(..., description="Offer ID", examples=[1])
     account_applicant_offer_log: AccountApplicantOfferLog = Field(
         ...,
@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.consts import (
     CalendarEventReminderMethod,
     CalendarEventState,
@@ -12,7 +13,7 @@ from huntflow_webhook_models.consts import (
 )
 
 
-class CalendarEventCreator(BaseModel):
+class CalendarEventCreator(HuntflowBaseModel):
     displayName: Optional[str] = Field(
         None,
         description="Event creator name",
@@ -26,7 +27,7 @@ class CalendarEventCreator(BaseModel):
     )
 
 
-class CalendarEventAttendee(BaseModel):
+class CalendarEventAttendee(HuntflowBaseModel):
     contact_id: Optional[int] = Field(None, description="Attendee contact ID", examples=[1])
     displayName: Optional[str] = Field(None, description="Attendee display name", examples=["John"])
     email: Optional[str] = Field(None, description="Attendee email", examples=["test@email.com"])
@@ -41,7 +42,7 @@ class CalendarEventAttendee(BaseModel):
     )
 
 
-class Conference(BaseModel):
+class Conference(HuntflowBaseModel):
     id: int = Field(..., description="Conference ID", examples=[1])
     topic: Optional[str] = Field(None, description="Conference topic", examples=["Interview"])
     auth_type: Optional[str] = Field(None, description="Conference venue", examples=["ZOOM"])
@@ -90,7 +91,7 @@ class Conference(BaseModel):
     )
 
 
-class CalendarEventReminder(BaseModel):
+class CalendarEventReminder(HuntflowBaseModel):
     method: CalendarEventReminderMethod = Field(
         ...,
         description="Reminder method",
@@ -113,12 +114,12 @@ class CalendarEventReminder(BaseModel):
     )
 
 
-class InterviewType(BaseModel):
+class InterviewType(HuntflowBaseModel):
     id: int = Field(..., description="Interview type ID", examples=[1])
     name: str = Field(..., description="Interview type name", examples=["Phone Interview"])
 
 
-class ApplicantLogCalendarEvent(BaseModel):
+class ApplicantLogCalendarEvent(HuntflowBaseModel):
     id: int = Field(..., description="Calendar event ID", examples=[1])
     name: Optional[str] = Field(None, description="Event name", examples=["Test Name"])
     description: Optional[str] = Field(
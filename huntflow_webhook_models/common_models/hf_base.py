@@ -1,17 +1,32 @@
+import os
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+DEFER_BUILD_ENV = "HUNTFLOW_WEBHOOK_MODELS_DEFER_BUILD"
 
-class File(BaseModel):
+
+class HuntflowBaseModel(BaseModel):
+    """Base model of all webhook models.
+
+    Set ``HUNTFLOW_WEBHOOK_MODELS_DEFER_BUILD=1`` before the models are imported
+    to postpone building validators until first use or an explicit ``warmup()``.
+    """
+
+    model_config = ConfigDict(
+        defer_build=os.environ.get(DEFER_BUILD_ENV, "").lower() in ("1", "true", "yes"),
+    )
+
+
+class File(HuntflowBaseModel):
     id: int = Field(..., description="File ID", examples=[1])
     content_type: str = Field(..., description="MIME type", examples=["image/jpeg"])
     name: str = Field(..., description="Filename", examples=["test_file.jpeg"])
     url: str = Field(..., description="File url", examples=["https://domain/file/1"])
 
 
-class AccountInfo(BaseModel):
+class AccountInfo(HuntflowBaseModel):
     id: int = Field(..., description="Account ID", examples=[1])
     name: str = Field(..., description="Account owner name", examples=["John"])
     email: Optional[str] = Field(
@@ -21,7 +36,7 @@ class AccountInfo(BaseModel):
     )
 
 
-class AccountSource(BaseModel):
+class AccountSource(HuntflowBaseModel):
     id: int = Field(..., description="Resume source ID", examples=[1])
     foreign: Optional[str] = Field(
         None,
@@ -32,7 +47,7 @@ class AccountSource(BaseModel):
     type: str = Field(..., description="Applicant source type", examples=["user"])
 
 
-class VacancyQuotaBase(BaseModel):
+class VacancyQuotaBase(HuntflowBaseModel):
     id: int = Field(..., description="Fill quota ID")
     vacancy_frame: int = Field(..., description="Vacancy frame ID")
     vacancy_request: Optional[int] = Field(None, description="Vacancy request ID")
@@ -66,6 +81,6 @@ class VacancyQuotaItem(VacancyQuotaBase):
     account_info: AccountInfo
 
 
-class DivisionItem(BaseModel):
+class DivisionItem(HuntflowBaseModel):
     id: int = Field(..., description="Account division ID", examples=[1])
     name: str = Field(..., description="Account division name", examples=["IT Department"])
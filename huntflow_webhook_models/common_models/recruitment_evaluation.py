@@ -1,14 +1,15 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.common_models.account_survey import AccountSurvey
 from huntflow_webhook_models.common_models.applicant import Applicant
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.survey_answer import SurveyAnswer, SurveyAnswerRequest
 from huntflow_webhook_models.common_models.vacancy import Vacancy
 
 
-class RecruitmentEvaluation(BaseModel):
+class RecruitmentEvaluation(HuntflowBaseModel):
     id: int = Field(..., description="Recruitment evaluation ID", examples=[1])
     account_survey: AccountSurvey = Field(
         ...,
@@ -2,9 +2,8 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic.fields import Field
-from pydantic.main import BaseModel
 
-from huntflow_webhook_models.common_models.hf_base import AccountSource
+from huntflow_webhook_models.common_models.hf_base import AccountSource, HuntflowBaseModel
 from huntflow_webhook_models.common_models.vacancy import Vacancy
 from huntflow_webhook_models.consts import (
     ApplicantResponseExternalStatus,
@@ -12,7 +11,7 @@ from huntflow_webhook_models.consts import (
 )
 
 
-class ApplicantExternalResponse(BaseModel):
+class ApplicantExternalResponse(HuntflowBaseModel):
     id: int = Field(..., description="Applicant source ID", examples=[1])
     created: datetime = Field(
         ...,
@@ -47,14 +46,14 @@ class ApplicantExternalResponse(BaseModel):
     )
 
 
-class AccountVacancyExternal(BaseModel):
+class AccountVacancyExternal(HuntflowBaseModel):
     id: int = Field(..., description="Account vacancy external ID", examples=[1])
     account_source: AccountSource = Field(..., description="Vacancy account source")
     auth_type: str = Field(..., description="Authentication type", examples=["NATIVE"])
     name: str = Field(..., description="Account vacancy external name", examples=["HeadHunter"])
 
 
-class VacancyExternal(BaseModel):
+class VacancyExternal(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy external ID", examples=[1])
     account_vacancy_external: AccountVacancyExternal = Field(
         ...,
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.consts import SurveyAnswerRequestState
 
 
-class SurveyAnswerRespondent(BaseModel):
+class SurveyAnswerRespondent(HuntflowBaseModel):
     id: int = Field(..., description="Respondent ID", examples=[1])
     account_id: Optional[int] = Field(None, description="Respondent account ID", examples=[1])
     custom_id: Optional[str] = Field(
@@ -18,7 +19,7 @@ class SurveyAnswerRespondent(BaseModel):
     email: str = Field(..., description="Respondent email", examples=["test@email.com"])
 
 
-class SurveyAnswerRequest(BaseModel):
+class SurveyAnswerRequest(HuntflowBaseModel):
     id: int = Field(..., description="Recruitment evaluation request ID", examples=[1])
     respondent: Optional[SurveyAnswerRespondent] = None
     created: datetime = Field(
@@ -29,11 +30,11 @@ class SurveyAnswerRequest(BaseModel):
     state: SurveyAnswerRequestState = Field(..., description="Survey answer request state")
 
 
-class SurveyAnswerData(BaseModel):
+class SurveyAnswerData(HuntflowBaseModel):
     comment: str = Field(..., description="Survey answer comment", examples=["Great job"])
 
 
-class SurveyAnswer(BaseModel):
+class SurveyAnswer(HuntflowBaseModel):
     id: int = Field(..., description="Recruitment evaluation answer ID", examples=[1])
     respondent: SurveyAnswerRespondent = Field(..., description="Respondent")
     created: datetime = Field(
@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 
-class Survey(BaseModel):
+
+class Survey(HuntflowBaseModel):
     __survey_schema_example = {
         "type": "object",
         "required": ["d4hm5pRsbXPEQUSyiqXJA"],
@@ -53,17 +55,17 @@ class Survey(BaseModel):
     type: str = Field("type_q", description="Survey type (always type_q)", examples=["type_q"])
 
 
-class Respondent(BaseModel):
+class Respondent(HuntflowBaseModel):
     applicant_id: int = Field(..., description="Applicant ID", examples=[1])
     name: str = Field(..., description="Applicant name", examples=["John"])
 
 
-class CreatedBy(BaseModel):
+class CreatedBy(HuntflowBaseModel):
     account_id: int = Field(..., description="Account ID", examples=[1])
     name: str = Field(..., description="Creator name", examples=["John"])
 
 
-class Answer(BaseModel):
+class Answer(HuntflowBaseModel):
     id: int = Field(..., description="Answer ID", examples=[1])
     created: datetime = Field(
         ...,
@@ -77,7 +79,7 @@ class Answer(BaseModel):
     )
 
 
-class SurveyQuestionary(BaseModel):
+class SurveyQuestionary(HuntflowBaseModel):
     id: int = Field(..., description="Survey questionary ID", examples=[1])
     survey: Survey
     created: datetime = Field(
@@ -1,14 +1,18 @@
 from datetime import date, datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from huntflow_webhook_models.common_models.hf_base import DivisionItem, VacancyQuotaItem
+from huntflow_webhook_models.common_models.hf_base import (
+    DivisionItem,
+    HuntflowBaseModel,
+    VacancyQuotaItem,
+)
 from huntflow_webhook_models.common_models.vacancy_request import VacancyRequest
 from huntflow_webhook_models.consts import VacancyState
 
 
-class FillQuota(BaseModel):
+class FillQuota(HuntflowBaseModel):
     id: int = Field(..., description="Fill quota ID", examples=[1])
     applicants_to_hire: int = Field(..., description="Amount of applicant to hire", examples=[1])
     closed: Optional[datetime] = Field(
@@ -33,7 +37,7 @@ class FillQuota(BaseModel):
     )
 
 
-class AccountRegion(BaseModel):
+class AccountRegion(HuntflowBaseModel):
     id: int = Field(..., description="Account region ID", examples=[1])
     name: str = Field(..., description="Account region name", examples=["Turkey"])
 
@@ -46,7 +50,7 @@ class AccountDivision(DivisionItem):
     full_path: List[DivisionPathItem] = Field([], description="Division full path")
 
 
-class Vacancy(BaseModel):
+class Vacancy(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy ID", examples=[1])
     account_division: Optional[AccountDivision] = Field(
         None,
@@ -112,17 +116,17 @@ class Vacancy(BaseModel):
     )
 
 
-class VacancyCloseReason(BaseModel):
+class VacancyCloseReason(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy close reason ID", examples=[1])
     name: str = Field(..., description="Vacancy close reason name", examples=["All hired"])
 
 
-class VacancyHoldReason(BaseModel):
+class VacancyHoldReason(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy hold reason ID", examples=[1])
     name: str = Field(..., description="Vacancy hold reason name", examples=["Cancel budget"])
 
 
-class VacancyLog(BaseModel):
+class VacancyLog(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy log ID", examples=[1])
     state: VacancyState = Field(
         ...,
@@ -1,13 +1,13 @@
 import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from huntflow_webhook_models.common_models.hf_base import AccountInfo, File
+from huntflow_webhook_models.common_models.hf_base import AccountInfo, File, HuntflowBaseModel
 from huntflow_webhook_models.consts import VacancyRequestLogAction, VacancyRequestStatus
 
 
-class VacancyRequestApprovalState(BaseModel):
+class VacancyRequestApprovalState(HuntflowBaseModel):
     id: int = Field(..., description="Approval ID")
 
     status: VacancyRequestStatus = Field(..., description="Approval status")
@@ -26,7 +26,7 @@ class VacancyRequestApprovalState(BaseModel):
     )
 
 
-class VacancyRequest(BaseModel):
+class VacancyRequest(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy request ID", examples=[1])
     account_vacancy_request: int = Field(
         ...,
@@ -62,7 +62,7 @@ class VacancyRequest(BaseModel):
     files: List[File] = Field([], description="List of uploaded files")
 
 
-class VacancyRequestLog(BaseModel):
+class VacancyRequestLog(HuntflowBaseModel):
     id: int = Field(..., description="Vacancy request log ID", examples=[1])
     action: VacancyRequestLogAction = Field(
         ...,
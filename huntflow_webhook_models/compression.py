@@ -0,0 +1,287 @@
+import os
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from huntflow_webhook_models._varint import read_uint, write_bytes, write_str, write_uint
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
+from huntflow_webhook_models.consts import WebhookEventType
+
+# Preset dictionaries longer than the deflate window are never referenced in full
+MAX_DICTIONARY_SIZE = 32 * 1024
+NO_DICTIONARY = 0
+DICTIONARIES_MAGIC = b"HFZD"
+DICTIONARIES_VERSION = 1
+
+_WINDOW_BITS = -15  # Raw deflate, the dictionary ID replaces the zlib header
+_DICTIONARIES_HEAD = DICTIONARIES_MAGIC + bytes([DICTIONARIES_VERSION])
+# JSON fragments up to and including a delimiter: keys, values and punctuation
+_TOKEN_RE = re.compile(rb'(?:"(?:[^"\\]|\\.)*"|[^,:{}\[\]"])*[,:{}\[\]]?')
+
+
+class _MetaEventType(HuntflowBaseModel):
+    event_type: str
+
+
+class _EventTypeEnvelope(HuntflowBaseModel):
+    """Only the event type of the body, the rest is ignored."""
+
+    meta: _MetaEventType
+
+
+@lru_cache(maxsize=None)
+def _get_event_type_adapter() -> TypeAdapter[_EventTypeEnvelope]:
+    return TypeAdapter(_EventTypeEnvelope)
+
+
+def _grams(tokens: List[bytes], max_tokens: int) -> Iterable[bytes]:
+    for start in range(len(tokens)):
+        for stop in range(start + 1, min(start + max_tokens, len(tokens)) + 1):
+            yield b"".join(tokens[start:stop])
+
+
+def train_dictionary(
+    samples: Iterable[bytes],
+    size: int = 16 * 1024,
+    max_tokens: int = 6,
+) -> bytes:
+    """Build a preset deflate dictionary of the JSON fragments common to the samples.
+
+    Sequences of up to ``max_tokens`` JSON tokens found in at least two samples are
+    scored by the number of samples having them times their length. The best ones
+    are concatenated up to ``size`` bytes, the best last, as deflate encodes closer
+    matches shorter.
+    """
+    size = min(size, MAX_DICTIONARY_SIZE)
+    counts: "Counter[bytes]" = Counter()
+    for sample in samples:
+        tokens = [token for token in _TOKEN_RE.findall(sample) if token]
+        counts.update(set(_grams(tokens, max_tokens)))
+    scored = sorted(
+        ((count * len(gram), gram) for gram, count in counts.items() if count > 1),
+        reverse=True,
+    )
+    chosen: List[bytes] = []
+    total = 0
+    for _, gram in scored:
+        if total + len(gram) > size:
+            continue
+        # Fragments of the chosen sequences are matched inside them anyway
+        if any(gram in other for other in chosen):
+            continue
+        chosen.append(gram)
+        total += len(gram)
+    return b"".join(reversed(chosen))
+
+
+def _event_type_key(event_type: Union[WebhookEventType, str]) -> str:
+    # Event types unknown to the library get dictionaries too
+    return event_type.value if isinstance(event_type, WebhookEventType) else event_type
+
+
+def _read_bytes(data: bytes, pos: int) -> Tuple[bytes, int]:
+    size, start = read_uint(data, pos)
+    end = start + size
+    if end > len(data):
+        raise IndexError(end)
+    return data[start:end], end
+
+
+@dataclass(frozen=True)
+class CompressionDictionary:
+    """Preset dictionary of an event type, ``id`` is written before each compressed payload."""
+
+    id: int
+    event_type: str
+    data: bytes
+
+
+class PayloadCompressor:
+    """Compresses single webhook bodies with preset dictionaries per event type.
+
+    Small payloads compress poorly on their own, since deflate has to spell out each
+    key and enum value at least once. A dictionary trained on sample payloads with
+    :meth:`train` holds the repeated keys, values and nested shapes, so they are
+    encoded as back-references from the first byte.
+
+    Each dictionary gets a new ID, which prefixes the payloads compressed with it.
+    Training again adds new dictionaries, which are used for compression from then
+    on, while the old ones are kept to decompress the payloads compressed before.
+    Keep the dictionaries with :meth:`save`, payloads can't be decompressed without
+    them. Event types without a dictionary are compressed without one.
+    """
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+        self.dictionaries: Dict[int, CompressionDictionary] = {}
+        self._current: Dict[str, CompressionDictionary] = {}
+        self._compressors: Dict[int, "zlib._Compress"] = {}
+        self._decompressors: Dict[int, "zlib._Decompress"] = {}
+
+    def add(
+        self,
+        event_type: Union[WebhookEventType, str],
+        data: bytes,
+    ) -> CompressionDictionary:
+        """Register a dictionary of the event type, it's used for compression from now on."""
+        if not data:
+            raise ValueError("A compression dictionary can't be empty")
+        dictionary = CompressionDictionary(
+            max(self.dictionaries, default=NO_DICTIONARY) + 1,
+            _event_type_key(event_type),
+            data[-MAX_DICTIONARY_SIZE:],
+        )
+        self._register(dictionary)
+        return dictionary
+
+    def _register(self, dictionary: CompressionDictionary) -> None:
+        self.dictionaries[dictionary.id] = dictionary
+        current = self._current.get(dictionary.event_type)
+        if current is None or current.id < dictionary.id:
+            self._current[dictionary.event_type] = dictionary
+
+    def train(
+        self,
+        samples: Iterable[bytes],
+        size: int = 16 * 1024,
+    ) -> Dict[str, CompressionDictionary]:
+        """Train and add a dictionary for each event type of the sample bodies.
+
+        A few hundred samples of an event type are usually enough.
+        """
+        by_event_type: Dict[str, List[bytes]] = {}
+        for sample in samples:
+            by_event_type.setdefault(self.event_type(sample), []).append(sample)
+        trained = {}
+        for event_type, event_samples in by_event_type.items():
+            data = train_dictionary(event_samples, size)
+            if data:
+                trained[event_type] = self.add(event_type, data)
+        return trained
+
+    @staticmethod
+    def event_type(raw: bytes) -> str:
+        """Event type of a webhook body, only ``meta.event_type`` is validated.
+
+        :raises pydantic.ValidationError: if the body has no event type
+        """
+        return _get_event_type_adapter().validate_json(raw).meta.event_type
+
+    def compress(
+        self,
+        raw: bytes,
+        event_type: Union[WebhookEventType, str, None] = None,
+    ) -> bytes:
+        """Compress a webhook body with the current dictionary of its event type.
+
+        Pass ``event_type`` if it's known, otherwise it's read from the body.
+        """
+        if event_type is None:
+            event_type = self.event_type(raw)
+        dictionary = self._current.get(_event_type_key(event_type))
+        dictionary_id = NO_DICTIONARY if dictionary is None else dictionary.id
+        compressor = self._compressors.get(dictionary_id)
+        if compressor is None:
+            compressor = self._compressor(dictionary)
+        # Copies of a compressor primed with the dictionary skip hashing it again
+        compress = compressor.copy()
+        out = bytearray()
+        write_uint(out, dictionary_id)
+        out += compress.compress(raw)
+        out += compress.flush()
+        return bytes(out)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress a body compressed with :meth:`compress` with any known dictionary.
+
+        :raises ValueError: if the dictionary is unknown or the data is corrupted
+        """
+        try:
+            dictionary_id, pos = read_uint(data, 0)
+        except IndexError:
+            raise ValueError("Empty compressed payload") from None
+        decompressor = self._decompressors.get(dictionary_id)
+        if decompressor is None:
+            decompressor = self._decompressor(dictionary_id)
+        decompress = decompressor.copy()
+        try:
+            raw = decompress.decompress(data[pos:]) + decompress.flush()
+        except zlib.error as exc:
+            raise ValueError(f"Corrupted compressed payload: {exc}") from None
+        if not decompress.eof:
+            raise ValueError("Truncated compressed payload")
+        return raw
+
+    def _compressor(self, dictionary: Optional[CompressionDictionary]) -> "zlib._Compress":
+        if dictionary is None:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, _WINDOW_BITS)
+            self._compressors[NO_DICTIONARY] = compressor
+        else:
+            compressor = zlib.compressobj(
+                self.level,
+                zlib.DEFLATED,
+                _WINDOW_BITS,
+                zdict=dictionary.data,
+            )
+            self._compressors[dictionary.id] = compressor
+        return compressor
+
+    def _decompressor(self, dictionary_id: int) -> "zlib._Decompress":
+        if dictionary_id == NO_DICTIONARY:
+            decompressor = zlib.decompressobj(_WINDOW_BITS)
+        else:
+            dictionary = self.dictionaries.get(dictionary_id)
+            if dictionary is None:
+                raise ValueError(f"Unknown compression dictionary {dictionary_id}")
+            decompressor = zlib.decompressobj(_WINDOW_BITS, zdict=dictionary.data)
+        self._decompressors[dictionary_id] = decompressor
+        return decompressor
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Persist the dictionaries.
+
+        The file starts with a magic and a version, followed by the ID, the event
+        type and the raw ``zdict`` bytes of each dictionary, all length-prefixed.
+        """
+        out = bytearray(_DICTIONARIES_HEAD)
+        for dictionary in self.dictionaries.values():
+            write_uint(out, dictionary.id)
+            write_str(out, dictionary.event_type)
+            write_bytes(out, dictionary.data)
+        temporary_path = f"{os.fspath(path)}.tmp"
+        with open(temporary_path, "wb") as fileobj:
+            fileobj.write(out)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"], level: int = 6) -> "PayloadCompressor":
+        """Load dictionaries saved with :meth:`save`.
+
+        :raises ValueError: if the file isn't a dictionaries file or is truncated
+        """
+        compressor = cls(level)
+        with open(path, "rb") as fileobj:
+            data = fileobj.read()
+        if not data.startswith(_DICTIONARIES_HEAD):
+            raise ValueError(f"{os.fspath(path)} is not a compression dictionaries file")
+        pos = len(_DICTIONARIES_HEAD)
+        try:
+            while pos < len(data):
+                dictionary_id, pos = read_uint(data, pos)
+                event_type, pos = _read_bytes(data, pos)
+                zdict, pos = _read_bytes(data, pos)
+                compressor._register(
+                    CompressionDictionary(dictionary_id, event_type.decode(), zdict),
+                )
+        except IndexError:
+            raise ValueError(f"Truncated compression dictionaries file {os.fspath(path)}") from None
+        return compressor
+
+    def current(self, event_type: Union[WebhookEventType, str]) -> Optional[CompressionDictionary]:
+        """Dictionary used to compress bodies of the event type, ``None`` if there is none."""
+        return self._current.get(_event_type_key(event_type))
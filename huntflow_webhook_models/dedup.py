@@ -0,0 +1,158 @@
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from huntflow_webhook_models.base import WebhookMetaInfoBase
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
+
+EventKey = Tuple[int, str]
+
+
+class _AccountKey(HuntflowBaseModel):
+    id: int
+
+
+class _MetaKey(HuntflowBaseModel):
+    account: _AccountKey
+    event_id: str
+    retry: int
+
+
+class _EventKeyEnvelope(HuntflowBaseModel):
+    """Only the meta fields needed for deduplication, the rest of the body is ignored."""
+
+    meta: _MetaKey
+
+
+@lru_cache(maxsize=None)
+def _get_event_key_adapter() -> TypeAdapter[_EventKeyEnvelope]:
+    return TypeAdapter(_EventKeyEnvelope)
+
+
+@dataclass
+class DedupStats:
+    """Counters of an event deduplicator."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bloom_hits: int = 0
+
+
+class BloomFilter:
+    """Probabilistic set of event keys with no false negatives.
+
+    It takes a fixed amount of memory, about 1.8 bytes per key for the default
+    0.1% false positive rate, and can't remove keys. The rate grows above
+    ``error_rate`` when more than ``capacity`` keys are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: EventKey) -> Iterator[int]:
+        account_id, event_id = key
+        digest = blake2b(f"{account_id}:{event_id}".encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self.size for index in range(self.hash_count))
+
+    def add(self, key: EventKey) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: EventKey) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class EventDeduplicator:
+    """Remembers delivered events to drop redeliveries of the same event.
+
+    Events are identified by ``(meta.account.id, meta.event_id)``. Recent keys are kept
+    in an LRU cache of at most ``maxsize`` keys for ``ttl`` seconds since the last
+    delivery. Keys evicted from the cache are added to the optional ``bloom`` filter,
+    which answers for a longer horizon at the cost of rare false positives. First
+    deliveries (``meta.retry == 0``) are never checked against the Bloom filter, so
+    a false positive can only drop a retry. The deduplicator is not thread safe.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        ttl: Optional[float] = 24 * 60 * 60,
+        bloom: Optional[BloomFilter] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.bloom = bloom
+        self.clock = clock
+        self.stats = DedupStats()
+        self._expires: "OrderedDict[EventKey, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def is_duplicate(self, account_id: int, event_id: str, retry: Optional[int] = None) -> bool:
+        """Return whether the event was delivered before and remember its delivery.
+
+        Pass ``retry`` from the meta to skip the Bloom filter lookup for first deliveries.
+        """
+        key = (account_id, event_id)
+        now = self.clock()
+        self._expire(now)
+        expires = math.inf if self.ttl is None else now + self.ttl
+        if key in self._expires:
+            self._expires[key] = expires
+            self._expires.move_to_end(key)
+            self.stats.hits += 1
+            return True
+        if self.bloom is not None and retry != 0 and key in self.bloom:
+            self.stats.bloom_hits += 1
+            return True
+        self._expires[key] = expires
+        if len(self._expires) > self.maxsize:
+            self._evict(self._expires.popitem(last=False)[0])
+        self.stats.misses += 1
+        return False
+
+    def is_duplicate_meta(self, meta: WebhookMetaInfoBase) -> bool:
+        """Check a validated hook request meta, see :meth:`is_duplicate`."""
+        return self.is_duplicate(meta.account.id, meta.event_id, meta.retry)
+
+    def is_duplicate_raw(self, raw: Union[str, bytes]) -> bool:
+        """Check a raw webhook body validating only the meta fields of the event key.
+
+        Use it before validating the body, to skip validation of redelivered events.
+        """
+        meta = _get_event_key_adapter().validate_json(raw).meta
+        return self.is_duplicate(meta.account.id, meta.event_id, meta.retry)
+
+    def clear(self) -> None:
+        """Forget all cached keys, the Bloom filter and counters are kept."""
+        self._expires.clear()
+
+    def _expire(self, now: float) -> None:
+        expires = self._expires
+        while expires:
+            key, expires_at = next(iter(expires.items()))
+            if expires_at > now:
+                return
+            del expires[key]
+            self._evict(key)
+
+    def _evict(self, key: EventKey) -> None:
+        self.stats.evictions += 1
+        if self.bloom is not None:
+            self.bloom.add(key)
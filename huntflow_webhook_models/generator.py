@@ -0,0 +1,271 @@
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from itertools import count as counter
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from typing_extensions import get_args, get_origin
+
+from huntflow_webhook_models.common_models.vacancy import Vacancy
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.json_backend import json_dumps
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS
+
+Payload = Dict[str, Any]
+Generate = Callable[[], Any]
+
+_TIMEZONE = timezone(timedelta(hours=3))
+_START = datetime(2023, 1, 1, tzinfo=_TIMEZONE)
+_PERIOD_SECONDS = 365 * 24 * 60 * 60
+_POOL_SIZE = 4096
+_WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel")
+
+
+@dataclass(frozen=True)
+class PayloadSizes:
+    """Sizes of the variable parts of generated payloads."""
+
+    social: int = 1
+    attendees: int = 2
+    fill_quotas: int = 1
+    full_path_depth: int = 1
+    values_width: int = 3
+    parent_depth: int = 0
+    # Length of the other lists of nested models
+    list_size: int = 1
+
+    def list_length(self, name: str) -> int:
+        if name == "full_path":
+            return self.full_path_depth
+        return getattr(self, name, self.list_size)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    if get_origin(annotation) is Union:
+        args = get_args(annotation)
+        not_none_args = [arg for arg in args if arg is not type(None)]
+        if len(not_none_args) == 1:
+            return not_none_args[0], len(args) > 1
+    return annotation, False
+
+
+def _valid_examples(field: FieldInfo) -> List[Any]:
+    """JSON values of the field examples, which are valid for its type."""
+    adapter: TypeAdapter[Any] = TypeAdapter(field.annotation)
+    examples = []
+    for example in field.examples or ():
+        try:
+            adapter.validate_python(example)
+        except ValidationError:
+            continue
+        examples.append(_json_value(example))
+    return examples
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+class PayloadGenerator:
+    """Generates valid random webhook payloads from the models ``Field(examples=...)``.
+
+    Fields with examples get a random valid example, except identifiers, enums, dates
+    and datetimes, which get random values. Nested models are always generated, other
+    optional fields without examples are left empty. Generated payloads may share
+    example lists and dicts, copy them before changing.
+    """
+
+    def __init__(
+        self,
+        event_types: Optional[Iterable[Union[WebhookEventType, str]]] = None,
+        *,
+        seed: Optional[int] = None,
+        sizes: Optional[PayloadSizes] = None,
+    ) -> None:
+        self.event_types = [
+            WebhookEventType(event_type) for event_type in (event_types or HOOK_REQUEST_MODELS)
+        ]
+        self.sizes = sizes or PayloadSizes()
+        self.random = random.Random(seed)
+        self._event_ids = counter(1)
+        self._generators: Dict[Type[BaseModel], Generate] = {}
+        self._in_parent_chain = False
+        # Formatting random datetimes is slow, so they are taken from a pool
+        randrange = self.random.randrange
+        self._datetimes = [
+            (_START + timedelta(seconds=randrange(_PERIOD_SECONDS))).isoformat()
+            for _ in range(_POOL_SIZE)
+        ]
+        self._dates = [(_START + timedelta(days=day)).date().isoformat() for day in range(365)]
+
+    def generate(self, event_type: Union[WebhookEventType, str, None] = None) -> Payload:
+        """Generate a payload of the given or a random event type."""
+        if event_type is None:
+            event_type = self.random.choice(self.event_types)
+        event_type = WebhookEventType(event_type)
+        payload = self._model_generator(HOOK_REQUEST_MODELS[event_type])()
+        meta = payload["meta"]
+        meta["event_type"] = event_type.value
+        meta["event_id"] = str(next(self._event_ids))
+        return payload
+
+    def iter_payloads(self, count: Optional[int] = None) -> Iterator[Payload]:
+        """Yield ``count`` payloads, or endlessly if it isn't set."""
+        generate = self.generate
+        if count is None:
+            while True:
+                yield generate()
+        for _ in range(count):
+            yield generate()
+
+    def iter_json(self, count: Optional[int] = None) -> Iterator[bytes]:
+        """Yield ``count`` payloads as JSON bytes, or endlessly if it isn't set."""
+        for payload in self.iter_payloads(count):
+            yield json_dumps(payload)
+
+    def write_ndjson(self, fileobj: IO[bytes], count: int) -> None:
+        """Write ``count`` payloads to a binary file, one JSON payload per line."""
+        write = fileobj.write
+        for raw in self.iter_json(count):
+            write(raw)
+            write(b"\n")
+
+    def _model_generator(self, model: Type[BaseModel]) -> Generate:
+        generator = self._generators.get(model)
+        if generator is not None:
+            return generator
+        # Placeholder for recursive models, replaced right below
+        self._generators[model] = lambda: self._generators[model]()
+        constants: Payload = {}
+        variables: List[Tuple[str, Generate]] = []
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            generate = self._field_generator(model, name, field)
+            if callable(generate):
+                variables.append((key, generate))
+            else:
+                constants[key] = generate
+
+        def generate_model() -> Payload:
+            values = constants.copy()
+            for key, generate in variables:
+                values[key] = generate()
+            return values
+
+        self._generators[model] = generate_model
+        return generate_model
+
+    def _field_generator(self, model: Type[BaseModel], name: str, field: FieldInfo) -> Any:
+        """Generator function of the field values, or the value if it is constant."""
+        annotation, optional = _unwrap_optional(field.annotation)
+        if model is Vacancy and name == "parent":
+            return self._parent_chain
+        if name == "values" and get_origin(annotation) in (dict, Dict):
+            return self._values_generator()
+        if get_origin(annotation) in (list, List):
+            args = get_args(annotation)
+            if args and _is_model(args[0]):
+                return self._list_generator(args[0], self.sizes.list_length(name))
+        if _is_model(annotation):
+            # Model examples aren't reliable, e.g. an empty string for VacancyLog.close_reason
+            return self._model_generator(annotation)
+        return self._value_generator(name, field, annotation, optional)
+
+    def _value_generator(
+        self,
+        name: str,
+        field: FieldInfo,
+        annotation: Any,
+        optional: bool,
+    ) -> Any:
+        if isinstance(annotation, type):
+            generate = self._type_generator(name, annotation)
+            if generate is not None:
+                return generate
+        examples = _valid_examples(field)
+        if examples:
+            if len(examples) == 1:
+                return examples[0]
+            return self._choice(examples)
+        if get_origin(annotation) in (list, List):
+            return []
+        if optional:
+            return None
+        if get_origin(annotation) in (dict, Dict):
+            return {}
+        return self._scalar_generator(annotation)
+
+    def _choice(self, values: Sequence[Any]) -> Generate:
+        # Cheaper than Random.choice(), which is the bulk of the generation time
+        rand = self.random.random
+        size = len(values)
+        return lambda: values[int(rand() * size)]
+
+    def _type_generator(self, name: str, annotation: type) -> Optional[Generate]:
+        """Random value generators of types, which examples don't represent well."""
+        if issubclass(annotation, Enum):
+            return self._choice([member.value for member in annotation])
+        if issubclass(annotation, datetime):
+            return self._choice(self._datetimes)
+        if issubclass(annotation, date):
+            return self._choice(self._dates)
+        if annotation is int and (name == "id" or name.endswith("_id")):
+            rand = self.random.random
+            return lambda: int(rand() * 999_999) + 1
+        return None
+
+    def _scalar_generator(self, annotation: Any) -> Generate:
+        if annotation is bool:
+            return self._choice((True, False))
+        if annotation is int:
+            return self._choice(range(1, 1000))
+        if annotation is float:
+            return self.random.random
+        return self._choice(_WORDS)
+
+    def _list_generator(self, model: Type[BaseModel], length: int) -> Generate:
+        generate = self._model_generator(model)
+        return lambda: [generate() for _ in range(length)]
+
+    def _values_generator(self) -> Generate:
+        word = self._choice(_WORDS)
+        keys = [f"field_{index}" for index in range(self.sizes.values_width)]
+        return lambda: {key: word() for key in keys}
+
+    def _parent_chain(self) -> Optional[Payload]:
+        """Chain of ``sizes.parent_depth`` parent vacancies, without parents of parents."""
+        if self._in_parent_chain or not self.sizes.parent_depth:
+            return None
+        self._in_parent_chain = True
+        try:
+            generate = self._model_generator(Vacancy)
+            parent = None
+            for _ in range(self.sizes.parent_depth):
+                parent = {**generate(), "parent": parent}
+            return parent
+        finally:
+            self._in_parent_chain = False
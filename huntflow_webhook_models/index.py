@@ -0,0 +1,282 @@
+import math
+import os
+from bisect import bisect_left
+from datetime import datetime, timezone
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from huntflow_webhook_models._paths import get_attribute
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.consts import ApplicantLogType, WebhookEventType
+from huntflow_webhook_models.json_backend import json_dumps, json_loads
+from huntflow_webhook_models.webhook import HookRequest
+
+Path = Tuple[str, ...]
+
+# Attribute paths of the indexed values of each event type
+APPLICANT_ID_PATHS: Dict[WebhookEventType, Tuple[Path, ...]] = {
+    WebhookEventType.APPLICANT: (("event", "applicant", "id"),),
+    WebhookEventType.OFFER: (("event", "applicant", "id"),),
+    WebhookEventType.RECRUITMENT_EVALUATION: (
+        ("event", "recruitment_evaluation", "applicant", "id"),
+    ),
+    WebhookEventType.SURVEY_QUESTIONARY: (("event", "applicant", "id"),),
+}
+VACANCY_ID_PATHS: Dict[WebhookEventType, Tuple[Path, ...]] = {
+    WebhookEventType.APPLICANT: (("event", "applicant_log", "vacancy", "id"),),
+    WebhookEventType.VACANCY: (("event", "vacancy", "id"),),
+    WebhookEventType.OFFER: (("event", "vacancy", "id"),),
+    WebhookEventType.RECRUITMENT_EVALUATION: (
+        ("event", "recruitment_evaluation", "vacancy", "id"),
+    ),
+    WebhookEventType.SURVEY_QUESTIONARY: (("event", "vacancy", "id"),),
+}
+CREATED_PATHS: Dict[WebhookEventType, Path] = {
+    WebhookEventType.APPLICANT: ("event", "applicant_log", "created"),
+    WebhookEventType.VACANCY: ("event", "vacancy_log", "created"),
+    WebhookEventType.VACANCY_REQUEST: ("event", "vacancy_request_log", "created"),
+    WebhookEventType.OFFER: ("event", "applicant_offer", "created"),
+    WebhookEventType.RESPONSE: ("event", "applicant_external_response", "created"),
+    WebhookEventType.SURVEY_QUESTIONARY: ("event", "survey_questionary", "created"),
+}
+
+# Format of saved indexes, a JSON object with the version and the keys
+INDEX_FORMAT = "huntflow-event-index"
+INDEX_VERSION = 1
+# Keyed indexes of saved indexes and the enums of their keys
+_KEYED_INDEXES: Dict[str, Optional[Type[Enum]]] = {
+    "by_applicant": None,
+    "by_vacancy": None,
+    "by_account": None,
+    "by_event_type": WebhookEventType,
+    "by_log_type": ApplicantLogType,
+}
+
+
+def _timestamp(value: Union[datetime, int]) -> float:
+    """POSIX timestamp of a datetime, naive datetimes are treated as UTC.
+
+    Ints are epoch microseconds of requests parsed in the "epoch" timestamp mode.
+    """
+    if isinstance(value, int):
+        return value / 1_000_000
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _enum_key(enum: Type[Enum], value: Any) -> Any:
+    """Enum member of the value, unknown values are kept and match nothing but themselves."""
+    try:
+        return enum(value)
+    except ValueError:
+        return value
+
+
+def _contains(positions: List[int], position: int) -> bool:
+    index = bisect_left(positions, position)
+    return index < len(positions) and positions[index] == position
+
+
+class EventIndex:
+    """Secondary indexes of hook events for lookups without scanning all events.
+
+    Events are indexed by applicant ID, vacancy ID (the ``ApplicantLog.vacancy`` of
+    applicant events too), account ID, event type, applicant log type and the
+    ``created`` time of their log. Each key maps to a list of event positions in
+    the order the events were added, so adding an event takes constant time and a
+    key lookup the size of the result. The time index is a list of (time, position)
+    pairs, events are appended to it and it's sorted on the first time range lookup
+    after events arrived out of time order, after that a lookup takes logarithmic
+    time plus the size of the result.
+
+    ``add()`` takes a reference of the event, e.g. an archive offset, to return from
+    :meth:`find` instead of the model, which is stored by default.
+    """
+
+    def __init__(self) -> None:
+        self.refs: List[Any] = []
+        self.by_applicant: Dict[int, List[int]] = {}
+        self.by_vacancy: Dict[int, List[int]] = {}
+        self.by_account: Dict[int, List[int]] = {}
+        self.by_event_type: Dict[WebhookEventType, List[int]] = {}
+        self.by_log_type: Dict[ApplicantLogType, List[int]] = {}
+        # (timestamp, position) pairs by time, sorted lazily, and the timestamps by position
+        self.by_time: List[Tuple[float, int]] = []
+        self.by_time_sorted = True
+        self.times: List[Optional[float]] = []
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def add(self, request: HookRequest, ref: Any = None) -> int:
+        """Index an event and return its position."""
+        position = len(self.refs)
+        self.refs.append(request if ref is None else ref)
+        event_type = request.meta.event_type
+        self.by_event_type.setdefault(event_type, []).append(position)
+        self.by_account.setdefault(request.meta.account.id, []).append(position)
+        for paths, index in (
+            (APPLICANT_ID_PATHS, self.by_applicant),
+            (VACANCY_ID_PATHS, self.by_vacancy),
+        ):
+            for path in paths.get(event_type, ()):
+                entity_id = get_attribute(request, path)
+                if entity_id is not None:
+                    positions = index.setdefault(entity_id, [])
+                    if not positions or positions[-1] != position:
+                        positions.append(position)
+        if isinstance(request, ApplicantHookRequest):
+            log_type = request.event.applicant_log.type
+            self.by_log_type.setdefault(log_type, []).append(position)
+        self._add_time(event_type, request, position)
+        return position
+
+    def _add_time(self, event_type: WebhookEventType, request: HookRequest, position: int) -> None:
+        path = CREATED_PATHS.get(event_type)
+        created = path and get_attribute(request, path)
+        if not created:
+            self.times.append(None)
+            return
+        timestamp = _timestamp(created)
+        self.times.append(timestamp)
+        if self.by_time and self.by_time[-1][0] > timestamp:
+            self.by_time_sorted = False
+        self.by_time.append((timestamp, position))
+
+    def extend(self, requests: Iterable[HookRequest]) -> "EventIndex":
+        add = self.add
+        for request in requests:
+            add(request)
+        return self
+
+    def positions(
+        self,
+        *,
+        applicant_id: Optional[int] = None,
+        vacancy_id: Optional[int] = None,
+        account_id: Optional[int] = None,
+        event_type: Union[WebhookEventType, str, None] = None,
+        log_type: Union[ApplicantLogType, str, None] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[int]:
+        """Positions of the events matching all the given filters, in the order added.
+
+        ``since`` is inclusive and ``until`` is exclusive, events without a created
+        time don't match time filters. Unknown event and log types match no events,
+        unless they were added with lenient models.
+        """
+        if event_type is not None:
+            event_type = _enum_key(WebhookEventType, event_type)
+        if log_type is not None:
+            log_type = _enum_key(ApplicantLogType, log_type)
+        filters: List[Tuple[Dict[Any, List[int]], Optional[Hashable]]] = [
+            (self.by_applicant, applicant_id),
+            (self.by_vacancy, vacancy_id),
+            (self.by_account, account_id),
+            (self.by_event_type, event_type),
+            (self.by_log_type, log_type),
+        ]
+        postings = sorted(
+            (index.get(key, []) for index, key in filters if key is not None),
+            key=len,
+        )
+        if since is None and until is None:
+            if not postings:
+                return list(range(len(self.refs)))
+            return self._intersect(postings[0], postings[1:])
+        low = -math.inf if since is None else _timestamp(since)
+        high = math.inf if until is None else _timestamp(until)
+        if not self.by_time_sorted:
+            self.by_time.sort()
+            self.by_time_sorted = True
+        start = bisect_left(self.by_time, (low, -1))
+        stop = bisect_left(self.by_time, (high, -1))
+        if postings and len(postings[0]) <= stop - start:
+            times = self.times
+            return [
+                position
+                for position in self._intersect(postings[0], postings[1:])
+                if (timestamp := times[position]) is not None and low <= timestamp < high
+            ]
+        candidates = sorted(position for _, position in self.by_time[start:stop])
+        return self._intersect(candidates, postings)
+
+    @staticmethod
+    def _intersect(candidates: List[int], postings: List[List[int]]) -> List[int]:
+        if not postings:
+            return candidates
+        return [
+            position
+            for position in candidates
+            if all(_contains(positions, position) for positions in postings)
+        ]
+
+    def find(self, **filters: Any) -> List[Any]:
+        """References of the events matching the filters of :meth:`positions`."""
+        refs = self.refs
+        return [refs[position] for position in self.positions(**filters)]
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Persist the index keys, event positions and references as JSON.
+
+        Events are not saved. References of events added without one are saved as
+        ``null`` and loaded as the positions of the events, so the events are read
+        again from their source by position.
+
+        :raises TypeError: if a reference isn't JSON serializable
+        """
+        data: Dict[str, Any] = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_VERSION,
+            "refs": [None if isinstance(ref, BaseModel) else ref for ref in self.refs],
+            "times": self.times,
+        }
+        for name in _KEYED_INDEXES:
+            # Pairs, object keys of JSON are strings only
+            data[name] = list(getattr(self, name).items())
+        temporary_path = f"{os.fspath(path)}.tmp"
+        with open(temporary_path, "wb") as fileobj:
+            fileobj.write(json_dumps(data))
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"]) -> "EventIndex":
+        """Load an index saved with :meth:`save`.
+
+        :raises ValueError: if the file isn't a saved index
+        """
+        with open(path, "rb") as fileobj:
+            data = json_loads(fileobj.read())
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"{os.fspath(path)} is not a saved event index")
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported event index version {data.get('version')}")
+        index = cls()
+        index.refs = [position if ref is None else ref for position, ref in enumerate(data["refs"])]
+        for name, enum in _KEYED_INDEXES.items():
+            getattr(index, name).update(
+                (key if enum is None else _enum_key(enum, key), positions)
+                for key, positions in data[name]
+            )
+        index.times = data["times"]
+        index.by_time = [
+            (timestamp, position)
+            for position, timestamp in enumerate(index.times)
+            if timestamp is not None
+        ]
+        index.by_time_sorted = False
+        return index
@@ -0,0 +1,372 @@
+import math
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import accumulate
+from types import TracebackType
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from huntflow_webhook_models._paths import get_attribute
+from huntflow_webhook_models._varint import read_int, read_uint, write_int, write_str, write_uint
+from huntflow_webhook_models.binary import (
+    FORMAT_VERSION,
+    ArchiveHeader,
+    decode_request,
+    encode_request,
+    schema_hash,
+)
+from huntflow_webhook_models.index import CREATED_PATHS
+from huntflow_webhook_models.timestamps import to_epoch_microseconds
+from huntflow_webhook_models.webhook import HookRequest
+
+PathLike = Union[str, "os.PathLike[str]"]
+# Time range of the records of a block, ``None`` if they have no created time
+Block = Tuple[int, int, Optional[int], Optional[int]]
+
+INDEX_MAGIC = b"HFWI"
+INDEX_SUFFIX = ".idx"
+_INDEX_HEAD = INDEX_MAGIC + bytes([FORMAT_VERSION])
+
+# Entry tags of the index file
+_RECORD = 0
+_TIME_BLOCK = 1
+_UNTIMED_BLOCK = 2
+
+
+def _created(request: HookRequest) -> Optional[int]:
+    """Created time of the event log in epoch microseconds, ``None`` if there is none."""
+    path = CREATED_PATHS.get(request.meta.event_type)
+    created = path and get_attribute(request, path)
+    if not created:
+        return None
+    # Requests parsed in the "epoch" timestamp mode have the microseconds already
+    return created if isinstance(created, int) else to_epoch_microseconds(created)
+
+
+@dataclass
+class _ArchiveIndex:
+    offsets: "array[int]" = field(default_factory=lambda: array("Q"))
+    lengths: "array[int]" = field(default_factory=lambda: array("Q"))
+    event_ids: List[str] = field(default_factory=list)
+    blocks: List[Block] = field(default_factory=list)
+    # Bytes of the complete entries, the last one may be partly written
+    size: int = 0
+
+
+def _parse_entry(data: bytes, pos: int, index: _ArchiveIndex) -> int:
+    tag = data[pos]
+    first, pos = read_uint(data, pos + 1)
+    second, pos = read_uint(data, pos)
+    if tag == _RECORD:
+        size, start = read_uint(data, pos)
+        pos = start + size
+        if pos > len(data):
+            raise IndexError("Partly written entry")
+        index.event_ids.append(str(data[start:pos], "utf-8"))
+        index.offsets.append(first)
+        index.lengths.append(second)
+    elif tag == _TIME_BLOCK:
+        earliest, pos = read_int(data, pos)
+        latest, pos = read_int(data, pos)
+        index.blocks.append((first, second, earliest, latest))
+    elif tag == _UNTIMED_BLOCK:
+        index.blocks.append((first, second, None, None))
+    else:
+        raise ValueError("Corrupted index of a binary webhook archive")
+    return pos
+
+
+def _parse_index(data: bytes) -> _ArchiveIndex:
+    """Entries of an index file, a partly written last entry is ignored.
+
+    :raises ValueError: if the file isn't an archive index
+    """
+    index = _ArchiveIndex()
+    if not data:
+        return index
+    if data[: len(_INDEX_HEAD)] != _INDEX_HEAD:
+        raise ValueError("Not an index of a binary webhook archive")
+    index.size = len(_INDEX_HEAD)
+    try:
+        while index.size < len(data):
+            index.size = _parse_entry(data, index.size, index)
+    except IndexError:
+        pass
+    return index
+
+
+class IndexedArchiveWriter:
+    """Appends hook requests to a binary archive and to its sidecar index file.
+
+    The archive is the format of :class:`BinaryArchiveWriter`. The index at
+    ``path + ".idx"`` keeps the byte offset and length of each record with its
+    ``meta.event_id``, and the time range of the ``created`` times of each block of
+    ``time_block_size`` records. Both files are only appended to. Records written
+    by a writer which didn't close the files are indexed on the next open, and a
+    partly written last record is dropped.
+    """
+
+    def __init__(self, path: PathLike, time_block_size: int = 256) -> None:
+        self.path = os.fspath(path)
+        self.index_path = self.path + INDEX_SUFFIX
+        self.time_block_size = time_block_size
+        self.header: Optional[ArchiveHeader] = None
+        self._archive = open(self.path, "a+b")
+        self._index = open(self.index_path, "a+b")
+        self._size = 0
+        self._count = 0
+        self._block_first = 0
+        self._earliest: Optional[int] = None
+        self._latest: Optional[int] = None
+        try:
+            self._recover()
+        except BaseException:
+            self._archive.close()
+            self._index.close()
+            raise
+
+    def _recover(self) -> None:
+        self._archive.seek(0)
+        self.header = ArchiveHeader.read(self._archive)
+        self._index.seek(0)
+        index = _parse_index(self._index.read())
+        self._index.truncate(index.size)
+        if not index.size:
+            self._index.write(_INDEX_HEAD)
+        if self.header is None:
+            if index.offsets:
+                raise ValueError("The archive index doesn't match the archive")
+            return
+        self._size = self._archive.tell()
+        self._count = len(index.offsets)
+        if index.offsets:
+            self._size = index.offsets[-1] + index.lengths[-1]
+        if index.blocks:
+            first, count, _, _ = index.blocks[-1]
+            self._block_first = first + count
+        # Times of the records of the last block, which wasn't written
+        for position in range(self._block_first, self._count):
+            self._archive.seek(index.offsets[position])
+            self._add_time(decode_request(self._archive.read(index.lengths[position])))
+        self._index_tail()
+
+    def _index_tail(self) -> None:
+        """Index the records written after the last index entry, drop a partly written one."""
+        self._archive.seek(self._size)
+        tail = self._archive.read()
+        if self._archive.tell() < self._size:
+            raise ValueError("The archive index doesn't match the archive")
+        base = self._size
+        end = 0
+        while True:
+            try:
+                length, start = read_uint(tail, end)
+            except IndexError:
+                break
+            if start + length > len(tail):
+                break
+            end = start + length
+            self._add_record(decode_request(tail[start:end]), base + start, length)
+        self._archive.truncate(self._size)
+
+    def _add_time(self, request: HookRequest) -> None:
+        created = _created(request)
+        if created is None:
+            return
+        if self._earliest is None or created < self._earliest:
+            self._earliest = created
+        if self._latest is None or created > self._latest:
+            self._latest = created
+
+    def _add_record(self, request: HookRequest, offset: int, length: int) -> int:
+        entry = bytearray([_RECORD])
+        write_uint(entry, offset)
+        write_uint(entry, length)
+        write_str(entry, request.meta.event_id)
+        self._index.write(entry)
+        self._size = offset + length
+        self._add_time(request)
+        position = self._count
+        self._count += 1
+        if self._count - self._block_first >= self.time_block_size:
+            self._write_block()
+        return position
+
+    def _write_block(self) -> None:
+        count = self._count - self._block_first
+        if not count:
+            return
+        if self._earliest is None or self._latest is None:
+            entry = bytearray([_UNTIMED_BLOCK])
+            write_uint(entry, self._block_first)
+            write_uint(entry, count)
+        else:
+            entry = bytearray([_TIME_BLOCK])
+            write_uint(entry, self._block_first)
+            write_uint(entry, count)
+            write_int(entry, self._earliest)
+            write_int(entry, self._latest)
+        self._index.write(entry)
+        self._block_first = self._count
+        self._earliest = self._latest = None
+
+    def write(self, request: HookRequest) -> int:
+        """Append a request, returns its position in the archive."""
+        out = bytearray()
+        if self.header is None:
+            self.header = ArchiveHeader(schema_hash(), request.meta.version)
+            out += self.header.to_bytes()
+        record = encode_request(request)
+        write_uint(out, len(record))
+        offset = self._size + len(out)
+        out += record
+        self._archive.write(out)
+        return self._add_record(request, offset, len(record))
+
+    def flush(self) -> None:
+        # Records are flushed first, so readers never see index entries without records
+        self._archive.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        if self._archive.closed:
+            return
+        self._write_block()
+        self.flush()
+        self._archive.close()
+        self._index.close()
+
+    def __enter__(self) -> "IndexedArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class IndexedArchiveReader:
+    """Random access to the records of an archive written by :class:`IndexedArchiveWriter`.
+
+    The archive is memory-mapped and its index is loaded into memory, so a record
+    is found by position or ``meta.event_id`` in constant time, and only its bytes
+    are read and decoded. :meth:`find_time` bisects the time ranges of the index
+    blocks and decodes only the blocks which may have matching records. The reader
+    sees the records written and flushed before it was opened.
+
+    :raises ValueError: if the file isn't a binary archive of the current models layout
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = os.fspath(path)
+        self._mmap: Optional[mmap.mmap] = None
+        with open(self.path, "rb") as fileobj:
+            self.header = ArchiveHeader.read(fileobj)
+            size = os.fstat(fileobj.fileno()).st_size
+            if size:
+                self._mmap = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with open(self.path + INDEX_SUFFIX, "rb") as fileobj:
+                index = _parse_index(fileobj.read())
+        except FileNotFoundError:
+            index = _ArchiveIndex()
+        count = len(index.offsets)
+        # Entries of records which weren't flushed yet are ignored
+        while count and index.offsets[count - 1] + index.lengths[count - 1] > size:
+            count -= 1
+        self._offsets = index.offsets[:count]
+        self._lengths = index.lengths[:count]
+        self._positions: Dict[str, int] = {}
+        for position, event_id in enumerate(index.event_ids[:count]):
+            self._positions[event_id] = position
+        self._load_blocks([block for block in index.blocks if block[0] + block[1] <= count])
+
+    def _load_blocks(self, blocks: List[Block]) -> None:
+        self._tail = blocks[-1][0] + blocks[-1][1] if blocks else 0
+        self._blocks: List[Tuple[int, int, int, int]] = [
+            (first, count, earliest, latest)
+            for first, count, earliest, latest in blocks
+            if earliest is not None and latest is not None
+        ]
+        # Running maximum of the latest times and the minimum of the earliest times
+        # of the following blocks are sorted, so candidate blocks are bisected
+        self._latest_so_far = list(accumulate((block[3] for block in self._blocks), max))
+        earliest_from = list(accumulate((block[2] for block in reversed(self._blocks)), min))
+        self._earliest_from = earliest_from[::-1]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._positions
+
+    def record(self, position: int) -> bytes:
+        """Encoded record at the position, negative positions count from the end."""
+        start = self._offsets[position]
+        end = start + self._lengths[position]
+        assert self._mmap is not None
+        return self._mmap[start:end]
+
+    def __getitem__(self, position: int) -> HookRequest:
+        return decode_request(self.record(position))
+
+    def __iter__(self) -> Iterator[HookRequest]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def position(self, event_id: str) -> Optional[int]:
+        """Position of the last record with the event ID, ``None`` if there is none."""
+        return self._positions.get(event_id)
+
+    def get(self, event_id: str) -> Optional[HookRequest]:
+        """Last request with the event ID, ``None`` if there is none."""
+        position = self._positions.get(event_id)
+        return None if position is None else self[position]
+
+    def find_time(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[HookRequest]:
+        """Requests with the log ``created`` time in the range, in the archive order.
+
+        ``since`` is inclusive and ``until`` is exclusive, like in ``EventIndex``,
+        events without a created time don't match.
+        """
+        low = -math.inf if since is None else to_epoch_microseconds(since)
+        high = math.inf if until is None else to_epoch_microseconds(until)
+        start = bisect_left(self._latest_so_far, low)
+        stop = bisect_left(self._earliest_from, high)
+        for first, count, earliest, latest in self._blocks[start:stop]:
+            if latest >= low and earliest < high:
+                yield from self._scan(first, first + count, low, high)
+        yield from self._scan(self._tail, len(self), low, high)
+
+    def _scan(self, start: int, stop: int, low: float, high: float) -> Iterator[HookRequest]:
+        for position in range(start, stop):
+            request = self[position]
+            created = _created(request)
+            if created is not None and low <= created < high:
+                yield request
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "IndexedArchiveReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,172 @@
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import get_args
+
+from huntflow_webhook_models.base import Account, Author
+from huntflow_webhook_models.common_models.applicant import (
+    ApplicantTag,
+    RejectionReason,
+    VacancyApplicantStatus,
+)
+from huntflow_webhook_models.common_models.vacancy import AccountRegion, DivisionPathItem
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+INTERNED_MODELS: Tuple[Type[BaseModel], ...] = (
+    Account,
+    Author,
+    VacancyApplicantStatus,
+    ApplicantTag,
+    RejectionReason,
+    AccountRegion,
+    DivisionPathItem,
+)
+
+
+def _thaw(model: Type[BaseModel], state: Dict[str, Any]) -> BaseModel:
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+@lru_cache(maxsize=None)
+def _frozen_class(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Frozen subclass of ``model`` whose instances compare equal to ``model`` ones."""
+
+    class Frozen(model):  # type: ignore[valid-type, misc]
+        model_config = ConfigDict(frozen=True)
+
+        def __eq__(self, other: Any) -> bool:
+            if not isinstance(other, model):
+                return NotImplemented
+            return (self.__dict__, self.__pydantic_private__, self.__pydantic_extra__) == (
+                other.__dict__,
+                other.__pydantic_private__,
+                other.__pydantic_extra__,
+            )
+
+        def __reduce__(self) -> Tuple[Any, ...]:
+            # Unpickled as a regular mutable instance, the class can't be imported by name
+            return _thaw, (model, self.__getstate__())
+
+    Frozen.__name__ = model.__name__
+    Frozen.__qualname__ = model.__qualname__
+    Frozen.__module__ = model.__module__
+    return Frozen
+
+
+_model_types: Dict[type, bool] = {}
+
+
+def _is_model_type(type_: type) -> bool:
+    # Cheaper than isinstance() checks with the pydantic metaclass
+    is_model = _model_types.get(type_)
+    if is_model is None:
+        is_model = _model_types[type_] = issubclass(type_, BaseModel)
+    return is_model
+
+
+def _has_models(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_models(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _model_field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of the fields which may hold nested models."""
+    return tuple(
+        name for name, field in model.model_fields.items() if _has_models(field.annotation)
+    )
+
+
+def _key(value: Any) -> Hashable:
+    """Hashable key of a field value, which is equal only for equal values of one type."""
+    if _is_model_type(type(value)):
+        # Nested models are interned before, their instances are kept alive by the parent
+        return type(value), id(value)
+    if isinstance(value, list):
+        return list, tuple(map(_key, value))
+    if isinstance(value, dict):
+        return dict, frozenset((key, _key(item)) for key, item in value.items())
+    return type(value), value
+
+
+class Interner:
+    """Replaces repeated small sub-models of parsed events with shared instances.
+
+    Shared instances are frozen, so changing them raises a ``ValidationError``, and
+    compare equal to regular instances. String fields of shared instances are
+    interned too. Both tables keep at most ``maxsize`` entries, and shared instances
+    are weakly referenced: they are dropped when no event uses them anymore.
+    """
+
+    def __init__(
+        self,
+        models: Iterable[Type[BaseModel]] = INTERNED_MODELS,
+        maxsize: int = 100_000,
+    ) -> None:
+        self.models = frozenset(models)
+        self.maxsize = maxsize
+        self._instances: "WeakValueDictionary[Hashable, BaseModel]" = WeakValueDictionary()
+        self._strings: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def intern(self, model: ModelT) -> ModelT:
+        """Replace sub-models of ``model`` in place with shared instances, return ``model``."""
+        values = model.__dict__
+        for name in _model_field_names(type(model)):
+            value = values[name]
+            interned = self._intern_value(value)
+            if interned is not value:
+                values[name] = interned
+        return model
+
+    def intern_str(self, value: str) -> str:
+        """Return the shared copy of an equal string, if the table isn't full."""
+        interned = self._strings.get(value)
+        if interned is not None:
+            return interned
+        if len(self._strings) < self.maxsize:
+            self._strings[value] = value
+        return value
+
+    def clear(self) -> None:
+        self._instances.clear()
+        self._strings.clear()
+
+    def _intern_value(self, value: Any) -> Any:
+        if _is_model_type(type(value)):
+            self.intern(value)
+            return self._shared(value) if type(value) in self.models else value
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self._intern_value(item)
+        return value
+
+    def _shared(self, model: BaseModel) -> BaseModel:
+        values = model.__dict__
+        try:
+            key = (
+                type(model),
+                tuple(map(_key, values.values())),
+                frozenset(model.model_fields_set),
+            )
+            shared = self._instances.get(key)
+        except TypeError:  # unhashable field value
+            return model
+        if shared is not None:
+            return shared
+        if len(self._instances) >= self.maxsize:
+            return model
+        for name, value in values.items():
+            if type(value) is str:
+                values[name] = self.intern_str(value)
+        model.__class__ = _frozen_class(type(model))
+        self._instances[key] = model
+        return model
@@ -0,0 +1,103 @@
+import json
+import os
+from datetime import date, datetime, time
+from enum import Enum
+from importlib import import_module
+from typing import Any, ClassVar, Dict, Type, Union
+
+JSON_BACKEND_ENV = "HUNTFLOW_WEBHOOK_MODELS_JSON_BACKEND"
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, time)):
+        # UTC is written as "Z", like pydantic does
+        value = obj.isoformat()
+        return f"{value[:-6]}Z" if value.endswith("+00:00") else value
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONBackend:
+    """JSON encoder and decoder used by the package, based on the standard ``json``.
+
+    Subclasses can wrap other libraries with the same interface: ``loads()`` takes
+    ``str`` or ``bytes`` and ``dumps()`` returns compact UTF-8 ``bytes``, encoding
+    dates, datetimes (UTC as ``Z``, like pydantic) and enums too. ``fast_dumps``
+    marks backends that serialize plain data faster than pydantic serializes
+    models, so models are converted to dicts for them instead of being serialized
+    by pydantic.
+    """
+
+    name: ClassVar[str] = "stdlib"
+    fast_dumps: ClassVar[bool] = False
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+
+class OrjsonBackend(JSONBackend):
+    """Backend based on ``orjson``, which encodes dates, datetimes and enums natively."""
+
+    name = "orjson"
+    fast_dumps = True
+
+    def __init__(self) -> None:
+        orjson = import_module("orjson")
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, default=_default, option=self._option)
+
+
+BACKENDS: Dict[str, Type[JSONBackend]] = {
+    JSONBackend.name: JSONBackend,
+    OrjsonBackend.name: OrjsonBackend,
+}
+
+
+def _default_backend() -> JSONBackend:
+    """Backend named in the environment variable, or ``orjson`` if it's installed."""
+    name = os.environ.get(JSON_BACKEND_ENV)
+    if name:
+        return BACKENDS[name]()
+    try:
+        return OrjsonBackend()
+    except ImportError:
+        return JSONBackend()
+
+
+_backend = _default_backend()
+
+
+def get_json_backend() -> JSONBackend:
+    return _backend
+
+
+def set_json_backend(backend: Union[str, JSONBackend]) -> None:
+    """Use the backend, or the backend with the name, e.g. ``"stdlib"``, from now on."""
+    global _backend
+    _backend = BACKENDS[backend]() if isinstance(backend, str) else backend
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    return _backend.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    return _backend.dumps(obj)
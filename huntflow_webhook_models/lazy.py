@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Dict, Generic, Optional, Type, TypeVar, Union, cast
+
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import Annotated
+
+from huntflow_webhook_models.base import WebhookMetaInfoBase
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import (
+    HOOK_REQUEST_MODELS,
+    EventTypeDiscriminator,
+    HookRequest,
+)
+
+MetaT = TypeVar("MetaT", bound=WebhookMetaInfoBase)
+
+
+class HookRequestEnvelope(HuntflowBaseModel, Generic[MetaT]):
+    """Hook request without the ``event`` body, which is ignored on validation."""
+
+    changes: Optional[Dict] = Field(None, description="Data changes", examples=[{"id": 2}])
+    meta: MetaT
+
+
+HOOK_ENVELOPE_MODELS: Dict[WebhookEventType, Type[HookRequestEnvelope]] = {
+    event_type: HookRequestEnvelope[model.model_fields["meta"].annotation]  # type: ignore
+    for event_type, model in HOOK_REQUEST_MODELS.items()
+}
+
+
+@lru_cache(maxsize=None)
+def get_hook_envelope_adapter() -> TypeAdapter[HookRequestEnvelope]:
+    """Type adapter of the hook request envelopes union, built on first use."""
+    return TypeAdapter(
+        Annotated[HookRequestEnvelope, EventTypeDiscriminator(HOOK_ENVELOPE_MODELS)],
+    )
+
+
+class LazyHookRequest:
+    """Webhook request with eagerly validated ``meta`` and lazily validated ``event``.
+
+    The event body is kept as raw JSON and validated into the usual ``*HookRequest``
+    model on first access to ``event`` or ``request``, the result is memoized.
+    """
+
+    __slots__ = ("raw", "changes", "meta", "_request")
+
+    def __init__(self, raw: Union[str, bytes], envelope: HookRequestEnvelope) -> None:
+        self.raw = raw
+        self.changes = envelope.changes
+        self.meta: WebhookMetaInfoBase = envelope.meta
+        self._request: Optional[HookRequest] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(meta={self.meta!r}, "
+            f"event_validated={self.is_event_validated})"
+        )
+
+    @property
+    def event_type(self) -> WebhookEventType:
+        return self.meta.event_type
+
+    @property
+    def is_event_validated(self) -> bool:
+        return self._request is not None
+
+    @property
+    def request(self) -> HookRequest:
+        """Fully validated hook request model.
+
+        :raises pydantic.ValidationError: if the event body is invalid
+        """
+        request = self._request
+        if request is None:
+            model = HOOK_REQUEST_MODELS[self.meta.event_type]
+            request = cast(HookRequest, model.model_validate_json(self.raw))
+            self._request = request
+        return request
+
+    @property
+    def event(self) -> BaseModel:
+        return self.request.event
+
+
+def parse_webhook_lazy(raw: Union[str, bytes]) -> LazyHookRequest:
+    """Validate only ``changes`` and ``meta`` of a raw webhook body.
+
+    :raises pydantic.ValidationError: if the event type is unknown or the meta is invalid
+    """
+    return LazyHookRequest(raw, get_hook_envelope_adapter().validate_json(raw))
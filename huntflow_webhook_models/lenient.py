@@ -0,0 +1,133 @@
+from collections import Counter
+from enum import Enum
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Tuple, Type, Union
+
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import CoreSchema, core_schema
+from typing_extensions import Annotated
+
+from huntflow_webhook_models._derive import replaced_model
+from huntflow_webhook_models.base import BaseHuntflowWebhookRequest
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS, EventTypeDiscriminator, HookRequest
+
+_unknown_values: Dict[Type[Enum], "Counter[str]"] = {}
+_unknown_values_lock = Lock()
+
+
+class UnknownEnumValue(str):
+    """Enum value unknown to the library, a string equal to the raw value.
+
+    Like enum members it has ``name``, always ``"UNKNOWN"``, and ``value``.
+    """
+
+    name = "UNKNOWN"
+    enum: Type[Enum]
+
+    def __new__(cls, value: str, enum: Type[Enum]) -> "UnknownEnumValue":
+        instance = super().__new__(cls, value)
+        instance.enum = enum
+        return instance
+
+    def __repr__(self) -> str:
+        return f"<{self.enum.__name__}.UNKNOWN: {str(self)!r}>"
+
+    def __getnewargs__(self) -> Tuple[str, Type[Enum]]:  # type: ignore[override]
+        return str(self), self.enum
+
+    @property
+    def value(self) -> str:
+        return str(self)
+
+
+class LenientEnum:
+    """Validates values which aren't members of the enum into :class:`UnknownEnumValue`.
+
+    Known values are validated by pydantic-core as usual, only unknown ones call
+    Python code, which counts them per enum.
+    """
+
+    def __init__(self, enum: Type[Enum]) -> None:
+        self.enum = enum
+
+    def __get_pydantic_core_schema__(
+        self,
+        source: Any,
+        handler: GetCoreSchemaHandler,
+    ) -> CoreSchema:
+        unknown_schema = core_schema.no_info_after_validator_function(
+            self._unknown,
+            core_schema.str_schema(),
+        )
+        return core_schema.union_schema([handler(source), unknown_schema], mode="left_to_right")
+
+    def _unknown(self, value: str) -> UnknownEnumValue:
+        with _unknown_values_lock:
+            _unknown_values.setdefault(self.enum, Counter())[value] += 1
+        return UnknownEnumValue(value, self.enum)
+
+
+def unknown_enum_values() -> Dict[str, Dict[str, int]]:
+    """Counts of unknown values by enum name, since the start or the last reset."""
+    with _unknown_values_lock:
+        return {enum.__name__: dict(counts) for enum, counts in _unknown_values.items()}
+
+
+def reset_unknown_enum_values() -> None:
+    with _unknown_values_lock:
+        _unknown_values.clear()
+
+
+@lru_cache(maxsize=None)
+def _lenient_enum(enum: Type[Enum]) -> Any:
+    return Annotated[enum, LenientEnum(enum)]
+
+
+def _lenient_type(annotation: Any) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _lenient_enum(annotation)
+    return annotation
+
+
+def lenient_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Subclass of ``model`` whose enum fields accept unknown values, nested models too."""
+    return replaced_model(model, _lenient_type, "Lenient", __name__)
+
+
+class UnknownHookRequest(BaseHuntflowWebhookRequest):
+    """Hook request of an event type unknown to the library, the event is kept as it is."""
+
+    event: Dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def get_lenient_adapter() -> TypeAdapter[HookRequest]:
+    """Type adapter of the lenient hook requests union, built on first use."""
+    models: Dict[WebhookEventType, Type[BaseModel]] = {
+        event_type: lenient_model(model) for event_type, model in HOOK_REQUEST_MODELS.items()
+    }
+    return TypeAdapter(Annotated[HookRequest, EventTypeDiscriminator(models)])
+
+
+@lru_cache(maxsize=None)
+def _get_unknown_request_adapter() -> TypeAdapter[UnknownHookRequest]:
+    return TypeAdapter(lenient_model(UnknownHookRequest))
+
+
+def parse_webhook_lenient(raw: Union[str, bytes]) -> Union[HookRequest, UnknownHookRequest]:
+    """Decode and validate raw webhook body like ``parse_webhook()``, accepting unknown enums.
+
+    Unknown enum values are validated into :class:`UnknownEnumValue` and counted, see
+    :func:`unknown_enum_values`. Events of unknown types are validated into
+    :class:`UnknownHookRequest`.
+
+    :raises pydantic.ValidationError: if the payload is invalid otherwise
+    """
+    try:
+        return get_lenient_adapter().validate_json(raw)
+    except ValidationError as exc:
+        if exc.errors()[0]["type"] != "webhook_event_type":
+            raise
+    return _get_unknown_request_adapter().validate_json(raw)
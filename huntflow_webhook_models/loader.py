@@ -0,0 +1,48 @@
+from importlib import import_module
+from typing import Dict, Iterable, Optional, Tuple, Type, Union
+
+from huntflow_webhook_models.base import BaseHuntflowWebhookRequest
+from huntflow_webhook_models.consts import WebhookEventType
+
+HOOK_REQUEST_IMPORT_PATHS: Dict[WebhookEventType, Tuple[str, str]] = {
+    WebhookEventType.APPLICANT: ("huntflow_webhook_models.applicant", "ApplicantHookRequest"),
+    WebhookEventType.VACANCY: ("huntflow_webhook_models.vacancy", "VacancyHookRequest"),
+    WebhookEventType.VACANCY_REQUEST: (
+        "huntflow_webhook_models.vacancy_request",
+        "VacancyRequestHookRequest",
+    ),
+    WebhookEventType.RESPONSE: ("huntflow_webhook_models.response", "ResponseHookRequest"),
+    WebhookEventType.OFFER: ("huntflow_webhook_models.offer", "OfferHookRequest"),
+    WebhookEventType.RECRUITMENT_EVALUATION: (
+        "huntflow_webhook_models.recruitment_evaluation",
+        "RecruitmentEvaluationHookRequest",
+    ),
+    WebhookEventType.SURVEY_QUESTIONARY: (
+        "huntflow_webhook_models.survey_questionary",
+        "SurveyQuestionaryHookRequest",
+    ),
+}
+
+
+def import_hook_request(
+    event_type: Union[WebhookEventType, str],
+) -> Type[BaseHuntflowWebhookRequest]:
+    """Import only the hook request model module of the given event type."""
+    module_name, name = HOOK_REQUEST_IMPORT_PATHS[WebhookEventType(event_type)]
+    return getattr(import_module(module_name), name)
+
+
+def warmup(event_types: Optional[Iterable[Union[WebhookEventType, str]]] = None) -> None:
+    """Import hook request models and build their validators ahead of the first request.
+
+    Only makes a difference with deferred building (``HUNTFLOW_WEBHOOK_MODELS_DEFER_BUILD``).
+    Without ``event_types`` all hook request models and the ``parse_webhook`` dispatcher
+    are built.
+    """
+    if event_types is None:
+        from huntflow_webhook_models.webhook import get_webhook_request_adapter
+
+        get_webhook_request_adapter()
+        event_types = WebhookEventType
+    for event_type in event_types:
+        import_hook_request(event_type).model_rebuild()
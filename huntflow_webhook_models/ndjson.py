@@ -0,0 +1,137 @@
+import gzip
+import mmap
+import os
+import stat
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import (
+    IO,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing_extensions import Annotated
+
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import (
+    HOOK_REQUEST_MODELS,
+    EventTypeDiscriminator,
+    HookRequest,
+    get_webhook_request_adapter,
+)
+
+Source = Union[str, "os.PathLike[str]", IO[bytes]]
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class _SkippedWebhook(HuntflowBaseModel):
+    """Placeholder for filtered out event types, validating it ignores the whole body."""
+
+
+@lru_cache(maxsize=None)
+def _filtered_adapter(event_types: FrozenSet[WebhookEventType]) -> TypeAdapter[Any]:
+    models: Dict[WebhookEventType, Type[BaseModel]] = {
+        event_type: model if event_type in event_types else _SkippedWebhook
+        for event_type, model in HOOK_REQUEST_MODELS.items()
+    }
+    return TypeAdapter(
+        Annotated[Union[HookRequest, _SkippedWebhook], EventTypeDiscriminator(models)],
+    )
+
+
+def iter_webhooks(
+    source: Source,
+    event_types: Optional[Iterable[Union[WebhookEventType, str]]] = None,
+    *,
+    skip_invalid: bool = False,
+    use_mmap: bool = False,
+) -> Iterator[HookRequest]:
+    """Read an NDJSON archive of webhook bodies and yield hook request models.
+
+    ``source`` is a path or a binary file object, gzip compressed input is detected
+    by its magic bytes. Lines are read one by one and decoded by pydantic-core straight
+    into models, so memory use doesn't depend on the archive size. With ``event_types``
+    only bodies of these types are validated, the others are skipped after reading
+    ``meta.event_type``. ``use_mmap`` maps uncompressed files into memory instead of
+    buffered reading.
+
+    :raises pydantic.ValidationError: on an invalid line unless ``skip_invalid`` is set
+    """
+    with _open_lines(source, use_mmap) as lines:
+        yield from parse_lines(lines, event_types, skip_invalid=skip_invalid)
+
+
+def parse_lines(
+    lines: Iterable[bytes],
+    event_types: Optional[Iterable[Union[WebhookEventType, str]]] = None,
+    *,
+    skip_invalid: bool = False,
+) -> Iterator[HookRequest]:
+    """Validate NDJSON lines into hook request models, blank lines are skipped.
+
+    :raises pydantic.ValidationError: on an invalid line unless ``skip_invalid`` is set
+    """
+    if event_types is None:
+        adapter: TypeAdapter[Any] = get_webhook_request_adapter()
+    else:
+        adapter = _filtered_adapter(frozenset(WebhookEventType(item) for item in event_types))
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            request = adapter.validate_json(line)
+        except ValidationError:
+            if skip_invalid:
+                continue
+            raise
+        if type(request) is not _SkippedWebhook:
+            yield request
+
+
+@contextmanager
+def _open_lines(source: Source, use_mmap: bool) -> Iterator[Iterable[bytes]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fileobj:
+            with _open_lines(fileobj, use_mmap) as lines:
+                yield lines
+        return
+    if _peek(source, len(GZIP_MAGIC)) == GZIP_MAGIC:
+        with gzip.GzipFile(fileobj=source, mode="rb") as gzip_file:
+            yield cast(Iterable[bytes], gzip_file)
+        return
+    if use_mmap and _is_mappable(source):
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            mapped.seek(source.tell())
+            yield iter(mapped.readline, b"")
+        return
+    yield source
+
+
+def _peek(fileobj: IO[bytes], size: int) -> bytes:
+    peek = getattr(fileobj, "peek", None)
+    if peek is not None:
+        return peek(size)[:size]
+    if fileobj.seekable():
+        position = fileobj.tell()
+        head = fileobj.read(size)
+        fileobj.seek(position)
+        return head
+    return b""
+
+
+def _is_mappable(fileobj: IO[bytes]) -> bool:
+    try:
+        file_stat = os.fstat(fileobj.fileno())
+    except (AttributeError, OSError):
+        return False
+    return stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
 from huntflow_webhook_models.common_models.applicant import Applicant
 from huntflow_webhook_models.common_models.applicant_offer import ApplicantOffer
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.vacancy import Vacancy
 from huntflow_webhook_models.consts import CommonWebhookActionType
 
@@ -15,7 +16,7 @@ class OfferHookRequestMeta(WebhookMetaInfoBase):
     )
 
 
-class OfferEvent(BaseModel):
+class OfferEvent(HuntflowBaseModel):
     vacancy: Vacancy
     applicant: Applicant
     applicant_offer: ApplicantOffer
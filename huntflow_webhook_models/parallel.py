@@ -0,0 +1,149 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.ndjson import GZIP_MAGIC, parse_lines
+from huntflow_webhook_models.webhook import HookRequest
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+Summarize = Callable[[HookRequest], Any]
+
+
+def meta_summary(request: HookRequest) -> Tuple[str, int, str]:
+    """Compact summary of a hook request: event type, account ID and event ID."""
+    meta = request.meta
+    return meta.event_type.value, meta.account.id, meta.event_id
+
+
+def chunk_ranges(path: Union[str, "os.PathLike[str]"], chunk_size: int) -> List[Tuple[int, int]]:
+    """Split an NDJSON file into byte ranges of about ``chunk_size`` ending at line ends."""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as fileobj:
+        if fileobj.read(len(GZIP_MAGIC)) == GZIP_MAGIC:
+            raise ValueError(f"Compressed archive {path} can't be split, use iter_webhooks")
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                fileobj.seek(end)
+                fileobj.readline()
+                end = fileobj.tell()
+            ranges.append((start, min(end, size)))
+            start = end
+    return ranges
+
+
+def _parse_chunk(
+    path: Union[str, "os.PathLike[str]"],
+    byte_range: Tuple[int, int],
+    event_types: Optional[FrozenSet[WebhookEventType]],
+    skip_invalid: bool,
+    summarize: Optional[Summarize],
+) -> List[Any]:
+    start, end = byte_range
+    with open(path, "rb") as fileobj:
+        fileobj.seek(start)
+        data = fileobj.read(end - start)
+    requests = parse_lines(data.splitlines(), event_types, skip_invalid=skip_invalid)
+    if summarize is None:
+        return list(requests)
+    return [summarize(request) for request in requests]
+
+
+def iter_webhooks_parallel(
+    path: Union[str, "os.PathLike[str]"],
+    event_types: Optional[Iterable[Union[WebhookEventType, str]]] = None,
+    *,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    summarize: Optional[Summarize] = None,
+    skip_invalid: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Validate an uncompressed NDJSON archive of webhook bodies in a process pool.
+
+    The file is split into byte ranges ending at line ends, every range is validated
+    in a worker process. Hook request models are yielded in the archive order, or as
+    soon as their chunk is ready if ``ordered`` is false. Pass a picklable ``summarize``
+    function, e.g. :func:`meta_summary`, to send back compact results instead of
+    models, which is much cheaper than pickling the models. Only ``workers * 2``
+    chunks are in flight at any time, so memory use is bounded.
+
+    :raises pydantic.ValidationError: on an invalid line unless ``skip_invalid`` is set
+    """
+    workers = workers or os.cpu_count() or 1
+    types = None if event_types is None else frozenset(map(WebhookEventType, event_types))
+    ranges = iter(chunk_ranges(path, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit(byte_range: Tuple[int, int]) -> "Future[List[Any]]":
+            return executor.submit(
+                _parse_chunk,
+                path,
+                byte_range,
+                types,
+                skip_invalid,
+                summarize,
+            )
+
+        if ordered:
+            yield from _ordered_results(ranges, submit, workers * 2)
+        else:
+            yield from _unordered_results(ranges, submit, workers * 2)
+
+
+def _ordered_results(
+    ranges: Iterator[Tuple[int, int]],
+    submit: Callable[[Tuple[int, int]], "Future[List[Any]]"],
+    max_pending: int,
+) -> Iterator[Any]:
+    pending: Deque["Future[List[Any]]"] = deque(
+        submit(item) for _, item in zip(range(max_pending), ranges)
+    )
+    try:
+        while pending:
+            results = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(submit(next_range))
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _unordered_results(
+    ranges: Iterator[Tuple[int, int]],
+    submit: Callable[[Tuple[int, int]], "Future[List[Any]]"],
+    max_pending: int,
+) -> Iterator[Any]:
+    pending: Set["Future[List[Any]]"] = {
+        submit(item) for _, item in zip(range(max_pending), ranges)
+    }
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.add(submit(next_range))
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
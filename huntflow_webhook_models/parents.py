@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Union
+
+from huntflow_webhook_models._paths import iter_path, model_paths
+from huntflow_webhook_models.common_models.vacancy import Vacancy
+from huntflow_webhook_models.webhook import HookRequest, get_webhook_request_adapter
+
+# Key of the parent reference in the private attributes of a vacancy
+_PARENT_REF = "parent_ref"
+
+
+class VacancyParentRef:
+    """Lightweight parent vacancy: its ID and the raw JSON data, validated on demand.
+
+    References to validated vacancies dump their raw data on demand instead. Public
+    attributes other than ``id`` and ``raw`` are taken from the validated vacancy.
+    """
+
+    __slots__ = ("id", "_raw", "_vacancy")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.id: int = raw["id"]
+        self._raw: Optional[Dict[str, Any]] = raw
+        self._vacancy: Optional[Vacancy] = None
+
+    @classmethod
+    def from_vacancy(cls, vacancy: Vacancy) -> "VacancyParentRef":
+        ref = cls.__new__(cls)
+        ref.id = vacancy.id
+        ref._raw = None
+        ref._vacancy = vacancy
+        return ref
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Raw JSON data of the parent vacancy."""
+        if self._raw is None:
+            assert self._vacancy is not None
+            self._raw = self._vacancy.model_dump(mode="json")
+        return self._raw
+
+    @property
+    def vacancy(self) -> Vacancy:
+        """Validated parent vacancy, memoized.
+
+        :raises pydantic.ValidationError: if the raw data is invalid
+        """
+        if self._vacancy is None:
+            self._vacancy = Vacancy.model_validate(self._raw)
+        return self._vacancy
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and special names, e.g. looked up by copy and pickle before the
+        # slots are set, are not delegated
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.vacancy, name)
+
+
+def get_parent(vacancy: Vacancy) -> Union[Vacancy, VacancyParentRef, None]:
+    """Parent of a vacancy, or its reference set by ``ParentChainParser(as_reference=True)``."""
+    private = vacancy.__pydantic_private__
+    ref: Optional[VacancyParentRef] = private.get(_PARENT_REF) if private else None
+    return vacancy.parent if ref is None else ref
+
+
+@dataclass
+class ParentCacheStats:
+    """Counters of a parent vacancies cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class ParentChainParser:
+    """Parses webhooks with bounded and shared ``Vacancy.parent`` chains.
+
+    ``max_depth`` keeps that many parents of every vacancy and drops the older
+    ones, 0 drops all parents. With ``as_reference`` parents are moved out of the
+    ``parent`` field into a :class:`VacancyParentRef` returned by :func:`get_parent`.
+    Otherwise, with ``cache_size`` identical parent chains are replaced by the same
+    ``Vacancy`` instance shared by all events, so don't change them. The ``parent``
+    field always keeps its declared type, so the requests are serialized as usual,
+    without the references.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        *,
+        as_reference: bool = False,
+        cache_size: int = 0,
+    ) -> None:
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must not be negative")
+        self.max_depth = max_depth
+        self.as_reference = as_reference
+        self.cache_size = cache_size
+        self.stats = ParentCacheStats()
+        self._cache: "OrderedDict[bytes, Vacancy]" = OrderedDict()
+
+    def parse(self, raw: Union[str, bytes]) -> HookRequest:
+        """Validate a webhook body like :func:`huntflow_webhook_models.parse_webhook`.
+
+        The parents are bounded and shared after validation.
+
+        :raises pydantic.ValidationError: if the body is invalid, including invalid JSON
+        """
+        request = get_webhook_request_adapter().validate_json(raw)
+        for _, names, _ in model_paths(type(request), (Vacancy,)):
+            for vacancy in iter_path(request, names, getattr):
+                if vacancy.parent is not None:
+                    self._resolve_parent(vacancy)
+        return request
+
+    def _resolve_parent(self, vacancy: Vacancy) -> None:
+        """Truncate the parent chain and move the parent to a reference or to the cache."""
+        parent = vacancy.parent
+        assert parent is not None
+        if self.max_depth is not None:
+            if self.max_depth == 0:
+                vacancy.parent = None
+                return
+            node = parent
+            for _ in range(self.max_depth - 1):
+                if node.parent is None:
+                    break
+                node = node.parent
+            else:
+                node.parent = None
+        if self.as_reference:
+            vacancy.parent = None
+            private = vacancy.__pydantic_private__ or {}
+            private[_PARENT_REF] = VacancyParentRef.from_vacancy(parent)
+            vacancy.__pydantic_private__ = private
+        elif self.cache_size:
+            vacancy.parent = self._cached(parent)
+
+    def _cached(self, parent: Vacancy) -> Vacancy:
+        key = blake2b(parent.model_dump_json().encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            self._cache.move_to_end(key)
+            return cached
+        self.stats.misses += 1
+        self._cache[key] = parent
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return parent
@@ -0,0 +1,96 @@
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, create_model
+from typing_extensions import get_args, get_origin
+
+from huntflow_webhook_models._derive import DerivedModel, bind_model, free_name, is_model
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
+
+# Selected field names with the selected paths under them, empty for whole fields
+FieldTree = FrozenSet[Tuple[str, "FieldTree"]]
+
+
+def _field_tree(paths: Iterable[str]) -> FieldTree:
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            child = node.setdefault(name, {})
+            if child is None:
+                break
+            node = child
+        else:
+            # A whole field replaces the paths under it
+            node[leaf] = None
+    return _freeze(tree)
+
+
+def _freeze(tree: Optional[Dict[str, Any]]) -> FieldTree:
+    if tree is None:
+        return frozenset()
+    return frozenset((name, _freeze(node)) for name, node in tree.items())
+
+
+def _project_annotation(annotation: Any, tree: FieldTree, path: str) -> Any:
+    """Annotation with the model inside of it replaced by its projection."""
+    if is_model(annotation):
+        return _projected_model(annotation, tree)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        not_none_args = [arg for arg in args if arg is not type(None)]
+        if len(not_none_args) == 1:
+            return Optional[_project_annotation(not_none_args[0], tree, path)]
+    elif origin in (list, List) and args:
+        return List[_project_annotation(args[0], tree, path)]  # type: ignore[misc]
+    raise ValueError(f"{path}: fields of {annotation} can't be selected")
+
+
+@lru_cache(maxsize=None)
+def _projected_model(model: Type[BaseModel], tree: FieldTree) -> Type[BaseModel]:
+    selected = dict(tree)
+    unknown = selected.keys() - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"{model.__name__} has no field {min(unknown)!r}")
+    fields: Dict[str, Any] = {}
+    # Fields keep the order of the model
+    for name, field in model.model_fields.items():
+        if name not in selected:
+            continue
+        if selected[name]:
+            field = copy(field)
+            field.annotation = _project_annotation(field.annotation, selected[name], name)
+            field.metadata = list(field.metadata)
+        fields[name] = (field.annotation, field)
+    bases: Tuple[Any, ...] = (HuntflowBaseModel, DerivedModel)
+    projected: Type[BaseModel] = create_model(
+        free_name(__name__, f"{model.__name__}Projection"),
+        __base__=bases,
+        __module__=__name__,
+        **fields,
+    )
+    bind_model(projected, __name__, (_projected_model, (model, tree)))
+    return projected
+
+
+def project(model: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """Model with only the selected fields of ``model`` and its nested models.
+
+    ``fields`` are dotted field paths, e.g. ``"event.applicant_log.status.id"``.
+    A path to a nested model selects it whole. Other fields are ignored on
+    validation, so the projection validates JSON of the full model faster and
+    builds fewer objects. Derived models are cached by the model and the paths,
+    their fields keep the order of the model and their instances can be pickled.
+
+    :raises ValueError: if a path doesn't lead through fields of nested models
+    """
+    paths = set(fields)
+    if not paths:
+        raise ValueError("No fields are selected")
+    try:
+        return _projected_model(model, _field_tree(paths))
+    except ValueError as exc:
+        raise ValueError(f"Can't project {model.__name__}: {exc}") from None
@@ -0,0 +1,178 @@
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, List, NoReturn, Tuple, Type, Union
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from typing_extensions import get_args
+
+from huntflow_webhook_models._codegen import ConstructorCompiler
+from huntflow_webhook_models.json_backend import json_loads
+
+
+class Record:
+    """Base class of read-only ``__slots__`` records generated for models.
+
+    A record has the attributes of its model fields. Nested models are records too
+    and lists are tuples, other values are shared with the model they were converted
+    from. Records take several times less memory than models and have faster
+    attribute access, but no validation, serialization or other model methods.
+    """
+
+    __slots__ = ()
+
+    _model: ClassVar[Type[BaseModel]]
+    _fields: ClassVar[Tuple[str, ...]]
+    _make: ClassVar[Callable[..., "Record"]]
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(_frozen(self._values()))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _make_record, (self._model, self._values())
+
+    def to_dict(self, by_alias: bool = False) -> Dict[str, Any]:
+        """Field values with nested records and tuples converted to dicts and lists."""
+        fields = self._model.model_fields
+        return {
+            (by_alias and fields[name].alias) or name: _plain(getattr(self, name), by_alias)
+            for name in self._fields
+        }
+
+    def to_model(self) -> BaseModel:
+        """Validate the record values back into its model."""
+        return self._model.model_validate(self.to_dict(by_alias=True))
+
+
+def _frozen(value: Any) -> Any:
+    """Hashable equivalent of a value, untyped dicts and lists are shared with the model."""
+    if isinstance(value, dict):
+        return frozenset((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_frozen(item) for item in value)
+    return value
+
+
+def _plain(value: Any, by_alias: bool) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict(by_alias)
+    if isinstance(value, tuple):
+        return [_plain(item, by_alias) for item in value]
+    return value
+
+
+def _make_record(model: Type[BaseModel], values: Tuple[Any, ...]) -> Record:
+    return record_type(model)._make(*values)
+
+
+@lru_cache(maxsize=None)
+def record_type(model: Type[BaseModel]) -> Type[Record]:
+    """Generated record class of a model, e.g. ``ApplicantRecord`` for ``Applicant``."""
+    fields = tuple(model.model_fields)
+    record_cls: Type[Record] = type(
+        f"{model.__name__}Record",
+        (Record,),
+        {"__slots__": fields, "__module__": __name__, "_model": model, "_fields": fields},
+    )
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_cls": record_cls}
+    lines = [f"def _make({', '.join(f'_v{index}' for index in range(len(fields)))}):"]
+    lines.append("    record = _new(_cls)")
+    for index, name in enumerate(fields):
+        # Slot descriptors bypass the read-only __setattr__
+        namespace[f"_set{index}"] = record_cls.__dict__[name].__set__
+        lines.append(f"    _set{index}(record, _v{index})")
+    lines.append("    return record")
+    exec("\n".join(lines), namespace)  # noqa: S102
+    record_cls._make = staticmethod(namespace["_make"])
+    return record_cls
+
+
+class _RecordCompiler(ConstructorCompiler):
+    """Generates record constructors from trusted JSON data or from model instances.
+
+    With ``from_models`` the constructor takes the model instance ``__dict__``, whose
+    values are already converted, so only nested models and lists are converted.
+    """
+
+    def __init__(self, from_models: bool) -> None:
+        super().__init__()
+        self.from_models = from_models
+
+    def _build(self, model: Type[BaseModel], values: List[Tuple[str, str]]) -> List[str]:
+        make = self._constant(record_type(model)._make)
+        return [f"    return {make}({', '.join(value for _, value in values)})"]
+
+    def _field_value(self, name: str, field: FieldInfo) -> str:
+        if self.from_models:
+            return f"data[{name!r}]"
+        return super()._field_value(name, field)
+
+    def _list(self, expr: str, item: str, converted: str) -> str:
+        if converted == item:
+            return f"tuple({expr})"
+        return f"tuple([{converted} for {item} in {expr}])"
+
+    def _convert_annotated(self, expr: str, annotation: Any) -> str:
+        if not self.from_models:
+            return super()._convert_annotated(expr, annotation)
+        return self._convert(expr, get_args(annotation)[0])
+
+    def _convert_type(self, expr: str, type_: type) -> str:
+        if not self.from_models:
+            return super()._convert_type(expr, type_)
+        if issubclass(type_, BaseModel):
+            return f"{self._compile(type_)}({expr}.__dict__)"
+        return expr
+
+
+_json_compiler = _RecordCompiler(from_models=False)
+_model_compiler = _RecordCompiler(from_models=True)
+
+
+@lru_cache(maxsize=None)
+def _json_constructor(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], Record]:
+    return _json_compiler.constructor(model)
+
+
+@lru_cache(maxsize=None)
+def _model_converter(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], Record]:
+    return _model_compiler.constructor(model)
+
+
+def to_record(instance: BaseModel) -> Record:
+    """Convert a model instance with nested models into a record, values aren't copied."""
+    return _model_converter(type(instance))(instance.__dict__)
+
+
+def parse_record(model: Type[BaseModel], raw: Union[str, bytes]) -> Record:
+    """Validate raw JSON with ``model`` and convert the result into a record."""
+    return to_record(model.model_validate_json(raw))
+
+
+def construct_record(model: Type[BaseModel], data: Union[str, bytes, Dict[str, Any]]) -> Record:
+    """Build a record straight from already validated data, skipping models and validation.
+
+    Conversions are the same as in :func:`huntflow_webhook_models.trusted.construct_trusted`.
+    """
+    if isinstance(data, (str, bytes)):
+        return _json_constructor(model)(json_loads(data))
+    return _json_constructor(model)(data)
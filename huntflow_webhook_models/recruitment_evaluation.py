@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.recruitment_evaluation import RecruitmentEvaluation
 from huntflow_webhook_models.consts import CommonWebhookActionType
 
@@ -13,7 +14,7 @@ class RecruitmentEvaluationRequestMeta(WebhookMetaInfoBase):
     )
 
 
-class RecruitmentEvaluationEvent(BaseModel):
+class RecruitmentEvaluationEvent(HuntflowBaseModel):
     recruitment_evaluation: RecruitmentEvaluation
 
 
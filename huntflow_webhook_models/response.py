@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.response import (
     ApplicantExternalResponse,
     VacancyExternal,
@@ -16,7 +17,7 @@ class ResponseHookRequestMeta(WebhookMetaInfoBase):
     )
 
 
-class ResponseEvent(BaseModel):
+class ResponseEvent(HuntflowBaseModel):
     applicant_external_response: ApplicantExternalResponse
     vacancy_external: VacancyExternal
 
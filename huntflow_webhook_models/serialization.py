@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from typing_extensions import get_args
+
+from huntflow_webhook_models._codegen import ConstructorCompiler
+from huntflow_webhook_models.json_backend import get_json_backend
+
+
+class _JSONDataCompiler(ConstructorCompiler):
+    """Generates functions converting model instance ``__dict__`` into JSON data.
+
+    Nested models become dicts keyed by field aliases, other values, e.g. untyped
+    ``values`` dicts, enums and datetimes, are left to the JSON backend.
+    """
+
+    def _build(self, model: Type[BaseModel], values: List[Tuple[str, str]]) -> List[str]:
+        fields = model.model_fields
+        lines = ["    return {"]
+        lines += [f"        {fields[name].alias or name!r}: {value}," for name, value in values]
+        lines.append("    }")
+        return lines
+
+    def _field_value(self, name: str, field: FieldInfo) -> str:
+        return f"data[{name!r}]"
+
+    def _convert_annotated(self, expr: str, annotation: Any) -> str:
+        return self._convert(expr, get_args(annotation)[0])
+
+    def _convert_type(self, expr: str, type_: type) -> str:
+        if issubclass(type_, BaseModel):
+            return f"{self._compile(type_)}({expr}.__dict__)"
+        return expr
+
+
+_compiler = _JSONDataCompiler()
+
+
+@lru_cache(maxsize=None)
+def _json_data_converter(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    return _compiler.constructor(model)
+
+
+def to_json_data(instance: BaseModel) -> Dict[str, Any]:
+    """Model instance as a dict with nested models converted to dicts keyed by aliases.
+
+    Values are not copied or converted, so the dict can contain enums, dates and
+    datetimes, which every JSON backend encodes.
+    """
+    return _json_data_converter(type(instance))(instance.__dict__)
+
+
+def dump_json_fast(instance: BaseModel) -> bytes:
+    """Serialize a model to JSON bytes with field aliases, like ``model_dump_json(by_alias=True)``.
+
+    With a backend faster than pydantic serialization, e.g. ``orjson``, the model is
+    converted by a generated function and encoded by the backend, including the
+    untyped dict fields. Otherwise pydantic serializes it, as well as models with
+    values the backend can't encode, e.g. integers above 64 bits for ``orjson``, so
+    the output is the same as of ``model_dump_json(by_alias=True)``.
+    """
+    backend = get_json_backend()
+    if backend.fast_dumps:
+        try:
+            return backend.dumps(_json_data_converter(type(instance))(instance.__dict__))
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
+    return instance.__pydantic_serializer__.to_json(instance, by_alias=True)
@@ -0,0 +1,283 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import ValidationError
+
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+logger = logging.getLogger(__name__)
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+Handler = Callable[[HookRequest], Awaitable[Any]]
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+@dataclass
+class IngestionStats:
+    """Counters and latencies of a webhook app, latencies are in milliseconds."""
+
+    received: int = 0
+    rejected: int = 0
+    invalid: int = 0
+    parse_errors: int = 0
+    disconnected: int = 0
+    handled: int = 0
+    handler_errors: int = 0
+    queue_depth: int = 0
+    latency_p50_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+
+
+class WebhookApp:
+    """ASGI application receiving Huntflow webhooks.
+
+    A POST request to ``path`` is acknowledged as soon as its raw body is put into a
+    bounded queue, requests to other paths are answered with 404. When the queue
+    stays full for ``enqueue_timeout`` seconds the request is answered with 503, so
+    Huntflow redelivers it later. Workers take bodies from
+    the queue, validate them in ``executor`` (the loop default thread pool if it
+    isn't set, a ``ProcessPoolExecutor`` works too) off the event loop, and await
+    the handlers registered for the event type. ``GET metrics_path`` returns
+    :class:`IngestionStats` as JSON. Bodies are validated with ``parse``, e.g.
+    :func:`huntflow_webhook_models.lenient.parse_webhook_lenient` to accept new
+    enum values and event types. Bodies which fail validation are counted as
+    ``invalid``, other errors of ``parse`` as ``parse_errors``, both are logged and
+    dropped. Requests whose client disconnects before sending the whole body are
+    dropped too.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str = "/",
+        queue_size: int = 1000,
+        workers: int = 4,
+        executor: Optional[Executor] = None,
+        enqueue_timeout: float = 1.0,
+        max_body_size: int = 10 * 1024 * 1024,
+        metrics_path: Optional[str] = "/metrics",
+        latency_window: int = 10_000,
+        parse: Callable[[bytes], Any] = parse_webhook,
+    ) -> None:
+        self.path = path
+        self.queue_size = queue_size
+        self.workers = workers
+        self.executor = executor
+        self.enqueue_timeout = enqueue_timeout
+        self.max_body_size = max_body_size
+        self.metrics_path = metrics_path
+        self.parse = parse
+        self.handlers: Dict[Optional[WebhookEventType], List[Handler]] = {}
+        self._stats = IngestionStats()
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._queue: Optional["asyncio.Queue[Tuple[float, bytes]]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def on(
+        self,
+        event_type: Union[WebhookEventType, str, None] = None,
+    ) -> Callable[[Handler], Handler]:
+        """Register an async handler of the event type, or of all events without it."""
+        key = None if event_type is None else WebhookEventType(event_type)
+
+        def register(handler: Handler) -> Handler:
+            self.handlers.setdefault(key, []).append(handler)
+            return handler
+
+        return register
+
+    @property
+    def stats(self) -> IngestionStats:
+        """Snapshot of the counters, queue depth and end-to-end latency percentiles."""
+        stats = IngestionStats(**asdict(self._stats))
+        stats.queue_depth = self._queue.qsize() if self._queue is not None else 0
+        if self._latencies:
+            latencies = sorted(self._latencies)
+            stats.latency_p50_ms = _percentile(latencies, 0.5) * 1000
+            stats.latency_p99_ms = _percentile(latencies, 0.99) * 1000
+        return stats
+
+    async def start(self) -> None:
+        """Start the workers, called on the ASGI lifespan startup or the first request."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Wait until the queued bodies are handled and stop the workers."""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue = None
+        self._tasks = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["path"] == self.metrics_path:
+            if scope["method"] == "GET":
+                await _respond(send, 200, asdict(self.stats))
+            else:
+                await _respond(send, 405, {"detail": "Method not allowed"})
+            return
+        if scope["path"] != self.path:
+            await _respond(send, 404, {"detail": "Not found"})
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405, {"detail": "Method not allowed"})
+            return
+        await self._ingest(receive, send)
+
+    async def _ingest(self, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive, self.max_body_size)
+        if body is _BodyError.TOO_LARGE:
+            await _respond(send, 413, {"detail": "Request body is too large"})
+            return
+        if body is _BodyError.DISCONNECTED:
+            self._stats.disconnected += 1
+            return
+        assert isinstance(body, bytes)
+        received_at = time.perf_counter()
+        self._stats.received += 1
+        await self.start()
+        assert self._queue is not None
+        try:
+            await asyncio.wait_for(self._queue.put((received_at, body)), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self._stats.rejected += 1
+            await _respond(send, 503, {"detail": "Queue is full"})
+            return
+        await _respond(send, 200, {"status": "accepted"})
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            received_at, body = await queue.get()
+            try:
+                request = await loop.run_in_executor(self.executor, self.parse, body)
+            except ValidationError as exc:
+                self._stats.invalid += 1
+                logger.warning("Invalid webhook body: %s", exc)
+            except Exception:
+                self._stats.parse_errors += 1
+                logger.exception("Failed to parse webhook body")
+            else:
+                await self._dispatch(request)
+                self._latencies.append(time.perf_counter() - received_at)
+            finally:
+                queue.task_done()
+
+    async def _dispatch(self, request: HookRequest) -> None:
+        handlers = self.handlers.get(request.meta.event_type, []) + self.handlers.get(None, [])
+        for handler in handlers:
+            try:
+                await handler(request)
+            except Exception:
+                self._stats.handler_errors += 1
+                logger.exception("Webhook handler %r failed", handler)
+        self._stats.handled += 1
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[round(fraction * (len(sorted_values) - 1))]
+
+
+class _BodyError(Enum):
+    TOO_LARGE = "too_large"
+    DISCONNECTED = "disconnected"
+
+
+async def _read_body(receive: Receive, max_size: int) -> Union[bytes, _BodyError]:
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return _BodyError.DISCONNECTED
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_size:
+            return _BodyError.TOO_LARGE
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _respond(send: Send, status: int, content: Dict[str, Any]) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": _JSON_HEADERS})
+    await send({"type": "http.response.body", "body": json.dumps(content).encode()})
+
+
+async def call_asgi(
+    app: Callable[[Scope, Receive, Send], Awaitable[None]],
+    method: str = "POST",
+    path: str = "/",
+    body: bytes = b"",
+) -> Tuple[int, bytes]:
+    """Send a request to an ASGI app in process and return the status and body.
+
+    Useful to test handlers without running an ASGI server.
+    """
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+    chunks = []
+
+    async def receive() -> Message:
+        if messages:
+            return messages.pop()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.common_models.applicant import Applicant
+from huntflow_webhook_models.common_models.vacancy import Vacancy
+from huntflow_webhook_models.consts import (
+    ApplicantWebhookActionType,
+    CommonWebhookActionType,
+    VacancyState,
+)
+from huntflow_webhook_models.vacancy import VacancyHookRequest
+from huntflow_webhook_models.webhook import HookRequest
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Vacancy log states, which change the vacancy state, the others are edits of it
+VACANCY_STATE_TRANSITIONS = frozenset(
+    {
+        VacancyState.OPEN,
+        VacancyState.CLOSED,
+        VacancyState.HOLD,
+        VacancyState.REOPEN,
+        VacancyState.RESUME,
+    },
+)
+
+
+@lru_cache(maxsize=None)
+def _field_names(model: Type[BaseModel]) -> Dict[str, str]:
+    """Field names of a model by their JSON keys, which ``changes`` are keyed by."""
+    names = {}
+    for name, field in model.model_fields.items():
+        names[name] = name
+        if field.alias:
+            names[field.alias] = name
+    return names
+
+
+@dataclass
+class MaterializerStats:
+    """Counters of a state materializer."""
+
+    applied: int = 0
+    stale: int = 0
+    deleted: int = 0
+    skipped: int = 0
+
+
+class EntityStore(Generic[ModelT]):
+    """Latest snapshots of entities of one kind by entity ID.
+
+    Snapshots are copies of the event models, so updating them doesn't change the
+    events. ``versions`` keeps the log time of the last applied event of every seen
+    ID, deleted ones included, so older events delivered late are ignored.
+    """
+
+    def __init__(self, model: Type[ModelT]) -> None:
+        self.model = model
+        self.snapshots: Dict[int, ModelT] = {}
+        self.versions: Dict[int, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.snapshots
+
+    def __iter__(self) -> Iterator[ModelT]:
+        return iter(self.snapshots.values())
+
+    def get(self, entity_id: int) -> Optional[ModelT]:
+        return self.snapshots.get(entity_id)
+
+    def is_stale(self, entity_id: int, version: datetime) -> bool:
+        applied = self.versions.get(entity_id)
+        return applied is not None and version < applied
+
+    def put(self, entity_id: int, entity: ModelT, version: datetime) -> ModelT:
+        """Replace the snapshot with a copy of the entity."""
+        snapshot = entity.model_copy()
+        self.snapshots[entity_id] = snapshot
+        self.versions[entity_id] = version
+        return snapshot
+
+    def update(
+        self,
+        entity_id: int,
+        entity: ModelT,
+        changes: Optional[Mapping[str, Any]],
+        version: datetime,
+    ) -> ModelT:
+        """Copy the changed fields of the entity into its snapshot.
+
+        The whole entity is copied when there is no snapshot or no ``changes``.
+        """
+        snapshot = self.snapshots.get(entity_id)
+        if snapshot is None or not changes:
+            return self.put(entity_id, entity, version)
+        names = _field_names(self.model)
+        values = entity.__dict__
+        for key in changes:
+            name = names.get(key)
+            if name is not None:
+                snapshot.__dict__[name] = values[name]
+        self.versions[entity_id] = version
+        return snapshot
+
+    def delete(self, entity_id: int, version: datetime) -> Optional[ModelT]:
+        self.versions[entity_id] = version
+        return self.snapshots.pop(entity_id, None)
+
+
+class StateMaterializer:
+    """Folds applicant and vacancy events into the latest snapshots of the entities.
+
+    Every event is applied in O(1) amortized time, independent of the number of
+    stored entities. ``ADD`` stores a copy of the entity, ``EDIT`` copies only the
+    fields listed in ``changes``, ``DELETE`` and the ``REMOVED`` vacancy log remove
+    the snapshot. Vacancy log state transitions (open, close, hold, reopen, resume)
+    update the vacancy ``state``. Events are ordered by their log ``created`` time:
+    events older than the last applied one of the same entity are skipped as stale.
+    Other event types are skipped.
+    """
+
+    def __init__(self) -> None:
+        self.applicants: EntityStore[Applicant] = EntityStore(Applicant)
+        self.vacancies: EntityStore[Vacancy] = EntityStore(Vacancy)
+        self.stats = MaterializerStats()
+
+    def apply(self, request: HookRequest) -> bool:
+        """Apply an event, return ``False`` when it was skipped or stale."""
+        if isinstance(request, ApplicantHookRequest):
+            return self._apply_applicant(request)
+        if isinstance(request, VacancyHookRequest):
+            return self._apply_vacancy(request)
+        self.stats.skipped += 1
+        return False
+
+    def apply_all(self, requests: Iterable[HookRequest]) -> "StateMaterializer":
+        apply = self.apply
+        for request in requests:
+            apply(request)
+        return self
+
+    def _apply_applicant(self, request: ApplicantHookRequest) -> bool:
+        applicant = request.event.applicant
+        version = request.event.applicant_log.created
+        store = self.applicants
+        if store.is_stale(applicant.id, version):
+            self.stats.stale += 1
+            return False
+        action = request.meta.webhook_action
+        if action == ApplicantWebhookActionType.DELETE:
+            store.delete(applicant.id, version)
+            self.stats.deleted += 1
+        elif action == ApplicantWebhookActionType.EDIT:
+            store.update(applicant.id, applicant, request.changes, version)
+        else:
+            store.put(applicant.id, applicant, version)
+        self.stats.applied += 1
+        return True
+
+    def _apply_vacancy(self, request: VacancyHookRequest) -> bool:
+        vacancy = request.event.vacancy
+        log = request.event.vacancy_log
+        store = self.vacancies
+        if store.is_stale(vacancy.id, log.created):
+            self.stats.stale += 1
+            return False
+        if log.state == VacancyState.REMOVED:
+            store.delete(vacancy.id, log.created)
+            self.stats.deleted += 1
+        else:
+            if request.meta.webhook_action == CommonWebhookActionType.ADD:
+                snapshot = store.put(vacancy.id, vacancy, log.created)
+            else:
+                snapshot = store.update(vacancy.id, vacancy, request.changes, log.created)
+            if log.state in VACANCY_STATE_TRANSITIONS:
+                snapshot.__dict__["state"] = log.state
+        self.stats.applied += 1
+        return True
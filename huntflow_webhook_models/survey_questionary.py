@@ -1,9 +1,10 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
 from huntflow_webhook_models.common_models.applicant import Applicant
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.survey_questionary import SurveyQuestionary
 from huntflow_webhook_models.common_models.vacancy import Vacancy
 from huntflow_webhook_models.consts import CommonWebhookActionType
@@ -17,7 +18,7 @@ class SurveyQuestionaryHookRequestMeta(WebhookMetaInfoBase):
     )
 
 
-class SurveyQuestionaryEvent(BaseModel):
+class SurveyQuestionaryEvent(HuntflowBaseModel):
     applicant: Optional[Applicant] = None
     vacancy: Optional[Vacancy] = None
     applicant_log_id: Optional[int] = Field(None, description="Applicant log ID", examples=[1])
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, PlainSerializer, PlainValidator, TypeAdapter
+from typing_extensions import Annotated
+
+from huntflow_webhook_models._derive import Replace, replaced_model
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS, EventTypeDiscriminator, HookRequest
+
+EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_OFFSET = timedelta(0)
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Parsed "+03:00" suffixes, there are only a few dozens of them in use
+_offsets: Dict[str, timedelta] = {"Z": _NO_OFFSET}
+
+
+class TimestampMode(str, Enum):
+    DATETIME = "datetime"
+    EPOCH = "epoch"
+    UTC = "utc"
+
+
+def _offset(suffix: str) -> timedelta:
+    offset = _offsets.get(suffix)
+    if offset is None:
+        hours, minutes = int(suffix[1:3]), int(suffix[4:6])
+        if hours > 23 or minutes > 59:
+            raise ValueError(f"Invalid UTC offset {suffix!r}")
+        offset = timedelta(hours=hours, minutes=minutes)
+        if suffix[0] == "-":
+            offset = -offset
+        _offsets[suffix] = offset
+    return offset
+
+
+def _split_offset(value: str) -> Tuple[str, timedelta]:
+    if value[-1:] == "Z":
+        return value[:-1], _NO_OFFSET
+    if len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        return value[:-6], _offset(value[-6:])
+    return value, _NO_OFFSET
+
+
+def to_utc_datetime(value: Any) -> datetime:
+    """Naive UTC datetime of an ISO 8601 string or a datetime, naive values are taken as UTC.
+
+    :raises ValueError: if the value isn't a datetime
+    """
+    if isinstance(value, str):
+        try:
+            body, offset = _split_offset(value)
+            parsed = datetime.fromisoformat(body)
+        except ValueError:
+            # Pydantic raises the error of invalid values
+            parsed = _DATETIME_ADAPTER.validate_python(value)
+        else:
+            if parsed.tzinfo is None:
+                return parsed - offset
+    elif isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = _DATETIME_ADAPTER.validate_python(value)
+    utc_offset = parsed.utcoffset()
+    parsed = parsed.replace(tzinfo=None)
+    return parsed - utc_offset if utc_offset else parsed
+
+
+def to_epoch_microseconds(value: Any) -> int:
+    """Microseconds since the epoch of a datetime value.
+
+    Numbers are taken as seconds or milliseconds since the epoch, like pydantic does
+    for ``datetime`` fields, so the mode changes only the type of the value.
+
+    :raises ValueError: if the value isn't a datetime
+    """
+    return (to_utc_datetime(value) - EPOCH) // _MICROSECOND
+
+
+def from_epoch_microseconds(value: int) -> datetime:
+    """Timezone-aware UTC datetime of microseconds since the epoch."""
+    return (EPOCH + value * _MICROSECOND).replace(tzinfo=timezone.utc)
+
+
+EpochMicroseconds = Annotated[int, PlainValidator(to_epoch_microseconds)]
+# Plain validators serialize by the type, which warns about datetimes already
+# converted to strings for JSON
+UTCDateTime = Annotated[
+    datetime,
+    PlainValidator(to_utc_datetime),
+    PlainSerializer(datetime.isoformat, when_used="json"),
+]
+
+
+class TimestampAccessors:
+    """Lazy ``datetime`` accessors of models with fast timestamps."""
+
+    def get_datetime(self, name: str) -> Optional[datetime]:
+        """Timezone-aware UTC datetime of a timestamp field, built on each call."""
+        value = getattr(self, name)
+        if value is None or isinstance(value, datetime) and value.tzinfo is not None:
+            return value
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=timezone.utc)
+        return from_epoch_microseconds(value)
+
+
+def _epoch_type(annotation: Any) -> Any:
+    return EpochMicroseconds if annotation is datetime else annotation
+
+
+def _utc_type(annotation: Any) -> Any:
+    return UTCDateTime if annotation is datetime else annotation
+
+
+# Types replacing datetimes and the suffixes of the derived model names by mode
+_MODE_TYPES: Dict[TimestampMode, Tuple[Replace, str]] = {
+    TimestampMode.EPOCH: (_epoch_type, "EpochTimestamps"),
+    TimestampMode.UTC: (_utc_type, "UTCTimestamps"),
+}
+
+
+def timestamp_model(model: Type[BaseModel], mode: Union[TimestampMode, str]) -> Type[BaseModel]:
+    """Subclass of ``model`` keeping its ``datetime`` fields in the fast timestamp mode.
+
+    ``"epoch"`` keeps them as integer microseconds since the epoch, ``"utc"`` as
+    naive UTC datetimes, both have ``get_datetime(name)`` returning timezone-aware
+    UTC datetimes on demand. Nested models are derived too, the type hints of the
+    fields stay ``datetime``. Models without timestamps are returned as they are.
+    """
+    mode = TimestampMode(mode)
+    if mode is TimestampMode.DATETIME:
+        return model
+    replace, suffix = _MODE_TYPES[mode]
+    return replaced_model(model, replace, suffix, __name__, TimestampAccessors)
+
+
+@lru_cache(maxsize=None)
+def get_timestamp_adapter(mode: TimestampMode) -> TypeAdapter[HookRequest]:
+    """Type adapter of the hook requests union in the timestamp mode, built on first use."""
+    models: Dict[WebhookEventType, Type[BaseModel]] = {
+        event_type: timestamp_model(model, mode)
+        for event_type, model in HOOK_REQUEST_MODELS.items()
+    }
+    return TypeAdapter(Annotated[HookRequest, EventTypeDiscriminator(models)])
+
+
+def parse_webhook_timestamps(
+    raw: Union[str, bytes],
+    mode: Union[TimestampMode, str] = TimestampMode.EPOCH,
+) -> HookRequest:
+    """Decode and validate raw webhook body like ``parse_webhook()`` in the timestamp mode.
+
+    :raises pydantic.ValidationError: if the event type is unknown or the payload is invalid
+    """
+    return get_timestamp_adapter(TimestampMode(mode)).validate_json(raw)
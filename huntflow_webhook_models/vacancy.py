@@ -1,8 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from huntflow_webhook_models.base import BaseHuntflowWebhookRequest, WebhookMetaInfoBase
+from huntflow_webhook_models.common_models.hf_base import HuntflowBaseModel
 from huntflow_webhook_models.common_models.vacancy import Vacancy, VacancyLog
 from huntflow_webhook_models.consts import CommonWebhookActionType
 
@@ -15,12 +16,12 @@ class VacancyHookRequestMeta(WebhookMetaInfoBase):
     )
 
 
-class User(BaseModel):
+class User(HuntflowBaseModel):
     id: Optional[int] = Field(None, description="User ID", examples=[1])
     name: Optional[str] = Field(None, description="User name", examples=["user@example.com"])
 
 
-class VacancyEvent(BaseModel):
+class VacancyEvent(HuntflowBaseModel):
     vacancy: Vacancy
     vacancy_log: VacancyLog
     user: Optional[User] = Field(None, description="Recruiter who joined or left a vacancy")
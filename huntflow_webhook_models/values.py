@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from typing_extensions import Literal
+
+from huntflow_webhook_models._paths import iter_path, model_paths
+from huntflow_webhook_models.common_models.applicant import Applicant
+from huntflow_webhook_models.common_models.applicant_offer import ApplicantOffer
+from huntflow_webhook_models.common_models.vacancy import Vacancy
+from huntflow_webhook_models.common_models.vacancy_request import VacancyRequest
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+Schema = Mapping[str, Mapping[str, Any]]
+Coerce = Callable[[Dict[str, Any]], Dict[str, Any]]
+SchemaLoader = Callable[[int, "ValuesEntityKind"], Optional[Schema]]
+
+
+class ValuesEntityKind(str, Enum):
+    APPLICANT = "applicant"
+    VACANCY = "vacancy"
+    VACANCY_REQUEST = "vacancy_request"
+    OFFER = "offer"
+
+
+ENTITY_MODELS: Dict[Type[BaseModel], ValuesEntityKind] = {
+    Applicant: ValuesEntityKind.APPLICANT,
+    Vacancy: ValuesEntityKind.VACANCY,
+    VacancyRequest: ValuesEntityKind.VACANCY_REQUEST,
+    ApplicantOffer: ValuesEntityKind.OFFER,
+}
+_ENTITY_TYPES = tuple(ENTITY_MODELS)
+
+# Python types of the questionary field types, other types are left as they are
+FIELD_TYPES: Dict[str, Any] = {
+    "string": str,
+    "text": str,
+    "textarea": str,
+    "html": str,
+    "hidden": str,
+    "url": str,
+    "email": str,
+    "integer": int,
+    "income": int,
+    "number": float,
+    "boolean": bool,
+    "checkbox": bool,
+    "date": date,
+    "datetime": datetime,
+}
+
+_VALUES_CONFIG = ConfigDict(extra="allow")
+
+
+def _field_type(name: str, description: Mapping[str, Any]) -> Any:
+    field_type = description.get("type", "")
+    if field_type == "compound" and description.get("fields"):
+        return _values_model(f"{name}_values", description["fields"])
+    if field_type == "select" and description.get("values"):
+        return Literal[tuple(description["values"])]
+    return FIELD_TYPES.get(field_type, Any)
+
+
+def _values_model(name: str, schema: Schema) -> Type[BaseModel]:
+    fields: Dict[str, Any] = {}
+    # Keys aren't always identifiers, so fields are named by index and aliased
+    for index, (key, description) in enumerate(schema.items()):
+        field_type = _field_type(key, description)
+        fields[f"field_{index}"] = (
+            Optional[field_type],
+            Field(None, alias=key, description=description.get("title")),
+        )
+    return create_model(name, __config__=_VALUES_CONFIG, **fields)
+
+
+def compile_values_schema(schema: Schema) -> Coerce:
+    """Compile a questionary field description into a ``values`` coercion function.
+
+    ``schema`` maps ``values`` keys to field descriptions of the Huntflow API, e.g.
+    ``{"experience": {"type": "select", "values": ["none", "1-3 years"]}}``. The
+    function validates the values and returns them with coerced types, ``select``
+    fields checked against the choices and compound fields as nested dicts. Keys
+    missing in the schema are kept as they are.
+
+    :raises pydantic.ValidationError: from the function, if values don't match
+    """
+    model = _values_model("Values", schema)
+    validate = model.model_validate
+
+    def coerce(values: Dict[str, Any]) -> Dict[str, Any]:
+        return validate(values).model_dump(by_alias=True, exclude_unset=True)
+
+    return coerce
+
+
+@dataclass
+class SchemaRegistryStats:
+    """Counters of the compiled validators cache of a schema registry."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ValuesSchemaRegistry:
+    """Typed ``values`` of applicants, vacancies, vacancy requests and offers per account.
+
+    Schemas are registered per ``(account_id, entity kind)``, or taken from
+    ``loader`` on first use, e.g. from the Huntflow API. They are compiled with
+    :func:`compile_values_schema` once and the validators are kept in an LRU cache
+    of ``maxsize`` entries. Registering a changed schema or :meth:`invalidate`
+    drops the compiled validator, so the next event is validated with the new one.
+    """
+
+    def __init__(self, loader: Optional[SchemaLoader] = None, maxsize: int = 1024) -> None:
+        self.loader = loader
+        self.maxsize = maxsize
+        self.stats = SchemaRegistryStats()
+        self._schemas: Dict[Tuple[int, ValuesEntityKind], Schema] = {}
+        self._validators: "OrderedDict[Tuple[int, ValuesEntityKind], Optional[Coerce]]" = (
+            OrderedDict()
+        )
+
+    def register(
+        self,
+        account_id: int,
+        kind: Union[ValuesEntityKind, str],
+        schema: Schema,
+    ) -> None:
+        key = (account_id, ValuesEntityKind(kind))
+        if self._schemas.get(key) != schema:
+            # A copy, so a schema changed in place and registered again is recompiled
+            self._schemas[key] = deepcopy(schema)
+            self._validators.pop(key, None)
+
+    def invalidate(
+        self,
+        account_id: int,
+        kind: Union[ValuesEntityKind, str, None] = None,
+    ) -> None:
+        """Drop the schemas and validators of the account, or only of the entity kind."""
+        kinds = list(ValuesEntityKind) if kind is None else [ValuesEntityKind(kind)]
+        for entity_kind in kinds:
+            self._schemas.pop((account_id, entity_kind), None)
+            self._validators.pop((account_id, entity_kind), None)
+
+    def validator(
+        self,
+        account_id: int,
+        kind: Union[ValuesEntityKind, str],
+    ) -> Optional[Coerce]:
+        """Compiled coercion function, ``None`` if the account has no schema of the kind."""
+        key = (account_id, ValuesEntityKind(kind))
+        if key in self._validators:
+            self.stats.hits += 1
+            self._validators.move_to_end(key)
+            return self._validators[key]
+        self.stats.misses += 1
+        schema = self._schemas.get(key)
+        if schema is None and self.loader is not None:
+            schema = self.loader(*key)
+            if schema is not None:
+                self._schemas[key] = schema
+        validator = None if schema is None else compile_values_schema(schema)
+        self._validators[key] = validator
+        if len(self._validators) > self.maxsize:
+            self._validators.popitem(last=False)
+            self.stats.evictions += 1
+        return validator
+
+    def apply(self, request: HookRequest) -> HookRequest:
+        """Replace ``values`` of the request entities with coerced values in place.
+
+        :raises pydantic.ValidationError: if values don't match the schema
+        """
+        account_id = request.meta.account.id
+        for model, names, _ in model_paths(type(request), _ENTITY_TYPES):
+            for entity in iter_path(request, names, getattr):
+                values = entity.__dict__["values"]
+                if not values:
+                    continue
+                validator = self.validator(account_id, ENTITY_MODELS[model])
+                if validator is not None:
+                    entity.__dict__["values"] = validator(values)
+        return request
+
+    def parse(self, raw: Union[str, bytes]) -> HookRequest:
+        """Validate a webhook body with :func:`parse_webhook` and coerce its ``values``.
+
+        :raises pydantic.ValidationError: if the body or its values are invalid
+        """
+        return self.apply(parse_webhook(raw))
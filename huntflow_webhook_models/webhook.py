@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Mapping, Optional, Type, Union
+
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import CoreSchema, core_schema
+from typing_extensions import Annotated
+
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.base import BaseHuntflowWebhookRequest
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.offer import OfferHookRequest
+from huntflow_webhook_models.recruitment_evaluation import RecruitmentEvaluationHookRequest
+from huntflow_webhook_models.response import ResponseHookRequest
+from huntflow_webhook_models.survey_questionary import SurveyQuestionaryHookRequest
+from huntflow_webhook_models.vacancy import VacancyHookRequest
+from huntflow_webhook_models.vacancy_request import VacancyRequestHookRequest
+
+HOOK_REQUEST_MODELS: Dict[WebhookEventType, Type[BaseHuntflowWebhookRequest]] = {
+    WebhookEventType.APPLICANT: ApplicantHookRequest,
+    WebhookEventType.VACANCY: VacancyHookRequest,
+    WebhookEventType.VACANCY_REQUEST: VacancyRequestHookRequest,
+    WebhookEventType.RESPONSE: ResponseHookRequest,
+    WebhookEventType.OFFER: OfferHookRequest,
+    WebhookEventType.RECRUITMENT_EVALUATION: RecruitmentEvaluationHookRequest,
+    WebhookEventType.SURVEY_QUESTIONARY: SurveyQuestionaryHookRequest,
+}
+
+
+def _python_event_type(value: Any) -> Optional[str]:
+    meta = value.get("meta") if isinstance(value, dict) else getattr(value, "meta", None)
+    if isinstance(meta, dict):
+        event_type = meta.get("event_type")
+    else:
+        event_type = getattr(meta, "event_type", None)
+    if isinstance(event_type, WebhookEventType):
+        return event_type.value
+    return event_type if isinstance(event_type, str) else None
+
+
+class EventTypeDiscriminator:
+    """Tags a union of models by the nested ``meta.event_type`` value.
+
+    For JSON input the tag is looked up by pydantic-core straight in the raw document,
+    so the body is decoded and validated in a single pass against the matching model only.
+    """
+
+    def __init__(self, models: Mapping[WebhookEventType, Type[BaseModel]]) -> None:
+        self.models = models
+
+    def __get_pydantic_core_schema__(
+        self,
+        source: Any,
+        handler: GetCoreSchemaHandler,
+    ) -> CoreSchema:
+        choices: Dict[Hashable, CoreSchema] = {
+            event_type.value: handler.generate_schema(model)
+            for event_type, model in self.models.items()
+        }
+        return core_schema.json_or_python_schema(
+            json_schema=self._tagged_union(choices, ["meta", "event_type"]),
+            python_schema=self._tagged_union(choices, _python_event_type),
+        )
+
+    @staticmethod
+    def _tagged_union(
+        choices: Dict[Hashable, CoreSchema],
+        discriminator: Any,
+    ) -> CoreSchema:
+        return core_schema.tagged_union_schema(
+            choices=choices,
+            discriminator=discriminator,
+            custom_error_type="webhook_event_type",
+            custom_error_message="Unknown or missing webhook event type (meta.event_type)",
+        )
+
+
+HookRequest = Union[
+    ApplicantHookRequest,
+    VacancyHookRequest,
+    VacancyRequestHookRequest,
+    ResponseHookRequest,
+    OfferHookRequest,
+    RecruitmentEvaluationHookRequest,
+    SurveyQuestionaryHookRequest,
+]
+
+WebhookRequest = Annotated[HookRequest, EventTypeDiscriminator(HOOK_REQUEST_MODELS)]
+
+
+@lru_cache(maxsize=None)
+def get_webhook_request_adapter() -> TypeAdapter[HookRequest]:
+    """Type adapter of the hook requests union, built on first use."""
+    return TypeAdapter(WebhookRequest, config=ConfigDict(title="WebhookRequest"))
+
+
+def parse_webhook(raw: Union[str, bytes]) -> HookRequest:
+    """Decode and validate raw webhook body into the matching hook request model.
+
+    :raises pydantic.ValidationError: if the event type is unknown or the payload is invalid
+    """
+    return get_webhook_request_adapter().validate_json(raw)
+
+
+def validate_webhook(data: Any) -> HookRequest:
+    """Validate already decoded webhook data into the matching hook request model."""
+    return get_webhook_request_adapter().validate_python(data)
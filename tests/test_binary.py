@@ -0,0 +1,48 @@
+import json
+from typing import cast
+
+import pytest
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, applicant_hook
+from huntflow_webhook_models.binary import decode_request, encode_request
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.lenient import lenient_model
+from huntflow_webhook_models.projection import project
+from huntflow_webhook_models.timestamps import TimestampMode, parse_webhook_timestamps
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOAD_FACTORIES))
+def test_roundtrip(name: WebhookEventType) -> None:
+    request = parse_webhook(json.dumps(PAYLOAD_FACTORIES[name]()))
+
+    assert decode_request(encode_request(request)) == request
+
+
+@pytest.mark.parametrize("mode", [TimestampMode.EPOCH, TimestampMode.UTC])
+@pytest.mark.parametrize("name", sorted(PAYLOAD_FACTORIES))
+def test_timestamp_modes_decode_to_datetimes(name: WebhookEventType, mode: TimestampMode) -> None:
+    raw = json.dumps(PAYLOAD_FACTORIES[name]())
+    request = parse_webhook_timestamps(raw, mode)
+
+    decoded = decode_request(encode_request(request))
+
+    assert decoded.model_dump() == parse_webhook(raw).model_dump()
+
+
+def test_lenient_requests_decode_to_the_models() -> None:
+    raw = json.dumps(applicant_hook())
+    request = parse_webhook(raw)
+    lenient = cast(HookRequest, lenient_model(type(request)).model_validate_json(raw))
+
+    assert decode_request(encode_request(lenient)) == request
+
+
+def test_requests_of_other_models_are_rejected() -> None:
+    request = parse_webhook(json.dumps(applicant_hook()))
+    projected = project(type(request), ["meta", "event.applicant.id"]).model_validate(
+        request.model_dump(),
+    )
+
+    with pytest.raises(TypeError):
+        encode_request(projected)  # type: ignore[arg-type]
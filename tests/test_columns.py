@@ -0,0 +1,60 @@
+import json
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.columns import CategoryColumn, ColumnarBuilder, TimestampColumn
+from huntflow_webhook_models.consts import ApplicantLogType, WebhookEventType
+from huntflow_webhook_models.lenient import get_lenient_adapter
+from huntflow_webhook_models.timestamps import parse_webhook_timestamps
+from huntflow_webhook_models.webhook import parse_webhook
+
+LOG_TYPE = "event.applicant_log.type"
+CREATED = "event.applicant_log.created"
+
+
+def applicant_body(log_type: str) -> bytes:
+    payload = applicant_hook()
+    payload["event"]["applicant_log"]["type"] = log_type
+    return json.dumps(payload).encode()
+
+
+def test_unknown_enum_values_get_own_categories() -> None:
+    builder = ColumnarBuilder({WebhookEventType.APPLICANT: [LOG_TYPE]})
+    builder.extend_json(
+        [
+            applicant_body("STATUS"),
+            applicant_body("FUTURE_TYPE"),
+            applicant_body("FUTURE_TYPE"),
+        ],
+    )
+    builder.append(get_lenient_adapter().validate_json(applicant_body("OTHER_TYPE")))
+    builder.append(get_lenient_adapter().validate_json(applicant_body("FUTURE_TYPE")))
+    column = builder[WebhookEventType.APPLICANT][LOG_TYPE]
+    known = len(ApplicantLogType)
+
+    assert isinstance(column, CategoryColumn)
+    assert list(column.values) == [
+        list(ApplicantLogType).index(ApplicantLogType.STATUS),
+        known,
+        known,
+        known + 1,
+        known,
+    ]
+    assert column.decode() == [
+        ApplicantLogType.STATUS,
+        "FUTURE_TYPE",
+        "FUTURE_TYPE",
+        "OTHER_TYPE",
+        "FUTURE_TYPE",
+    ]
+
+
+def test_timestamps_of_epoch_timestamp_events() -> None:
+    raw = applicant_body("STATUS")
+    builder = ColumnarBuilder({WebhookEventType.APPLICANT: [CREATED]})
+    builder.append_json(raw)
+    builder.append(parse_webhook(raw))
+    builder.append(parse_webhook_timestamps(raw))
+    column = builder[WebhookEventType.APPLICANT][CREATED]
+
+    assert isinstance(column, TimestampColumn)
+    assert len(set(column.values)) == 1
@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from huntflow_webhook_models.compression import DICTIONARIES_MAGIC, PayloadCompressor
+from huntflow_webhook_models.generator import PayloadGenerator
+
+
+def bodies(count: int) -> List[bytes]:
+    return list(PayloadGenerator(seed=1).iter_json(count))
+
+
+def test_save_and_load_dictionaries(tmp_path: Path) -> None:
+    samples = bodies(200)
+    compressor = PayloadCompressor()
+    compressor.train(samples[:100])
+    compressor.add("FUTURE-EVENT", b'{"meta":{"event_type":"FUTURE-EVENT"}}')
+    compressed = [compressor.compress(raw) for raw in samples[100:]]
+    path = tmp_path / "dictionaries.hfzd"
+
+    compressor.save(path)
+    assert path.read_bytes().startswith(DICTIONARIES_MAGIC)
+    loaded = PayloadCompressor.load(path)
+
+    assert loaded.dictionaries == compressor.dictionaries
+    assert [loaded.decompress(data) for data in compressed] == samples[100:]
+    assert loaded.current("FUTURE-EVENT") == compressor.current("FUTURE-EVENT")
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    compressor = PayloadCompressor()
+    compressor.train(bodies(50))
+    path = tmp_path / "dictionaries.hfzd"
+    compressor.save(path)
+    data = path.read_bytes()
+
+    path.write_bytes(b"\x80\x04" + data)
+    with pytest.raises(ValueError, match="not a compression dictionaries file"):
+        PayloadCompressor.load(path)
+    path.write_bytes(data[:-10])
+    with pytest.raises(ValueError, match="Truncated"):
+        PayloadCompressor.load(path)
@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.index import EventIndex
+from huntflow_webhook_models.lenient import get_lenient_adapter
+from huntflow_webhook_models.timestamps import parse_webhook_timestamps
+from huntflow_webhook_models.webhook import parse_webhook
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def applicant_body(log_type: str = "STATUS", hours: int = 0) -> bytes:
+    payload = applicant_hook()
+    payload["event"]["applicant_log"]["type"] = log_type
+    payload["event"]["applicant_log"]["created"] = (START + timedelta(hours=hours)).isoformat()
+    return json.dumps(payload).encode()
+
+
+def test_unknown_types_match_no_events() -> None:
+    index = EventIndex().extend([parse_webhook(applicant_body())])
+
+    assert index.positions(log_type="FUTURE_TYPE") == []
+    assert index.positions(event_type="FUTURE-EVENT") == []
+    assert index.positions(log_type="STATUS") == [0]
+
+
+def test_unknown_log_types_of_lenient_events_are_found() -> None:
+    index = EventIndex()
+    index.add(parse_webhook(applicant_body()))
+    index.add(get_lenient_adapter().validate_json(applicant_body("FUTURE_TYPE")))
+
+    assert index.positions(log_type="FUTURE_TYPE") == [1]
+
+
+def test_time_lookups_of_events_out_of_order() -> None:
+    hours = [5, 1, 3, 0, 4, 2]
+    index = EventIndex().extend(parse_webhook(applicant_body(hours=hour)) for hour in hours)
+
+    assert not index.by_time_sorted
+    found = index.positions(since=START + timedelta(hours=1), until=START + timedelta(hours=4))
+    assert found == [1, 2, 5]
+    assert index.by_time_sorted
+    index.add(parse_webhook(applicant_body(hours=2)))
+    found = index.positions(since=START + timedelta(hours=2), until=START + timedelta(hours=3))
+    assert found == [5, 6]
+
+
+def test_time_lookups_of_epoch_timestamp_events() -> None:
+    bodies = [applicant_body(hours=hour) for hour in [2, 0, 1]]
+    index = EventIndex().extend(parse_webhook_timestamps(raw) for raw in bodies)
+    expected = EventIndex().extend(parse_webhook(raw) for raw in bodies)
+
+    assert index.times == expected.times
+    found = index.positions(since=START + timedelta(hours=1), until=START + timedelta(hours=3))
+    assert found == [0, 2]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    index = EventIndex()
+    for hour in [2, 0, 1]:
+        index.add(parse_webhook(applicant_body(hours=hour)), ref=f"offset-{hour}")
+    index.add(get_lenient_adapter().validate_json(applicant_body("FUTURE_TYPE", hours=3)))
+    path = tmp_path / "webhooks.index"
+    index.save(path)
+
+    loaded = EventIndex.load(path)
+
+    assert loaded.refs == ["offset-2", "offset-0", "offset-1", 3]
+    assert b"applicant_log" not in path.read_bytes()
+    filters_list: List[Dict[str, Any]] = [
+        {"since": START + timedelta(hours=1)},
+        {"log_type": "STATUS", "until": START + timedelta(hours=2)},
+        {"log_type": "FUTURE_TYPE"},
+        {"event_type": WebhookEventType.APPLICANT, "applicant_id": 1},
+    ]
+    for filters in filters_list:
+        assert loaded.positions(**filters) == index.positions(**filters)
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "other.json"
+    path.write_text('{"refs": []}')
+
+    with pytest.raises(ValueError, match="not a saved event index"):
+        EventIndex.load(path)
@@ -0,0 +1,38 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.indexed_archive import IndexedArchiveReader, IndexedArchiveWriter
+from huntflow_webhook_models.timestamps import TimestampMode, parse_webhook_timestamps
+
+CREATED = datetime(2023, 1, 1, 7, tzinfo=timezone.utc)
+
+
+def applicant_body(event_id: int) -> bytes:
+    payload = applicant_hook()
+    payload["meta"]["event_id"] = str(event_id)
+    created = CREATED + timedelta(hours=event_id)
+    payload["event"]["applicant_log"]["created"] = created.isoformat()
+    return json.dumps(payload).encode()
+
+
+@pytest.mark.parametrize("mode", list(TimestampMode))
+def test_write_and_read(tmp_path: Path, mode: TimestampMode) -> None:
+    path = tmp_path / "webhooks.bin"
+    requests = [parse_webhook_timestamps(applicant_body(i), mode) for i in range(5)]
+    with IndexedArchiveWriter(path, time_block_size=2) as writer:
+        for request in requests:
+            writer.write(request)
+
+    with IndexedArchiveReader(path) as reader:
+        assert len(reader) == 5
+        assert [request.meta.event_id for request in reader] == ["0", "1", "2", "3", "4"]
+        found = reader.find_time(CREATED + timedelta(hours=1), CREATED + timedelta(hours=3))
+        assert [request.meta.event_id for request in found] == ["1", "2"]
+        stored = reader.get("2")
+        assert isinstance(stored, ApplicantHookRequest)
+        assert stored.event.applicant_log.created == CREATED + timedelta(hours=2)
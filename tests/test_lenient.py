@@ -0,0 +1,85 @@
+import asyncio
+import json
+import multiprocessing
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List
+
+import pytest
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, applicant_hook
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.lenient import UnknownEnumValue, parse_webhook_lenient
+from huntflow_webhook_models.records import construct_record, to_record
+from huntflow_webhook_models.server import WebhookApp, call_asgi
+from huntflow_webhook_models.trusted import construct_trusted
+
+
+def raw_body(event_type: WebhookEventType) -> bytes:
+    payload = PAYLOAD_FACTORIES[event_type]()
+    if event_type is WebhookEventType.APPLICANT:
+        payload["event"]["applicant_log"]["type"] = "FUTURE_TYPE"
+    return json.dumps(payload).encode()
+
+
+@pytest.mark.parametrize("event_type", PAYLOAD_FACTORIES)
+def test_pickle_round_trip(event_type: WebhookEventType) -> None:
+    request = parse_webhook_lenient(raw_body(event_type))
+
+    restored = pickle.loads(pickle.dumps(request))
+    assert type(restored) is type(request)
+    assert restored == request
+
+
+def test_unpickle_in_a_new_process() -> None:
+    request = parse_webhook_lenient(raw_body(WebhookEventType.APPLICANT))
+    code = (
+        "import pickle, sys; request = pickle.load(sys.stdin.buffer); "
+        "print(type(request).__qualname__, repr(request.event.applicant_log.type))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(request),
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.decode().split() == [
+        "ApplicantHookRequestLenient",
+        "<ApplicantLogType.UNKNOWN:",
+        "'FUTURE_TYPE'>",
+    ]
+
+
+@pytest.mark.parametrize("event_type", PAYLOAD_FACTORIES)
+def test_generated_code_of_lenient_models(event_type: WebhookEventType) -> None:
+    raw = raw_body(event_type)
+    request = parse_webhook_lenient(raw)
+    model = type(request)
+
+    assert construct_trusted(model, raw) == request
+    assert to_record(request) == construct_record(model, raw)
+    assert request.dump_json_fast() == request.model_dump_json(by_alias=True).encode()
+
+
+def test_webhook_app_with_process_pool() -> None:
+    handled: List[Any] = []
+
+    async def run() -> None:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            app = WebhookApp(executor=executor, parse=parse_webhook_lenient)
+
+            @app.on()
+            async def handle(request: Any) -> None:
+                handled.append(request)
+
+            body = json.dumps(applicant_hook()).replace('"STATUS"', '"FUTURE_TYPE"').encode()
+            assert (await call_asgi(app, body=body))[0] == 200
+            await app.stop()
+
+    asyncio.run(run())
+    assert len(handled) == 1
+    assert isinstance(handled[0].event.applicant_log.type, UnknownEnumValue)
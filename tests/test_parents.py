@@ -0,0 +1,106 @@
+import copy
+import json
+import pickle
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from benchmarks.payloads import Payload, vacancy, vacancy_hook
+from huntflow_webhook_models.binary import decode_request, encode_request
+from huntflow_webhook_models.parents import ParentChainParser, VacancyParentRef, get_parent
+from huntflow_webhook_models.records import to_record
+from huntflow_webhook_models.serialization import dump_json_fast
+from huntflow_webhook_models.vacancy import VacancyHookRequest
+from huntflow_webhook_models.webhook import parse_webhook
+
+
+def vacancy_body(depth: int, vacancy_id: int = 1) -> bytes:
+    parent = None
+    for level in range(depth):
+        parent = {**vacancy(100 + level), "parent": parent}
+    payload = vacancy_hook()
+    payload["event"]["vacancy"].update(id=vacancy_id, parent=parent)
+    return json.dumps(payload).encode()
+
+
+def parent_ids(payload: Payload) -> List[int]:
+    ids = []
+    parent = payload["event"]["vacancy"]["parent"]
+    while parent:
+        ids.append(parent["id"])
+        parent = parent["parent"]
+    return ids
+
+
+def test_vacancy_parent_ref_copy_and_pickle() -> None:
+    ref = VacancyParentRef(vacancy(2))
+
+    for restored in (copy.copy(ref), copy.deepcopy(ref), pickle.loads(pickle.dumps(ref))):
+        assert isinstance(restored, VacancyParentRef)
+        assert restored.id == 2
+        assert restored.raw == ref.raw
+        assert restored.position == ref.position
+
+
+def test_vacancy_parent_ref_does_not_delegate_private_names() -> None:
+    ref = VacancyParentRef(vacancy(2))
+
+    with pytest.raises(AttributeError):
+        ref._private  # noqa: B018
+    assert not hasattr(ref, "__missing_special__")
+
+
+@pytest.mark.parametrize("as_reference", [False, True])
+def test_invalid_json_raises_validation_error(as_reference: bool) -> None:
+    parser = ParentChainParser(1, as_reference=as_reference)
+
+    with pytest.raises(ValidationError):
+        parser.parse(b'{"meta": ')
+    assert parser.parse(json.dumps(vacancy_hook())).meta.event_id
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        ParentChainParser(2),
+        ParentChainParser(2, cache_size=10),
+        ParentChainParser(2, as_reference=True),
+    ],
+)
+def test_parsed_requests_are_serialized(parser: ParentChainParser) -> None:
+    request = parser.parse(vacancy_body(depth=4))
+    expected = [] if parser.as_reference else [103, 102]
+
+    assert parent_ids(json.loads(dump_json_fast(request))) == expected
+    assert parent_ids(request.model_dump()) == expected
+    assert decode_request(encode_request(request)).model_dump() == request.model_dump()
+    assert to_record(request)
+
+
+def test_parents_as_references() -> None:
+    request = ParentChainParser(1, as_reference=True).parse(vacancy_body(depth=3))
+    assert isinstance(request, VacancyHookRequest)
+    vacancy = request.event.vacancy
+
+    assert vacancy.parent is None
+    ref = get_parent(vacancy)
+    assert isinstance(ref, VacancyParentRef)
+    assert ref.id == 102
+    assert ref.raw["parent"] is None
+    restored = pickle.loads(pickle.dumps(request))
+    assert isinstance(restored, VacancyHookRequest)
+    restored_ref = get_parent(restored.event.vacancy)
+    assert isinstance(restored_ref, VacancyParentRef)
+    assert restored_ref.vacancy == ref.vacancy
+
+
+def test_cached_parents_are_shared() -> None:
+    parser = ParentChainParser(cache_size=10)
+    first, second = (parser.parse(vacancy_body(depth=3, vacancy_id=index)) for index in (1, 2))
+    assert isinstance(first, VacancyHookRequest)
+    assert isinstance(second, VacancyHookRequest)
+
+    assert first.event.vacancy.parent is second.event.vacancy.parent
+    assert parser.stats.hits == 1
+    assert first == parse_webhook(vacancy_body(depth=3))
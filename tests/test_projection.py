@@ -0,0 +1,41 @@
+import json
+import pickle
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.common_models.applicant import ApplicantLog
+from huntflow_webhook_models.projection import project
+
+BODY = json.dumps(applicant_hook())
+
+
+def test_pickle_round_trip() -> None:
+    model = project(ApplicantHookRequest, ["meta.event_id", "event.applicant_log"])
+    request = model.model_validate_json(BODY)
+
+    assert pickle.loads(pickle.dumps(request)) == request
+
+
+def test_projections_get_own_names() -> None:
+    first = project(ApplicantHookRequest, ["meta.event_id"])
+    second = project(ApplicantHookRequest, ["meta.event_type"])
+
+    assert first.__name__ != second.__name__
+    assert project(ApplicantHookRequest, ["meta.event_id"]) is first
+
+
+def test_fields_keep_the_order_of_the_model() -> None:
+    fields = ["type", "id", "created"]
+    model = project(ApplicantLog, fields)
+
+    assert list(model.model_fields) == [
+        name for name in ApplicantLog.model_fields if name in fields
+    ]
+    assert project(ApplicantLog, reversed(fields)) is model
+
+
+def test_whole_fields_replace_the_paths_under_them() -> None:
+    model = project(ApplicantHookRequest, ["meta.event_id", "meta"])
+    meta = model.model_validate_json(BODY).meta  # type: ignore[attr-defined]
+
+    assert meta == ApplicantHookRequest.model_validate_json(BODY).meta
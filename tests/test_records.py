@@ -0,0 +1,23 @@
+import json
+import pickle
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.records import parse_record, to_record
+
+
+def test_records_with_dicts_and_lists_are_hashable() -> None:
+    raw = json.dumps(applicant_hook()).encode()
+    record = parse_record(ApplicantHookRequest, raw)
+    same = to_record(ApplicantHookRequest.model_validate_json(raw))
+
+    assert record == same
+    assert hash(record) == hash(same)
+    assert {record, same} == {record}
+    assert {record: 1}[same] == 1
+
+
+def test_record_pickle_round_trip() -> None:
+    record = parse_record(ApplicantHookRequest, json.dumps(applicant_hook()))
+
+    assert pickle.loads(pickle.dumps(record)) == record
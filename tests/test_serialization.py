@@ -0,0 +1,54 @@
+import json
+from typing import Any, Callable, Dict
+
+import pytest
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, PAYLOAD_SIZES, Payload
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.json_backend import (
+    get_json_backend,
+    set_json_backend,
+)
+from huntflow_webhook_models.serialization import dump_json_fast
+from huntflow_webhook_models.webhook import parse_webhook
+
+
+def utc(payload: Payload) -> Payload:
+    return json.loads(json.dumps(payload).replace("+03:00", "Z"))
+
+
+def big_values(payload: Any) -> Any:
+    """The payload with an integer above 64 bits in each ``values`` dict."""
+    if isinstance(payload, list):
+        return [big_values(item) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+    result = {key: big_values(value) for key, value in payload.items()}
+    if isinstance(result.get("values"), dict):
+        result["values"]["big"] = 2**70
+    return result
+
+
+VARIANTS: Dict[str, Callable[[Payload], Payload]] = {
+    "as is": lambda payload: payload,
+    "utc": utc,
+    "big ints": big_values,
+}
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("event_type", PAYLOAD_FACTORIES)
+def test_dump_json_fast_parity(
+    event_type: WebhookEventType,
+    size: str,
+    variant: str,
+) -> None:
+    payload = VARIANTS[variant](PAYLOAD_SIZES[size](PAYLOAD_FACTORIES[event_type]()))
+    request = parse_webhook(json.dumps(payload))
+    previous = get_json_backend()
+    set_json_backend("orjson")
+    try:
+        assert dump_json_fast(request) == request.model_dump_json(by_alias=True).encode()
+    finally:
+        set_json_backend(previous)
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from typing import Any, List
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.server import Message, WebhookApp, call_asgi
+from huntflow_webhook_models.webhook import HookRequest, parse_webhook
+
+BODY = json.dumps(applicant_hook()).encode()
+
+
+def test_worker_survives_parse_errors() -> None:
+    handled: List[HookRequest] = []
+
+    def parse(raw: bytes) -> Any:
+        if raw == b"boom":
+            raise ValueError("boom")
+        return parse_webhook(raw)
+
+    async def run() -> WebhookApp:
+        app = WebhookApp(workers=1, parse=parse)
+
+        @app.on()
+        async def handle(request: HookRequest) -> None:
+            handled.append(request)
+
+        assert (await call_asgi(app, body=b"boom"))[0] == 200
+        assert (await call_asgi(app, body=BODY))[0] == 200
+        await app.stop()
+        return app
+
+    stats = asyncio.run(run()).stats
+    assert stats.parse_errors == 1
+    assert stats.handled == 1
+    assert len(handled) == 1
+
+
+def test_disconnected_request_is_dropped() -> None:
+    sent: List[Message] = []
+    messages: List[Message] = [
+        {"type": "http.disconnect"},
+        {"type": "http.request", "body": BODY[:10], "more_body": True},
+    ]
+
+    async def receive() -> Message:
+        return messages.pop()
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async def run() -> WebhookApp:
+        app = WebhookApp()
+        await app({"type": "http", "method": "POST", "path": "/"}, receive, send)
+        await app.stop()
+        return app
+
+    stats = asyncio.run(run()).stats
+    assert sent == []
+    assert stats.received == 0
+    assert stats.disconnected == 1
+
+
+def test_only_the_webhook_path_is_routed() -> None:
+    async def run() -> WebhookApp:
+        app = WebhookApp(path="/hooks")
+        assert (await call_asgi(app, path="/"))[0] == 404
+        assert (await call_asgi(app, path="/other", body=BODY))[0] == 404
+        assert (await call_asgi(app, path="/metrics", body=BODY))[0] == 405
+        assert (await call_asgi(app, method="GET", path="/hooks"))[0] == 405
+        assert (await call_asgi(app, path="/hooks", body=BODY))[0] == 200
+        await app.stop()
+        return app
+
+    assert asyncio.run(run()).stats.received == 1
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import multiprocessing
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, List
+
+import pytest
+from pydantic import ValidationError
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.common_models.applicant import ApplicantLog
+from huntflow_webhook_models.consts import WebhookEventType
+from huntflow_webhook_models.lenient import parse_webhook_lenient
+from huntflow_webhook_models.records import construct_record, to_record
+from huntflow_webhook_models.server import WebhookApp, call_asgi
+from huntflow_webhook_models.timestamps import (
+    TimestampMode,
+    parse_webhook_timestamps,
+    timestamp_model,
+    to_epoch_microseconds,
+    to_utc_datetime,
+)
+from huntflow_webhook_models.trusted import construct_trusted
+
+MODES = [TimestampMode.EPOCH, TimestampMode.UTC]
+CREATED = datetime(2023, 1, 1, 7, tzinfo=timezone.utc)
+
+
+def applicant_body(created: Any) -> bytes:
+    payload = applicant_hook()
+    payload["event"]["applicant_log"]["created"] = created
+    return json.dumps(payload).encode()
+
+
+@pytest.mark.parametrize("created", [1672556400, 1672556400000, "2023-01-01T10:00:00+03:00"])
+@pytest.mark.parametrize("mode", list(TimestampMode))
+def test_modes_keep_the_instant(created: Any, mode: TimestampMode) -> None:
+    request = parse_webhook_timestamps(applicant_body(created), mode)
+
+    assert isinstance(request, ApplicantHookRequest)
+    log = request.event.applicant_log
+    if mode is TimestampMode.DATETIME:
+        assert log.created == CREATED
+    else:
+        assert log.get_datetime("created") == CREATED  # type: ignore[attr-defined]
+
+
+def test_numbers_are_seconds_or_milliseconds() -> None:
+    microseconds = int(CREATED.timestamp()) * 1_000_000
+
+    assert to_epoch_microseconds(1672556400) == microseconds
+    assert to_epoch_microseconds(1672556400000) == microseconds
+    assert to_utc_datetime(1672556400) == CREATED.replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("offset", ["+99:99", "+24:00", "-12:60", "+1a:00"])
+@pytest.mark.parametrize("mode", MODES)
+def test_invalid_offsets_are_rejected(offset: str, mode: TimestampMode) -> None:
+    value = f"2023-01-01T10:00:00{offset}"
+
+    with pytest.raises(ValueError):
+        to_utc_datetime(value)
+    with pytest.raises(ValidationError):
+        parse_webhook_timestamps(applicant_body(value), mode)
+
+
+def test_modes_derive_models_of_different_names() -> None:
+    epoch = timestamp_model(ApplicantHookRequest, TimestampMode.EPOCH)
+    utc = timestamp_model(ApplicantHookRequest, TimestampMode.UTC)
+
+    assert epoch.__qualname__ == "ApplicantHookRequestEpochTimestamps"
+    assert utc.__qualname__ == "ApplicantHookRequestUTCTimestamps"
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("event_type", PAYLOAD_FACTORIES)
+def test_pickle_round_trip(event_type: WebhookEventType, mode: TimestampMode) -> None:
+    request = parse_webhook_timestamps(json.dumps(PAYLOAD_FACTORIES[event_type]()), mode)
+
+    restored = pickle.loads(pickle.dumps(request))
+    assert type(restored) is type(request)
+    assert restored == request
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_unpickle_in_a_new_process(mode: TimestampMode) -> None:
+    request = parse_webhook_timestamps(applicant_body(1672556400), mode)
+    code = (
+        "import pickle, sys; request = pickle.load(sys.stdin.buffer); "
+        "print(request.event.applicant_log.get_datetime('created').isoformat())"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(request),
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.decode().strip() == CREATED.isoformat()
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("event_type", PAYLOAD_FACTORIES)
+def test_generated_code_of_timestamp_models(
+    event_type: WebhookEventType,
+    mode: TimestampMode,
+) -> None:
+    raw = json.dumps(PAYLOAD_FACTORIES[event_type]())
+    request = parse_webhook_timestamps(raw, mode)
+    model = type(request)
+
+    assert construct_trusted(model, raw) == request
+    assert to_record(request) == construct_record(model, raw)
+    assert request.dump_json_fast() == request.model_dump_json(by_alias=True).encode()
+
+
+def test_webhook_app_with_process_pool() -> None:
+    handled: List[Any] = []
+
+    async def run() -> None:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            app = WebhookApp(executor=executor, parse=parse_webhook_timestamps)
+
+            @app.on()
+            async def handle(request: Any) -> None:
+                handled.append(request)
+
+            assert (await call_asgi(app, body=applicant_body(1672556400)))[0] == 200
+            await app.stop()
+
+    asyncio.run(run())
+    assert len(handled) == 1
+    assert handled[0].event.applicant_log.get_datetime("created") == CREATED
+
+
+def test_derived_models_keep_the_models_intact() -> None:
+    parse_webhook_timestamps(applicant_body(CREATED.isoformat()), TimestampMode.EPOCH)
+
+    request = parse_webhook_lenient(applicant_body(CREATED.isoformat()))
+
+    assert ApplicantLog.model_fields["created"].metadata == []
+    assert isinstance(request, ApplicantHookRequest)
+    assert request.event.applicant_log.created == CREATED
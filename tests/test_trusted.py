@@ -0,0 +1,45 @@
+import json
+from typing import Any
+
+import pytest
+import typing_extensions
+
+from benchmarks.payloads import PAYLOAD_FACTORIES, vacancy
+from huntflow_webhook_models import _codegen, trusted
+from huntflow_webhook_models.common_models.vacancy import Vacancy
+from huntflow_webhook_models.webhook import HOOK_REQUEST_MODELS
+
+
+@pytest.mark.parametrize("event_type", list(PAYLOAD_FACTORIES))
+def test_construct_trusted_equals_validated(event_type: Any) -> None:
+    model = HOOK_REQUEST_MODELS[event_type]
+    raw = json.dumps(PAYLOAD_FACTORIES[event_type]()).encode()
+
+    assert model.construct_trusted(raw) == model.model_validate_json(raw)
+
+
+def test_construct_trusted_rejects_dicts() -> None:
+    model = next(iter(HOOK_REQUEST_MODELS.values()))
+
+    with pytest.raises(TypeError):
+        trusted.construct_trusted(model, {})  # type: ignore[arg-type]
+
+
+def test_failed_compilation_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiler = _codegen.ConstructorCompiler()
+    calls = []
+
+    def failing_once(model: Any, **kwargs: Any) -> Any:
+        calls.append(model)
+        if len(calls) == 2:
+            raise NameError("name 'Unresolved' is not defined")
+        return typing_extensions.get_type_hints(model, **kwargs)
+
+    monkeypatch.setattr(_codegen, "get_type_hints", failing_once)
+    with pytest.raises(NameError):
+        compiler.constructor(Vacancy)
+    assert compiler.constructors == {}
+
+    data = json.loads(json.dumps(vacancy()))
+
+    assert compiler.constructor(Vacancy)(data) == Vacancy.model_validate(data)
@@ -0,0 +1,29 @@
+import json
+from typing import Any, Dict
+
+from benchmarks.payloads import applicant_hook
+from huntflow_webhook_models.applicant import ApplicantHookRequest
+from huntflow_webhook_models.values import ValuesSchemaRegistry
+
+
+def applicant_body(values: Dict[str, Any]) -> bytes:
+    payload = applicant_hook()
+    payload["event"]["applicant"]["values"] = values
+    return json.dumps(payload).encode()
+
+
+def test_schema_changed_in_place_is_recompiled() -> None:
+    account_id = applicant_hook()["meta"]["account"]["id"]
+    schema: Dict[str, Dict[str, Any]] = {"salary": {"type": "string"}}
+    registry = ValuesSchemaRegistry()
+    registry.register(account_id, "applicant", schema)
+    request = registry.parse(applicant_body({"salary": "100"}))
+    assert isinstance(request, ApplicantHookRequest)
+    assert request.event.applicant.values == {"salary": "100"}
+
+    schema["salary"]["type"] = "income"
+    registry.register(account_id, "applicant", schema)
+
+    request = registry.parse(applicant_body({"salary": "100"}))
+    assert isinstance(request, ApplicantHookRequest)
+    assert request.event.applicant.values == {"salary": 100}